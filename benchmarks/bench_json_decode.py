@@ -0,0 +1,93 @@
+"""Benchmark decoding of API response bodies.
+
+Compares the standard library json module with orjson, which the API client
+uses when it is installed, on synthetic stocks and aviation bodies.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_json_decode
+"""
+from __future__ import annotations
+
+import json
+import timeit
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SYMBOLS = 1000
+NUMBER = 100
+ROUNDS = 5
+
+
+def _stocks(size: int) -> list[dict[str, Any]]:
+    """Return a synthetic stocks payload."""
+    return [
+        {
+            "symbol": f"SYM{i:04d}",
+            "name": f"Company {i}",
+            "quantity": i + 1,
+            "price": 100.0 + i,
+            "value": (100.0 + i) * (i + 1),
+        }
+        for i in range(size)
+    ]
+
+
+def _aviation() -> dict[str, Any]:
+    """Return a synthetic aviation payload."""
+    return {
+        "weather": {
+            "oat": 15.5,
+            "valid": True,
+            "timestamp": 1704067200,
+            "age": 120,
+            "alt": 1575,
+            "cloud_base": 3500,
+            "da": 2100,
+            "dew": 8.0,
+            "gust_kmh": 25.0,
+            "gust_kt": 13.5,
+            "hpa": 1013.25,
+            "humidity": 65.0,
+            "pa": 1650,
+            "rain_rate_mm": 0.0,
+            "spread": 7.5,
+            "wind_dir": 270,
+            "wind_kmh": 15.0,
+            "wind_kt": 8.1,
+        },
+        "runway": {"status": 1, "altitude": 1575, "additional": None, "text": "Runway open"},
+    }
+
+
+def _best(decode: Any, body: bytes) -> float:
+    """Return the best time of one decode, in microseconds."""
+    return min(timeit.repeat(lambda: decode(body), number=NUMBER, repeat=ROUNDS)) / NUMBER * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    bodies = {
+        f"stocks ({SYMBOLS} symbols)": json.dumps(_stocks(SYMBOLS)).encode(),
+        "aviation": json.dumps(_aviation()).encode(),
+    }
+
+    print(f"Best of {ROUNDS} rounds of {NUMBER} decodes")
+    for name, body in bodies.items():
+        stdlib = _best(json.loads, body)
+        print(f"{name}, {len(body)} bytes")
+        print(f"  json:   {stdlib:10.1f} us")
+        if orjson is None:
+            print("  orjson: not installed")
+            continue
+        fast = _best(orjson.loads, body)
+        print(f"  orjson: {fast:10.1f} us")
+        print(f"  speedup: {stdlib / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark stock sensor lookups for a large portfolio.
+
+Compares the former linear scan over the stocks list with the symbol index
+built by the stocks coordinator, for one update cycle in which every stock
+sensor reads its state and attributes.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_stock_index
+"""
+from __future__ import annotations
+
+from datetime import timedelta
+import timeit
+from typing import Any
+from unittest.mock import MagicMock
+
+from custom_components.fiftyone.coordinator import FiftyOneStocksCoordinator
+from custom_components.fiftyone.models import parse_stocks
+from custom_components.fiftyone.sensor import STOCK_SENSORS, FiftyOneStockSensor
+
+SYMBOLS = 1000
+ROUNDS = 5
+
+
+def _portfolio(size: int) -> list[dict[str, Any]]:
+    """Return a synthetic portfolio."""
+    return [
+        {
+            "symbol": f"SYM{i:04d}",
+            "name": f"Company {i}",
+            "quantity": i + 1,
+            "price": 100.0 + i,
+            "value": (100.0 + i) * (i + 1),
+        }
+        for i in range(size)
+    ]
+
+
+def _linear_cycle(stocks: list[dict[str, Any]], symbols: list[str]) -> None:
+    """Look up every sensor's quote the way the sensors used to."""
+    for symbol in symbols:
+        # Three sensors per symbol, native_value and attributes on two of them
+        for _ in range(5):
+            next((s for s in stocks if s.get("symbol") == symbol), {})
+
+
+def main() -> None:
+    """Run the benchmark."""
+    stocks = _portfolio(SYMBOLS)
+    symbols = [stock["symbol"] for stock in stocks]
+
+    coordinator = FiftyOneStocksCoordinator(MagicMock(), MagicMock(), timedelta(minutes=5))
+    entry = MagicMock()
+    entry.entry_id = "bench"
+    sensors = [
+        FiftyOneStockSensor(coordinator, entry, symbol, description)
+        for symbol in symbols
+        for description in STOCK_SENSORS
+    ]
+
+    def indexed_cycle() -> None:
+        # A refresh parses a new payload into the symbol index
+        coordinator.data = parse_stocks(stocks)
+        for sensor in sensors:
+            _ = sensor.native_value
+            if sensor.entity_description.attr_fn is not None:
+                _ = sensor.extra_state_attributes
+
+    linear = min(timeit.repeat(lambda: _linear_cycle(stocks, symbols), number=1, repeat=ROUNDS))
+    indexed = min(timeit.repeat(indexed_cycle, number=1, repeat=ROUNDS))
+
+    print(f"{SYMBOLS} symbols, {len(sensors)} sensors, best of {ROUNDS} update cycles")
+    print(f"  linear scan lookups: {linear * 1000:9.2f} ms")
+    print(f"  indexed sensor reads: {indexed * 1000:8.2f} ms")
+    print(f"  speedup: {linear / indexed:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,222 @@
 """The FiftyOne integration."""
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
-from .coordinator import FiftyOneDataUpdateCoordinator
-from .api import FiftyOneApiClient
+from .const import (
+    CONF_AVIATION_INTERVAL,
+    CONF_AVIATION_MAX_INTERVAL,
+    CONF_AVIATION_MIN_INTERVAL,
+    CONF_DEDICATED_SESSION,
+    CONF_FRAME_MAX_AGE,
+    CONF_MARKET_HOLIDAYS,
+    CONF_PREFETCH_FRAMES,
+    CONF_OILPRICE_INTERVAL,
+    CONF_STOCKS_CLOSED_INTERVAL,
+    CONF_STOCKS_INTERVAL,
+    CONF_WEBCAMS_INTERVAL,
+    DEFAULT_AVIATION_INTERVAL,
+    DEFAULT_AVIATION_MAX_INTERVAL,
+    DEFAULT_AVIATION_MIN_INTERVAL,
+    DEFAULT_DEDICATED_SESSION,
+    DEFAULT_FRAME_MAX_AGE,
+    DEFAULT_PREFETCH_FRAMES,
+    DEFAULT_OILPRICE_INTERVAL,
+    DEFAULT_STOCKS_CLOSED_INTERVAL,
+    DEFAULT_STOCKS_INTERVAL,
+    DEFAULT_WEBCAMS_INTERVAL,
+    DOMAIN,
+    FRAME_CACHE_MAX_BYTES,
+    MIN_SCAN_INTERVAL,
+    PREFETCH_CONCURRENCY,
+)
+from .coordinator import (
+    FiftyOneAviationCoordinator,
+    FiftyOneData,
+    FiftyOneOilPriceCoordinator,
+    FiftyOneStocksCoordinator,
+    FiftyOneWebcamsCoordinator,
+)
+from .api import PRIORITY_BACKGROUND, FiftyOneApiClient
+from .cache import FiftyOneFrameCache
+from .scheduler import FiftyOneAviationSchedule, FiftyOneStocksSchedule, parse_holidays
+from .session import FiftyOneConnectionStats, async_create_session
+from .snapshot import FiftyOneSnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS_LIST: list[Platform] = [Platform.SENSOR, Platform.CAMERA, Platform.IMAGE]
 
 
+def _interval(entry: ConfigEntry, key: str, default: int) -> timedelta:
+    """Return the configured update interval for an endpoint."""
+    return timedelta(seconds=entry.options.get(key, default))
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up FiftyOne from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
+    connection_stats: FiftyOneConnectionStats | None = None
+    if entry.options.get(CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION):
+        connection_stats = FiftyOneConnectionStats()
+        session = async_create_session(connection_stats)
+        entry.async_on_unload(session.close)
+    else:
+        session = async_get_clientsession(hass)
+
     api_client = FiftyOneApiClient(
-        session=async_get_clientsession(hass),
+        session=session,
         api_url=entry.data.get("api_url"),
     )
 
-    coordinator = FiftyOneDataUpdateCoordinator(
-        hass=hass,
+    snapshot = FiftyOneSnapshotStore(hass, entry.entry_id)
+    stocks_interval = _interval(entry, CONF_STOCKS_INTERVAL, DEFAULT_STOCKS_INTERVAL)
+    aviation_interval = _interval(entry, CONF_AVIATION_INTERVAL, DEFAULT_AVIATION_INTERVAL)
+
+    data = FiftyOneData(
         api_client=api_client,
+        snapshot=snapshot,
+        stocks=FiftyOneStocksCoordinator(
+            hass,
+            api_client,
+            stocks_interval,
+            snapshot,
+            FiftyOneStocksSchedule(
+                MIN_SCAN_INTERVAL,
+                stocks_interval.total_seconds(),
+                entry.options.get(
+                    CONF_STOCKS_CLOSED_INTERVAL, DEFAULT_STOCKS_CLOSED_INTERVAL
+                ),
+                parse_holidays(entry.options.get(CONF_MARKET_HOLIDAYS, [])),
+            ),
+        ),
+        webcams=FiftyOneWebcamsCoordinator(
+            hass,
+            api_client,
+            _interval(entry, CONF_WEBCAMS_INTERVAL, DEFAULT_WEBCAMS_INTERVAL),
+            snapshot,
+        ),
+        oilprice=FiftyOneOilPriceCoordinator(
+            hass,
+            api_client,
+            _interval(entry, CONF_OILPRICE_INTERVAL, DEFAULT_OILPRICE_INTERVAL),
+            snapshot,
+        ),
+        aviation=FiftyOneAviationCoordinator(
+            hass,
+            api_client,
+            aviation_interval,
+            snapshot,
+            FiftyOneAviationSchedule(
+                entry.options.get(CONF_AVIATION_MIN_INTERVAL, DEFAULT_AVIATION_MIN_INTERVAL),
+                entry.options.get(CONF_AVIATION_MAX_INTERVAL, DEFAULT_AVIATION_MAX_INTERVAL),
+                aviation_interval.total_seconds(),
+            ),
+        ),
+        frames=FiftyOneFrameCache(
+            FRAME_CACHE_MAX_BYTES,
+            entry.options.get(CONF_FRAME_MAX_AGE, DEFAULT_FRAME_MAX_AGE),
+        ),
+        connection_stats=connection_stats,
     )
 
-    await coordinator.async_config_entry_first_refresh()
-
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    # Seed the coordinators from the last persisted payloads so startup does
+    # not wait on the API. Payloads past their max age are dropped and their
+    # endpoints refreshed in the background like the others; setup only
+    # blocks on the API when nothing was persisted yet, as on a first install
+    persisted = await snapshot.async_load()
+    for coordinator in data.coordinators:
+        if coordinator.endpoint in persisted:
+            coordinator.async_seed(
+                persisted[coordinator.endpoint]["payload"],
+                persisted[coordinator.endpoint]["fetched_at"],
+            )
+
+    background = data.coordinators
+    if not persisted:
+        # Refresh all endpoints concurrently; a failing endpoint only leaves
+        # its own entities unavailable and is retried on its own schedule,
+        # but setup is retried when none of them could be fetched
+        await asyncio.gather(*(coordinator.async_refresh() for coordinator in background))
+        if not any(coordinator.last_update_success for coordinator in background):
+            raise ConfigEntryNotReady("Failed to fetch any FiftyOne endpoint")
+        background = ()
+
+    hass.data[DOMAIN][entry.entry_id] = data
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS_LIST)
 
+    if entry.options.get(CONF_PREFETCH_FRAMES, DEFAULT_PREFETCH_FRAMES):
+        _async_setup_frame_prefetch(hass, entry, data)
+
+    for coordinator in background:
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN} {coordinator.endpoint} startup refresh",
+        )
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
+@callback
+def _async_setup_frame_prefetch(
+    hass: HomeAssistant, entry: ConfigEntry, data: FiftyOneData
+) -> None:
+    """Download webcam frames into the frame cache whenever the URLs change.
+
+    Prefetched frames are kept until the next webcams update brings new URLs,
+    so they are still cached when a webcam card is opened.
+    """
+    max_age = _interval(entry, CONF_WEBCAMS_INTERVAL, DEFAULT_WEBCAMS_INTERVAL).total_seconds()
+
+    @callback
+    def _async_prefetch() -> None:
+        if data.webcams.data is None:
+            return
+        entry.async_create_background_task(
+            hass,
+            data.frames.async_prefetch(
+                list(data.webcams.data.urls.values()),
+                lambda url: data.api_client.async_get_webcam_image(
+                    url, priority=PRIORITY_BACKGROUND
+                ),
+                PREFETCH_CONCURRENCY,
+                max_age,
+            ),
+            f"{DOMAIN} webcam frame prefetch",
+        )
+
+    # The webcams coordinator only notifies listeners without a context when
+    # its data changed
+    entry.async_on_unload(data.webcams.async_add_listener(_async_prefetch))
+    _async_prefetch()
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS_LIST):
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted snapshot when a config entry is removed."""
+    await FiftyOneSnapshotStore(hass, entry.entry_id).async_remove()
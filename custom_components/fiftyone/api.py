@@ -1,20 +1,237 @@
 """API client for FiftyOne."""
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+import heapq
+import itertools
+import json
 import logging
-from typing import Any
+import random
+import time
+from typing import Any, TypeVar
 
 import aiohttp
+from aiohttp import hdrs
 
 from .const import API_BASE_URL
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Timeout for image downloads from the image endpoints
+IMAGE_TIMEOUT = aiohttp.ClientTimeout(total=60)
+
+# Retry policy for transient failures
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5  # seconds
+RETRY_MAX_DELAY = 10.0  # seconds
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Image and webcam downloads are not retried once this long has passed since
+# they started, so a viewer waits about as long as for a single attempt
+DOWNLOAD_RETRY_BUDGET = 60.0  # seconds
+
+# Circuit breaker policy per endpoint
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_RESET_TIMEOUT = 60.0  # seconds
+
+# Concurrent image and webcam downloads; queued downloads are started by
+# priority, lowest first
+DOWNLOAD_CONCURRENCY = 4
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+# Largest JSON response body accepted from the API
+MAX_JSON_BYTES = 4 * 1024 * 1024
+
+# Decoder for JSON response bodies, orjson when it is installed
+json_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+
 
 class FiftyOneApiError(Exception):
     """Exception for FiftyOne API errors."""
 
 
+class FiftyOneApiStatusError(FiftyOneApiError):
+    """Exception for unexpected HTTP status codes."""
+
+    def __init__(
+        self, message: str, status: int, retry_after: float | None = None
+    ) -> None:
+        """Initialize the error."""
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class FiftyOneCircuitOpenError(FiftyOneApiError):
+    """Exception raised while the circuit breaker of an endpoint is open."""
+
+
+class FiftyOnePayloadError(FiftyOneApiError):
+    """Exception for response bodies that are too large or not valid JSON."""
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header into a delay in seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _is_retryable(err: FiftyOneApiError) -> bool:
+    """Return whether a failed request is worth retrying."""
+    if isinstance(err, FiftyOneApiStatusError):
+        return err.status in RETRYABLE_STATUSES
+    return not isinstance(err, (FiftyOneCircuitOpenError, FiftyOnePayloadError))
+
+
+class _CircuitBreaker:
+    """Fail fast for an endpoint after repeated failures.
+
+    After the reset timeout requests are let through again, without a
+    single probe request; as the failure count is only reset by a success,
+    the next failure re-opens the breaker straight away.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the breaker in the closed state."""
+        self.failures = 0
+        self.opened_until = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether requests should currently fail fast."""
+        return time.monotonic() < self.opened_until
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failures = 0
+        self.opened_until = 0.0
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        """Count a failure and open the breaker when the threshold is hit."""
+        self.failures += 1
+        now = time.monotonic()
+        if self.failures >= BREAKER_FAILURE_THRESHOLD:
+            self.opened_until = max(self.opened_until, now + BREAKER_RESET_TIMEOUT)
+        if retry_after is not None:
+            self.opened_until = max(self.opened_until, now + retry_after)
+
+
+@dataclass(eq=False)
+class _DownloadTicket:
+    """Place in the download queue shared by identical concurrent downloads.
+
+    The ticket takes the most urgent priority of its callers, and counts
+    the callers still waiting per owner.
+    """
+
+    priority: int
+    owners: Counter[object | None] = field(default_factory=Counter)
+    waiter: asyncio.Future[None] | None = None
+    sequence: int = 0
+
+    @property
+    def waiting_owners(self) -> set[object | None]:
+        """Return the owners with callers still waiting."""
+        return {owner for owner, callers in self.owners.items() if callers > 0}
+
+
+class _DownloadScheduler:
+    """Limit concurrent downloads, handing free slots out by priority."""
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the scheduler."""
+        self.limit = limit
+        self.active = 0
+        self.cancelled = 0
+        # A ticket promoted while queued is pushed again at its new priority,
+        # keeping its place among downloads of that priority; the earlier
+        # entry is skipped as its waiter is done by the time it is popped
+        self._queue: list[tuple[int, int, asyncio.Future[None], _DownloadTicket]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        """Return the number of downloads waiting for a slot."""
+        return len({waiter for _, _, waiter, _ in self._queue if not waiter.done()})
+
+    async def acquire(self, ticket: _DownloadTicket) -> None:
+        """Wait for a download slot."""
+        if self.active < self.limit and not self._queue:
+            self.active += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        ticket.waiter = waiter
+        ticket.sequence = next(self._sequence)
+        heapq.heappush(self._queue, (ticket.priority, ticket.sequence, waiter, ticket))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Pass on a slot that was granted just before the cancellation
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            ticket.waiter = None
+
+    def promote(self, ticket: _DownloadTicket, priority: int) -> None:
+        """Raise the priority of a ticket, moving it up the queue if it waits."""
+        if priority >= ticket.priority:
+            return
+        ticket.priority = priority
+        if (waiter := ticket.waiter) is not None and not waiter.done():
+            heapq.heappush(self._queue, (priority, ticket.sequence, waiter, ticket))
+
+    def release(self) -> None:
+        """Free a download slot and grant it to the next queued download."""
+        self.active -= 1
+        while self._queue:
+            _, _, waiter, _ = heapq.heappop(self._queue)
+            if not waiter.done():
+                waiter.set_result(None)
+                self.active += 1
+                return
+
+    def cancel(self, owner: object) -> int:
+        """Cancel the queued downloads only callers of an owner wait for."""
+        cancelled = 0
+        for _, _, waiter, ticket in self._queue:
+            if not waiter.done() and ticket.waiting_owners == {owner}:
+                waiter.cancel()
+                cancelled += 1
+        self.cancelled += cancelled
+        return cancelled
+
+
+@dataclass
+class _ValidatorEntry:
+    """Validators and decoded payload of the last 200 response for a URL."""
+
+    etag: str | None
+    last_modified: str | None
+    payload: Any
+
+
 class FiftyOneApiClient:
     """API client for FiftyOne."""
 
@@ -22,36 +239,302 @@ class FiftyOneApiClient:
         self,
         session: aiohttp.ClientSession,
         api_url: str | None = None,
+        max_downloads: int = DOWNLOAD_CONCURRENCY,
     ) -> None:
         """Initialize the API client."""
         self._session = session
         self._api_url = api_url or API_BASE_URL
+        # Conditional request validators keyed by URL
+        self._validators: dict[str, _ValidatorEntry] = {}
+        self.validator_hits = 0
+        self.validator_misses = 0
+        # Requests currently in flight, shared by identical concurrent callers
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+        self.coalesced_requests = 0
+        # Circuit breakers keyed by URL without query string
+        self._breakers: dict[str, _CircuitBreaker] = {}
+        self.retries = 0
+        # Slots for image and webcam downloads, and the queue tickets of the
+        # downloads in flight, keyed like the in-flight requests
+        self._downloads = _DownloadScheduler(max_downloads)
+        self._tickets: dict[Hashable, _DownloadTicket] = {}
+
+    @property
+    def validator_stats(self) -> dict[str, int]:
+        """Return counters for the conditional request cache."""
+        return {
+            "entries": len(self._validators),
+            "hits": self.validator_hits,
+            "misses": self.validator_misses,
+        }
+
+    @property
+    def download_stats(self) -> dict[str, int]:
+        """Return counters for the download scheduler."""
+        return {
+            "limit": self._downloads.limit,
+            "active": self._downloads.active,
+            "queued": self._downloads.queued,
+            "cancelled": self._downloads.cancelled,
+        }
+
+    def cancel_downloads(self, owner: object) -> int:
+        """Cancel the downloads of an owner still waiting for a slot.
+
+        Downloads other callers joined keep their place in the queue. Returns
+        the number of cancelled downloads.
+        """
+        return self._downloads.cancel(owner)
+
+    def promote_downloads(self, owner: object, priority: int = PRIORITY_INTERACTIVE) -> None:
+        """Raise the downloads callers of an owner wait for to a priority."""
+        for ticket in self._tickets.values():
+            if owner in ticket.waiting_owners:
+                self._downloads.promote(ticket, priority)
+
+    @staticmethod
+    def _request_key(
+        method: str, url: str, params: Mapping[str, Any] | None = None
+    ) -> Hashable:
+        """Return the key identifying a request for coalescing."""
+        return (method, url, tuple(sorted((params or {}).items())))
+
+    async def _coalesce(
+        self, key: Hashable, factory: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Run a request once and share its result with identical concurrent calls.
+
+        The request runs in its own task so that a cancelled caller does not
+        abort it for everyone else waiting on the same key.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._discard_inflight(key, done))
+        else:
+            self.coalesced_requests += 1
+        return await asyncio.shield(task)
+
+    def _discard_inflight(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        """Forget a finished in-flight request."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._tickets.pop(key, None)
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def open_circuits(self) -> list[str]:
+        """Return the endpoints whose circuit breaker is currently open."""
+        return [url for url, breaker in self._breakers.items() if breaker.is_open]
+
+    def is_circuit_open(self, url: str) -> bool:
+        """Return whether requests to a URL currently fail fast."""
+        breaker = self._breakers.get(url.split("?", 1)[0])
+        return breaker is not None and breaker.is_open
+
+    async def _resilient(
+        self,
+        url: str,
+        factory: Callable[[], Awaitable[_T]],
+        budget: float | None = None,
+    ) -> _T:
+        """Run a request with retries behind the circuit breaker of its endpoint.
+
+        With a ``budget``, no retry starts later than that many seconds after
+        the first attempt.
+        """
+        endpoint = url.split("?", 1)[0]
+        deadline = time.monotonic() + budget if budget is not None else None
+        breaker = self._breakers.setdefault(endpoint, _CircuitBreaker())
+        if breaker.is_open:
+            raise FiftyOneCircuitOpenError(f"Circuit open for {endpoint}")
+
+        attempt = 1
+        while True:
+            try:
+                result = await factory()
+            except FiftyOneApiError as err:
+                if not _is_retryable(err):
+                    raise
+                retry_after = getattr(err, "retry_after", None)
+                delay = self._retry_delay(attempt, retry_after)
+                if (
+                    attempt >= RETRY_ATTEMPTS
+                    or delay is None
+                    or (deadline is not None and time.monotonic() + delay > deadline)
+                ):
+                    breaker.record_failure(retry_after)
+                    raise
+                _LOGGER.debug(
+                    "Retrying %s in %.2fs (attempt %d): %s", endpoint, delay, attempt, err
+                )
+                self.retries += 1
+                attempt += 1
+                await asyncio.sleep(delay)
+            else:
+                breaker.record_success()
+                return result
+
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: float | None) -> float | None:
+        """Return the delay before the next attempt, or None to give up.
+
+        A server supplied Retry-After is honoured as long as it fits the
+        backoff bound; otherwise the exponential delay is jittered.
+        """
+        if retry_after is not None:
+            return retry_after if retry_after <= RETRY_MAX_DELAY else None
+        delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        return random.uniform(delay / 2, delay)
 
     async def _request_json(self, method: str, endpoint: str, **kwargs: Any) -> Any:
         """Make a JSON request to the API."""
         url = f"{self._api_url}{endpoint}"
+        if method != "GET":
+            return await self._fetch_json(method, url, **kwargs)
+
+        key = self._request_key(method, url, kwargs.get("params"))
+        return await self._coalesce(
+            key,
+            lambda: self._resilient(url, lambda: self._fetch_json(method, url, **kwargs)),
+        )
+
+    async def _fetch_json(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Perform a JSON request.
+
+        GET requests are sent conditionally when validators from a previous
+        response are known, and a 304 answer returns the cached payload.
+        """
+        cached = self._validators.get(url) if method == "GET" else None
+
+        if cached is not None:
+            headers = dict(kwargs.pop("headers", None) or {})
+            if cached.etag:
+                headers[hdrs.IF_NONE_MATCH] = cached.etag
+            if cached.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+            kwargs["headers"] = headers
 
         try:
             async with self._session.request(method, url, **kwargs) as response:
+                if response.status == 304 and cached is not None:
+                    self.validator_hits += 1
+                    return cached.payload
                 if response.status != 200:
-                    raise FiftyOneApiError(
-                        f"API request failed with status {response.status}"
+                    raise FiftyOneApiStatusError(
+                        f"API request failed with status {response.status}",
+                        response.status,
+                        _parse_retry_after(response.headers.get(hdrs.RETRY_AFTER)),
                     )
-                return await response.json()
+                payload = await self._read_json(response)
+                if method == "GET":
+                    self.validator_misses += 1
+                    self._store_validators(url, response.headers, payload)
+                return payload
         except aiohttp.ClientError as err:
             raise FiftyOneApiError(f"Error communicating with API: {err}") from err
+        except TimeoutError as err:
+            raise FiftyOneApiError("Timeout communicating with API") from err
+
+    @staticmethod
+    async def _read_json(response: aiohttp.ClientResponse) -> Any:
+        """Read a response body and decode it as JSON.
+
+        The body is decoded from bytes in one pass, without checking the
+        content type or decoding it to text first. Reading stops as soon as
+        the body exceeds the size limit, also when it is sent without a
+        Content-Length.
+        """
+        if (response.content_length or 0) > MAX_JSON_BYTES:
+            raise FiftyOnePayloadError(
+                f"Response of {response.content_length} bytes is too large"
+            )
+        body = bytearray()
+        async for chunk in response.content.iter_any():
+            body += chunk
+            if len(body) > MAX_JSON_BYTES:
+                raise FiftyOnePayloadError(
+                    f"Response of more than {MAX_JSON_BYTES} bytes is too large"
+                )
+        try:
+            return json_loads(body)
+        except ValueError as err:
+            raise FiftyOnePayloadError(f"Invalid JSON in response: {err}") from err
+
+    def _store_validators(self, url: str, headers: Any, payload: Any) -> None:
+        """Remember the validators of a successful response, if it sent any."""
+        etag = headers.get(hdrs.ETAG)
+        last_modified = headers.get(hdrs.LAST_MODIFIED)
+        if etag or last_modified:
+            self._validators[url] = _ValidatorEntry(etag, last_modified, payload)
+        else:
+            self._validators.pop(url, None)
 
-    async def _request_bytes(self, url: str) -> bytes:
-        """Fetch bytes from a URL."""
+    async def _request_bytes(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        timeout: aiohttp.ClientTimeout | None = None,
+        priority: int = PRIORITY_INTERACTIVE,
+        owner: object | None = None,
+    ) -> bytes:
+        """Fetch bytes from a URL, sharing identical in-flight downloads.
+
+        Each attempt waits for a download slot, and retries stop once the
+        retry budget is spent. Identical concurrent calls share one place in
+        the queue, at the most urgent of their priorities.
+        """
+        key = self._request_key("GET", url, params)
+        if (ticket := self._tickets.get(key)) is not None:
+            self._downloads.promote(ticket, priority)
+        else:
+            ticket = self._tickets[key] = _DownloadTicket(priority)
+        ticket.owners[owner] += 1
         try:
-            async with self._session.get(url) as response:
+            return await self._coalesce(
+                key,
+                lambda: self._resilient(
+                    url,
+                    lambda: self._fetch_bytes(url, params, timeout, ticket),
+                    DOWNLOAD_RETRY_BUDGET,
+                ),
+            )
+        finally:
+            ticket.owners[owner] -= 1
+
+    async def _fetch_bytes(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        timeout: aiohttp.ClientTimeout | None,
+        ticket: _DownloadTicket,
+    ) -> bytes:
+        """Perform a GET request in a download slot and return the body."""
+        kwargs: dict[str, Any] = {}
+        if params is not None:
+            kwargs["params"] = params
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        await self._downloads.acquire(ticket)
+        try:
+            async with self._session.get(url, **kwargs) as response:
                 if response.status != 200:
-                    raise FiftyOneApiError(
-                        f"Request failed with status {response.status}"
+                    raise FiftyOneApiStatusError(
+                        f"Request failed with status {response.status}",
+                        response.status,
+                        _parse_retry_after(response.headers.get(hdrs.RETRY_AFTER)),
                     )
                 return await response.read()
         except aiohttp.ClientError as err:
             raise FiftyOneApiError(f"Error fetching data: {err}") from err
+        except TimeoutError as err:
+            raise FiftyOneApiError("Timeout fetching data") from err
+        finally:
+            self._downloads.release()
 
     async def async_get_stocks(self) -> list[dict[str, Any]]:
         """Get stock information.
@@ -67,9 +550,14 @@ class FiftyOneApiClient:
         """
         return await self._request_json("GET", "/webcams")
 
-    async def async_get_webcam_image(self, url: str) -> bytes:
+    async def async_get_webcam_image(
+        self,
+        url: str,
+        priority: int = PRIORITY_INTERACTIVE,
+        owner: object | None = None,
+    ) -> bytes:
         """Fetch webcam image from URL."""
-        return await self._request_bytes(url)
+        return await self._request_bytes(url, priority=priority, owner=owner)
 
     async def async_get_aviation_lszi(self) -> dict[str, Any]:
         """Get aviation data for LSZI.
@@ -79,44 +567,44 @@ class FiftyOneApiClient:
         return await self._request_json("GET", "/aviation/lszi")
 
     async def async_get_latest_image(
-        self, code: str | None = None, max_height: int = 900
+        self,
+        code: str | None = None,
+        max_height: int = 900,
+        priority: int = PRIORITY_INTERACTIVE,
+        owner: object | None = None,
     ) -> bytes:
         """Get latest family image."""
         params = {"max_height": max_height}
         if code:
             params["code"] = code
 
-        url = f"{self._api_url}/image/latest"
-        timeout = aiohttp.ClientTimeout(total=60)
-        try:
-            async with self._session.get(url, params=params, timeout=timeout) as response:
-                if response.status != 200:
-                    raise FiftyOneApiError(
-                        f"Failed to get image with status {response.status}"
-                    )
-                return await response.read()
-        except aiohttp.ClientError as err:
-            raise FiftyOneApiError(f"Error getting image: {err}") from err
+        return await self._request_bytes(
+            f"{self._api_url}/image/latest",
+            params=params,
+            timeout=IMAGE_TIMEOUT,
+            priority=priority,
+            owner=owner,
+        )
 
     async def async_get_random_image(
-        self, code: str | None = None, max_height: int = 900
+        self,
+        code: str | None = None,
+        max_height: int = 900,
+        priority: int = PRIORITY_INTERACTIVE,
+        owner: object | None = None,
     ) -> bytes:
         """Get random family image."""
         params = {"max_height": max_height}
         if code:
             params["code"] = code
 
-        url = f"{self._api_url}/image/random"
-        timeout = aiohttp.ClientTimeout(total=60)
-        try:
-            async with self._session.get(url, params=params, timeout=timeout) as response:
-                if response.status != 200:
-                    raise FiftyOneApiError(
-                        f"Failed to get image with status {response.status}"
-                    )
-                return await response.read()
-        except aiohttp.ClientError as err:
-            raise FiftyOneApiError(f"Error getting image: {err}") from err
+        return await self._request_bytes(
+            f"{self._api_url}/image/random",
+            params=params,
+            timeout=IMAGE_TIMEOUT,
+            priority=priority,
+            owner=owner,
+        )
 
     async def async_get_oilprice(self) -> dict[str, Any]:
         """Get oil price data.
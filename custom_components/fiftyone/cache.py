@@ -0,0 +1,299 @@
+"""Caches of webcam frames and images for FiftyOne."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
+import hashlib
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .api import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def content_hash(image: bytes) -> str:
+    """Return a hash identifying the content of an image."""
+    return hashlib.blake2b(image, digest_size=16).hexdigest()
+
+
+@dataclass(slots=True)
+class _Frame:
+    """A cached frame and until when it is served (monotonic time)."""
+
+    image: bytes
+    expires_at: float
+    # Content hash, computed on first use
+    digest: str | None = None
+
+
+class FiftyOneFrameCache:
+    """LRU cache of webcam frames keyed by URL, bounded by a byte budget.
+
+    A frame is served for up to ``max_age`` seconds after it was fetched,
+    or longer when it was cached with a longer max age of its own.
+    When the cached frames exceed ``max_bytes`` the least recently used ones
+    are evicted. Concurrent misses for the same URL share a single refill.
+
+    Derived frames, such as downscaled copies, may be cached under other
+    hashable keys and share the same budget.
+    """
+
+    def __init__(self, max_bytes: int, max_age: float) -> None:
+        """Initialize the frame cache."""
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._frames: OrderedDict[Hashable, _Frame] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[bytes]] = {}
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.prefetched = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        return {
+            "entries": len(self._frames),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "prefetched": self.prefetched,
+        }
+
+    def get(self, url: str) -> bytes | None:
+        """Return the cached frame of a URL if it is within the max age."""
+        frame = self._frames.get(url)
+        if frame is None or time.monotonic() >= frame.expires_at:
+            return None
+        self._frames.move_to_end(url)
+        return frame.image
+
+    def peek(self, key: Hashable) -> bytes | None:
+        """Return the cached frame of a key regardless of its age."""
+        frame = self._frames.get(key)
+        if frame is None:
+            return None
+        self._frames.move_to_end(key)
+        return frame.image
+
+    def digest(self, key: Hashable, image: bytes) -> str | None:
+        """Return the content hash of a cached frame.
+
+        Returns None unless ``image`` is the frame currently cached for the key.
+        """
+        frame = self._frames.get(key)
+        if frame is None or frame.image is not image:
+            return None
+        if frame.digest is None:
+            frame.digest = content_hash(image)
+        return frame.digest
+
+    def put(self, key: Hashable, image: bytes, max_age: float | None = None) -> None:
+        """Cache a frame, evicting the least recently used frames if needed."""
+        self.discard(key)
+        if len(image) > self.max_bytes:
+            return
+        if max_age is None:
+            max_age = self.max_age
+        self._frames[key] = _Frame(image, time.monotonic() + max_age)
+        self.size += len(image)
+        while self.size > self.max_bytes:
+            _, evicted = self._frames.popitem(last=False)
+            self.size -= len(evicted.image)
+            self.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        """Drop the cached frame of a key."""
+        if (frame := self._frames.pop(key, None)) is not None:
+            self.size -= len(frame.image)
+
+    async def async_get(
+        self,
+        url: str,
+        fetch: Callable[[], Awaitable[bytes]],
+        max_age: float | None = None,
+    ) -> bytes:
+        """Return the frame of a URL, refilling it with ``fetch`` when expired.
+
+        A refilled frame is kept for ``max_age`` seconds, defaulting to the
+        max age of the cache.
+        """
+        if (image := self.get(url)) is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        if (refill := self._inflight.get(url)) is None:
+            refill = asyncio.ensure_future(self._async_refill(url, fetch, max_age))
+            self._inflight[url] = refill
+            refill.add_done_callback(lambda done: self._discard_refill(url, done))
+        # Shield the shared refill so one cancelled caller does not cancel it
+        # for the others
+        return await asyncio.shield(refill)
+
+    def _discard_refill(self, url: str, refill: asyncio.Future[bytes]) -> None:
+        """Forget a finished refill."""
+        if self._inflight.get(url) is refill:
+            del self._inflight[url]
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not refill.cancelled():
+            refill.exception()
+
+    async def async_prefetch(
+        self,
+        urls: Iterable[str],
+        fetch: Callable[[str], Awaitable[bytes]],
+        limit: int,
+        max_age: float | None = None,
+    ) -> None:
+        """Download the frames of several URLs, at most ``limit`` at a time.
+
+        Frames that are still fresh are not downloaded again. Prefetched
+        frames are kept for ``max_age`` seconds, but never for less than the
+        max age of the cache. Failures are logged and left for the next
+        viewer to retry.
+        """
+        semaphore = asyncio.Semaphore(limit)
+        if max_age is None or max_age < self.max_age:
+            max_age = self.max_age
+
+        async def _prefetch(url: str) -> None:
+            async with semaphore:
+                if self.get(url) is not None:
+                    return
+                try:
+                    await self.async_get(url, lambda: fetch(url), max_age)
+                except Exception as err:
+                    _LOGGER.debug("Error prefetching %s: %s", url, err)
+                    return
+                self.prefetched += 1
+
+        await asyncio.gather(*(_prefetch(url) for url in urls))
+
+    async def _async_refill(
+        self,
+        url: str,
+        fetch: Callable[[], Awaitable[bytes]],
+        max_age: float | None,
+    ) -> bytes:
+        """Fetch a frame and cache it."""
+        image = await fetch()
+        self.put(url, image, max_age)
+        return image
+
+
+class FiftyOneImageBuffer:
+    """Queue of images downloaded ahead of use.
+
+    ``async_next`` hands out the oldest buffered image at once and tops the
+    buffer up in the background, one download at a time, until it holds
+    ``size`` images or ``max_bytes`` bytes. Only a caller finding the buffer
+    empty waits, for the next image the background download delivers.
+
+    ``fetch`` takes the priority of the download: background while merely
+    topping up, interactive while a caller waits. A download already in
+    flight when a caller starts waiting is raised with ``promote``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        fetch: Callable[[int], Awaitable[bytes]],
+        size: int,
+        max_bytes: int,
+        promote: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the image buffer."""
+        self._hass = hass
+        self._name = name
+        self._fetch = fetch
+        self._promote = promote
+        self._size = size
+        self._max_bytes = max_bytes
+        self._images: deque[bytes] = deque()
+        self._waiters: deque[asyncio.Future[bytes]] = deque()
+        self._filler: asyncio.Task[None] | None = None
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of buffered images."""
+        return len(self._images)
+
+    async def async_next(self) -> bytes:
+        """Return the next image."""
+        if self._images:
+            image = self._images.popleft()
+            self.size -= len(image)
+            self.hits += 1
+            self.async_fill()
+            return image
+
+        self.misses += 1
+        waiter: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.async_fill()
+        if self._promote is not None:
+            self._promote()
+        try:
+            return await waiter
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    @callback
+    def async_fill(self) -> None:
+        """Start topping the buffer up unless it is already being filled."""
+        if self._filler is None or self._filler.done():
+            self._filler = self._hass.async_create_background_task(
+                self._async_fill(), f"{self._name} fill"
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop filling and drop the buffered images."""
+        if self._filler is not None:
+            self._filler.cancel()
+            self._filler = None
+        for waiter in self._waiters:
+            waiter.cancel()
+        self._waiters.clear()
+        self._images.clear()
+        self.size = 0
+
+    def _is_full(self) -> bool:
+        """Return whether the buffer holds enough images."""
+        return len(self._images) >= self._size or self.size >= self._max_bytes
+
+    async def _async_fill(self) -> None:
+        """Download images until no caller waits and the buffer is full."""
+        while self._waiters or not self._is_full():
+            try:
+                image = await self._fetch(
+                    PRIORITY_INTERACTIVE if self._waiters else PRIORITY_BACKGROUND
+                )
+            except Exception as err:
+                _LOGGER.debug("Error filling %s: %s", self._name, err)
+                while self._waiters:
+                    if not (waiter := self._waiters.popleft()).done():
+                        waiter.set_exception(err)
+                return
+
+            while self._waiters:
+                if not (waiter := self._waiters.popleft()).done():
+                    waiter.set_result(image)
+                    break
+            else:
+                self._images.append(image)
+                self.size += len(image)
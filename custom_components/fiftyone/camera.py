@@ -4,14 +4,20 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from aiohttp import web
+
 from homeassistant.components.camera import Camera
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, DOMAIN, WEBCAM_NAMES
-from .coordinator import FiftyOneDataUpdateCoordinator
+from .api import FiftyOneCircuitOpenError
+from .cache import FiftyOneFrameCache
+from .const import DOMAIN, WEBCAM_NAMES
+from .coordinator import FiftyOneData, FiftyOneWebcamsCoordinator
+from .entity import FiftyOneCoordinatorEntity, async_sync_entities
+from .imaging import resize_image
+from .stream import FiftyOneFrameBroadcaster, async_stream_mjpeg
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,46 +28,57 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up FiftyOne cameras based on a config entry."""
-    coordinator: FiftyOneDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-    entities: list[Camera] = []
-
-    # Add webcam cameras
-    webcams = coordinator.data.get("webcams", {})
-    for webcam_id, url in webcams.items():
-        if url:  # Only add if URL is not None
-            entities.append(FiftyOneWebcam(coordinator, entry, webcam_id, url))
-
-    async_add_entities(entities)
-
-
-class FiftyOneWebcam(CoordinatorEntity[FiftyOneDataUpdateCoordinator], Camera):
+    data: FiftyOneData = hass.data[DOMAIN][entry.entry_id]
+
+    # Add a camera for each webcam with an image, following webcams as they
+    # come and go
+    async_sync_entities(
+        entry,
+        data.webcams,
+        lambda: data.webcams.data.urls,
+        lambda webcam_id: [
+            FiftyOneWebcam(
+                data.webcams,
+                data.frames,
+                entry,
+                webcam_id,
+                data.webcams.data.urls[webcam_id],
+            )
+        ],
+        async_add_entities,
+    )
+
+
+class FiftyOneWebcam(FiftyOneCoordinatorEntity[FiftyOneWebcamsCoordinator], Camera):
     """Representation of a FiftyOne webcam."""
 
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-
     def __init__(
         self,
-        coordinator: FiftyOneDataUpdateCoordinator,
+        coordinator: FiftyOneWebcamsCoordinator,
+        frames: FiftyOneFrameCache,
         entry: ConfigEntry,
         webcam_id: str,
         initial_url: str,
     ) -> None:
         """Initialize the camera."""
-        CoordinatorEntity.__init__(self, coordinator)
+        FiftyOneCoordinatorEntity.__init__(self, coordinator, webcam_id)
         Camera.__init__(self)
 
+        self._frames = frames
         self._webcam_id = webcam_id
         self._attr_unique_id = f"{entry.entry_id}_webcam_{webcam_id}"
         self._attr_name = f"Webcam {WEBCAM_NAMES.get(webcam_id, webcam_id.title())}"
-        self._cached_image: bytes | None = None
+        # URL of the last frame served, kept as a fallback while the current
+        # URL cannot be fetched
+        self._last_url: str | None = None
+        self._broadcaster: FiftyOneFrameBroadcaster | None = None
 
     @property
     def _current_url(self) -> str | None:
         """Get current URL from coordinator data."""
-        webcams = self.coordinator.data.get("webcams", {})
-        return webcams.get(self._webcam_id)
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.urls.get(self._webcam_id)
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
@@ -69,19 +86,73 @@ class FiftyOneWebcam(CoordinatorEntity[FiftyOneDataUpdateCoordinator], Camera):
         """Return the camera image."""
         url = self._current_url
         if not url:
-            return self._cached_image
+            return self._fallback_image()
 
         try:
-            self._cached_image = await self.coordinator.api_client.async_get_webcam_image(url)
-            return self._cached_image
+            image = await self._frames.async_get(
+                url,
+                lambda: self.coordinator.api_client.async_get_webcam_image(url, owner=self),
+            )
+        except FiftyOneCircuitOpenError:
+            return self._fallback_image()
         except Exception as err:
             _LOGGER.error("Error getting webcam image for %s: %s", self._webcam_id, err)
-            return self._cached_image
+            return self._fallback_image()
+
+        self._last_url = url
+        if width is None and height is None:
+            return image
+        return await self._async_resized(url, image, width, height)
+
+    async def _async_resized(
+        self, url: str, image: bytes, width: int | None, height: int | None
+    ) -> bytes:
+        """Return a frame downscaled to the requested size.
+
+        Downscaled frames are cached by URL, size and the content hash of the
+        source frame, so a new frame at the same URL is resized again.
+        """
+        digest = self._frames.digest(url, image)
+        key = (url, width, height, digest)
+        if digest is not None and (resized := self._frames.peek(key)) is not None:
+            return resized
+
+        resized = await self.hass.async_add_executor_job(resize_image, image, width, height)
+        if digest is not None and resized is not image:
+            self._frames.put(key, resized)
+        return resized
+
+    def _fallback_image(self) -> bytes | None:
+        """Return the last frame served, if it is still cached."""
+        if self._last_url is None:
+            return None
+        return self._frames.peek(self._last_url)
+
+    async def handle_async_mjpeg_stream(
+        self, request: web.Request
+    ) -> web.StreamResponse | None:
+        """Stream the webcam as MJPEG.
+
+        All viewers of the webcam share one poller.
+        """
+        if self._broadcaster is None:
+            self._broadcaster = FiftyOneFrameBroadcaster(
+                self.hass, self.entity_id, self.async_camera_image
+            )
+        return await async_stream_mjpeg(request, self._broadcaster)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop streaming and queued downloads when the camera is removed."""
+        await super().async_will_remove_from_hass()
+        if self._broadcaster is not None:
+            self._broadcaster.stop()
+        self.coordinator.api_client.cancel_downloads(self)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         return {
+            **super().extra_state_attributes,
             "webcam_id": self._webcam_id,
             "image_url": self._current_url,
         }
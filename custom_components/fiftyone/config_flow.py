@@ -11,7 +11,45 @@ from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import FiftyOneApiClient
-from .const import API_BASE_URL, CONF_API_URL, CONF_IMAGE_SOURCES, DOMAIN
+from .const import (
+    API_BASE_URL,
+    CONF_API_URL,
+    CONF_AVIATION_INTERVAL,
+    CONF_AVIATION_MAX_INTERVAL,
+    CONF_AVIATION_MIN_INTERVAL,
+    CONF_DEDICATED_SESSION,
+    CONF_FRAME_MAX_AGE,
+    CONF_IMAGE_SOURCES,
+    CONF_MARKET_HOLIDAYS,
+    CONF_OILPRICE_INTERVAL,
+    CONF_PREFETCH_FRAMES,
+    CONF_STOCKS_CLOSED_INTERVAL,
+    CONF_STOCKS_INTERVAL,
+    CONF_WEBCAMS_INTERVAL,
+    DEFAULT_AVIATION_INTERVAL,
+    DEFAULT_AVIATION_MAX_INTERVAL,
+    DEFAULT_AVIATION_MIN_INTERVAL,
+    DEFAULT_DEDICATED_SESSION,
+    DEFAULT_FRAME_MAX_AGE,
+    DEFAULT_OILPRICE_INTERVAL,
+    DEFAULT_PREFETCH_FRAMES,
+    DEFAULT_STOCKS_CLOSED_INTERVAL,
+    DEFAULT_STOCKS_INTERVAL,
+    DEFAULT_WEBCAMS_INTERVAL,
+    DOMAIN,
+    MIN_SCAN_INTERVAL,
+)
+from .scheduler import parse_holidays
+
+# Update interval options with their defaults (seconds)
+INTERVAL_OPTIONS = (
+    (CONF_STOCKS_INTERVAL, DEFAULT_STOCKS_INTERVAL),
+    (CONF_WEBCAMS_INTERVAL, DEFAULT_WEBCAMS_INTERVAL),
+    (CONF_OILPRICE_INTERVAL, DEFAULT_OILPRICE_INTERVAL),
+    (CONF_AVIATION_INTERVAL, DEFAULT_AVIATION_INTERVAL),
+    (CONF_AVIATION_MIN_INTERVAL, DEFAULT_AVIATION_MIN_INTERVAL),
+    (CONF_AVIATION_MAX_INTERVAL, DEFAULT_AVIATION_MAX_INTERVAL),
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -124,6 +162,7 @@ class FiftyOneOptionsFlow(OptionsFlow):
     def __init__(self, config_entry) -> None:
         """Initialize options flow."""
         self._config_entry = config_entry
+        self._options: dict[str, Any] = dict(config_entry.options)
         self._image_sources: list[dict[str, str]] = list(
             config_entry.data.get(CONF_IMAGE_SOURCES, [])
         )
@@ -132,7 +171,124 @@ class FiftyOneOptionsFlow(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage the options."""
-        return await self.async_step_image_sources(user_input)
+        return self.async_show_menu(
+            step_id="init",
+            menu_options=["image_sources", "intervals", "stocks", "webcams", "connection"],
+        )
+
+    async def async_step_intervals(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the update interval of each endpoint."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            if user_input.get(
+                CONF_AVIATION_MIN_INTERVAL, DEFAULT_AVIATION_MIN_INTERVAL
+            ) > user_input.get(CONF_AVIATION_MAX_INTERVAL, DEFAULT_AVIATION_MAX_INTERVAL):
+                errors[CONF_AVIATION_MAX_INTERVAL] = "max_below_min"
+            else:
+                self._options.update(user_input)
+                return self.async_create_entry(title="", data=self._options)
+
+        return self.async_show_form(
+            step_id="intervals",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(key, default=self._options.get(key, default)): vol.All(
+                        vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL)
+                    )
+                    for key, default in INTERVAL_OPTIONS
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_stocks(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the stock market hours options."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                holidays = parse_holidays(user_input.get(CONF_MARKET_HOLIDAYS, ""))
+            except ValueError:
+                errors[CONF_MARKET_HOLIDAYS] = "invalid_holidays"
+            else:
+                self._options.update(user_input)
+                self._options[CONF_MARKET_HOLIDAYS] = [day.isoformat() for day in holidays]
+                return self.async_create_entry(title="", data=self._options)
+
+        return self.async_show_form(
+            step_id="stocks",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_STOCKS_CLOSED_INTERVAL,
+                        default=self._options.get(
+                            CONF_STOCKS_CLOSED_INTERVAL, DEFAULT_STOCKS_CLOSED_INTERVAL
+                        ),
+                    ): vol.All(
+                        vol.Coerce(int),
+                        vol.Any(0, vol.Range(min=MIN_SCAN_INTERVAL)),
+                    ),
+                    vol.Optional(
+                        CONF_MARKET_HOLIDAYS,
+                        default=", ".join(self._options.get(CONF_MARKET_HOLIDAYS, [])),
+                    ): str,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_webcams(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the webcam image options."""
+        if user_input is not None:
+            self._options.update(user_input)
+            return self.async_create_entry(title="", data=self._options)
+
+        return self.async_show_form(
+            step_id="webcams",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_FRAME_MAX_AGE,
+                        default=self._options.get(CONF_FRAME_MAX_AGE, DEFAULT_FRAME_MAX_AGE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_PREFETCH_FRAMES,
+                        default=self._options.get(
+                            CONF_PREFETCH_FRAMES, DEFAULT_PREFETCH_FRAMES
+                        ),
+                    ): bool,
+                }
+            ),
+        )
+
+    async def async_step_connection(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the connection options."""
+        if user_input is not None:
+            self._options.update(user_input)
+            return self.async_create_entry(title="", data=self._options)
+
+        return self.async_show_form(
+            step_id="connection",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_DEDICATED_SESSION,
+                        default=self._options.get(
+                            CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION
+                        ),
+                    ): bool,
+                }
+            ),
+        )
 
     async def async_step_image_sources(
         self, user_input: dict[str, Any] | None = None
@@ -175,7 +331,7 @@ class FiftyOneOptionsFlow(OptionsFlow):
                     data=new_data,
                 )
 
-                return self.async_create_entry(title="", data={})
+                return self.async_create_entry(title="", data=self._options)
 
         # Build schema with current sources for removal
         source_options = {s["code"]: s["name"] for s in self._image_sources}
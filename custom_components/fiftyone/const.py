@@ -11,9 +11,81 @@ PLATFORMS = ["sensor", "camera", "image"]
 # Configuration keys
 CONF_API_URL = "api_url"
 CONF_IMAGE_SOURCES = "image_sources"
+CONF_STOCKS_INTERVAL = "stocks_interval"
+CONF_WEBCAMS_INTERVAL = "webcams_interval"
+CONF_OILPRICE_INTERVAL = "oilprice_interval"
+CONF_AVIATION_INTERVAL = "aviation_interval"
+CONF_AVIATION_MIN_INTERVAL = "aviation_min_interval"
+CONF_AVIATION_MAX_INTERVAL = "aviation_max_interval"
+CONF_STOCKS_CLOSED_INTERVAL = "stocks_closed_interval"
+CONF_MARKET_HOLIDAYS = "market_holidays"
+CONF_FRAME_MAX_AGE = "frame_max_age"
+CONF_PREFETCH_FRAMES = "prefetch_frames"
+CONF_DEDICATED_SESSION = "dedicated_session"
 
 # Update intervals (seconds)
-DEFAULT_SCAN_INTERVAL = 600  # 10 minutes
+DEFAULT_STOCKS_INTERVAL = 300  # 5 minutes
+DEFAULT_WEBCAMS_INTERVAL = 600  # 10 minutes
+DEFAULT_OILPRICE_INTERVAL = 21600  # 6 hours
+DEFAULT_AVIATION_INTERVAL = 60  # 1 minute
+MIN_SCAN_INTERVAL = 30
+
+# Bounds of the adaptive aviation polling, which follows the cadence of the
+# weather observations (seconds)
+DEFAULT_AVIATION_MIN_INTERVAL = 30
+DEFAULT_AVIATION_MAX_INTERVAL = 900  # 15 minutes
+
+# Stocks are polled at the stocks interval while an exchange of the portfolio
+# is open; while all are closed at this interval, 0 meaning only once when the
+# next session opens (seconds)
+DEFAULT_STOCKS_CLOSED_INTERVAL = 0
+
+# How long the last good payload keeps being served while fetches fail (seconds)
+STOCKS_MAX_AGE = 14400  # 4 hours
+WEBCAMS_MAX_AGE = 3600  # 1 hour
+OILPRICE_MAX_AGE = 259200  # 3 days
+AVIATION_MAX_AGE = 1800  # 30 minutes
+
+# How far back the history of each numeric metric reaches for trend sensors
+# (seconds); buffers hold enough samples for this span at the shortest
+# interval the endpoint can be polled at
+STOCKS_HISTORY_SPAN = 90000  # 25 hours, a local day across a DST change
+OILPRICE_HISTORY_SPAN = 86400  # 24 hours
+AVIATION_HISTORY_SPAN = 10800  # 3 hours
+
+# Persisted snapshot of the last good payload of every endpoint
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 300  # seconds
+
+# Upper bound for a single endpoint fetch within an update cycle (seconds)
+ENDPOINT_TIMEOUT = 30
+
+# Webcam frame cache, shared by all webcams of a config entry
+DEFAULT_FRAME_MAX_AGE = 60  # seconds
+FRAME_CACHE_MAX_BYTES = 16 * 1024 * 1024  # 16 MiB
+DEFAULT_PREFETCH_FRAMES = False
+# Concurrent downloads when prefetching frames after a webcams refresh
+PREFETCH_CONCURRENCY = 2
+
+# Quality of webcam frames downscaled for thumbnails
+JPEG_QUALITY = 80
+
+# Random images downloaded ahead of rotation, per image source
+RANDOM_IMAGE_BUFFER_SIZE = 3
+RANDOM_IMAGE_BUFFER_MAX_BYTES = 8 * 1024 * 1024  # 8 MiB
+
+# MJPEG streams: how often a streamed webcam is polled (seconds) and how many
+# frames a slow viewer may fall behind before frames are dropped
+STREAM_INTERVAL = 10
+STREAM_QUEUE_SIZE = 2
+
+# Optional connection pool of the config entry, instead of the one shared by
+# all integrations; keep-alive outlasts the shortest update interval
+DEFAULT_DEDICATED_SESSION = False
+SESSION_LIMIT = 20
+SESSION_LIMIT_PER_HOST = 6
+SESSION_DNS_CACHE_TTL = 300  # seconds
+SESSION_KEEPALIVE_TIMEOUT = 75  # seconds
 
 # Attribution
 ATTRIBUTION = "Data provided by FiftyOne API"
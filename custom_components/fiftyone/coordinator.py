@@ -1,78 +1,441 @@
-"""Data update coordinator for FiftyOne."""
+"""Data update coordinators for FiftyOne."""
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
+from collections.abc import Hashable
+from dataclasses import dataclass, field, fields
 from datetime import timedelta
 import logging
-from typing import Any
+import time
+from typing import Any, TypeVar
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api import FiftyOneApiClient, FiftyOneApiError
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from .api import FiftyOneApiClient, FiftyOneApiError, FiftyOneCircuitOpenError
+from .cache import FiftyOneFrameCache
+from .const import (
+    AVIATION_HISTORY_SPAN,
+    AVIATION_MAX_AGE,
+    DOMAIN,
+    ENDPOINT_TIMEOUT,
+    OILPRICE_HISTORY_SPAN,
+    OILPRICE_MAX_AGE,
+    STOCKS_HISTORY_SPAN,
+    STOCKS_MAX_AGE,
+    WEBCAMS_MAX_AGE,
+)
+from .history import FiftyOneHistory
+from .models import (
+    AviationData,
+    OilPrice,
+    PortfolioSummary,
+    StockQuote,
+    WebcamSet,
+    parse_aviation,
+    parse_oilprice,
+    parse_stocks,
+    parse_webcams,
+    summarize_portfolio,
+)
+from .scheduler import FiftyOneSchedule
+from .session import FiftyOneConnectionStats
+from .snapshot import FiftyOneSnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
+_DataT = TypeVar("_DataT")
 
-class FiftyOneDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Class to manage fetching FiftyOne data."""
+_UNSET = object()
+
+# Context of listeners reading the history, notified after every fresh sample
+# because statistics over a trailing window change as samples age, even when
+# the payload does not
+HISTORY_CONTEXT = object()
+
+# Weather fields of the aviation data with a history
+AVIATION_METRICS = (
+    "oat",
+    "dew",
+    "spread",
+    "humidity",
+    "hpa",
+    "wind_kt",
+    "wind_kmh",
+    "gust_kt",
+    "gust_kmh",
+    "wind_dir",
+    "cloud_base",
+    "da",
+    "pa",
+    "rain_rate_mm",
+)
+
+
+class FiftyOneEndpointCoordinator(DataUpdateCoordinator[_DataT]):
+    """Base class for coordinators polling a single FiftyOne endpoint.
+
+    The raw endpoint payload is parsed once per refresh into the models the
+    entities read; the snapshot keeps the raw payload.
+
+    When a fetch fails the last good payload keeps being served, flagged as
+    stale, until a fetch succeeds again or the payload exceeds ``max_age``.
+
+    Entities subscribe with a context naming the slice of the data they read
+    (see ``_slices``) and are only notified when that slice changes.
+
+    The numeric metrics of every fresh payload (see ``_metrics``) are
+    recorded in a history per metric, which trend sensors read. Each history
+    covers ``history_span`` at the shortest interval the coordinator polls
+    at. Listeners with ``HISTORY_CONTEXT`` are notified after every recorded
+    sample.
+
+    With a schedule, the delay until the next refresh is picked by the
+    schedule after every successful refresh; while refreshes fail, the
+    coordinator polls at its configured interval.
+    """
+
+    endpoint: str
+    label: str
+    max_age: timedelta
+    history_span = timedelta(0)
 
     def __init__(
         self,
         hass: HomeAssistant,
         api_client: FiftyOneApiClient,
+        update_interval: timedelta,
+        snapshot: FiftyOneSnapshotStore | None = None,
+        schedule: FiftyOneSchedule | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            name=f"{DOMAIN}_{self.endpoint}",
+            update_interval=update_interval,
         )
         self.api_client = api_client
+        self._snapshot = snapshot
+        self.schedule = schedule
+        self.default_interval = update_interval
+        # Duration of the last fetch, in seconds
+        self.last_duration: float | None = None
+        # Epoch time of the last successful fetch
+        self.last_success: float | None = None
+        self.stale = False
+        # Listener notifications skipped because their slice did not change
+        self.suppressed_updates = 0
+        self._notified_state: tuple[bool, bool] | None = None
+        self._notified_data: _DataT | None = None
+        self._notified_slices: dict[Hashable, Any] = {}
+        self.history: dict[str, FiftyOneHistory] = {}
+        self._recorded = False
+        # Polls never come closer together than the schedule's minimum
+        self._min_interval = (
+            schedule.min_interval if schedule is not None else update_interval.total_seconds()
+        )
+
+    @property
+    def data_age(self) -> float | None:
+        """Return the age of the served payload in seconds."""
+        if self.last_success is None:
+            return None
+        return time.time() - self.last_success
+
+    @callback
+    def async_seed(self, payload: Any, fetched_at: float) -> bool:
+        """Serve a persisted payload until the first refresh completes.
+
+        Returns False if the persisted payload is past its max age or can no
+        longer be parsed.
+        """
+        if time.time() - fetched_at > self.max_age.total_seconds():
+            _LOGGER.debug("Ignoring persisted %s past its max age", self.label)
+            return False
+        try:
+            self.data = self._parse(payload)
+        except ValueError as err:
+            _LOGGER.debug("Ignoring persisted %s: %s", self.label, err)
+            return False
+        self.last_success = fetched_at
+        self.stale = True
+        return True
+
+    async def _async_fetch(self) -> Any:
+        """Fetch the raw endpoint payload."""
+        raise NotImplementedError
+
+    def _parse(self, payload: Any) -> _DataT:
+        """Parse the raw endpoint payload."""
+        raise NotImplementedError
+
+    def _slices(self, data: _DataT) -> dict[Hashable, Any]:
+        """Return the parts of the data entities can subscribe to, by context.
 
-    async def _async_update_data(self) -> dict[str, Any]:
+        Listeners without a context depend on the whole payload.
+        """
+        return {}
+
+    def _metrics(self, data: _DataT) -> dict[str, float | None]:
+        """Return the numeric metrics of the data to keep a history of."""
+        return {}
+
+    def _record(self, data: _DataT, when: float) -> None:
+        """Record the metrics of fresh data, dropping metrics that are gone."""
+        metrics = self._metrics(data)
+        for metric in self.history.keys() - metrics.keys():
+            del self.history[metric]
+        for metric, value in metrics.items():
+            if value is None:
+                continue
+            if (history := self.history.get(metric)) is None:
+                history = self.history[metric] = FiftyOneHistory.covering(
+                    self.history_span.total_seconds(), self._min_interval
+                )
+            history.append(when, value)
+        self._recorded = True
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners whose slice of the data changed.
+
+        Every listener is notified when availability or staleness changes,
+        and history listeners whenever fresh data was recorded.
+        """
+        state = (self.last_update_success, self.stale)
+        slices = self._slices(self.data) if self.data is not None else {}
+        notify_all = state != self._notified_state
+        data_changed = self.data != self._notified_data
+        changed = {
+            key
+            for key in slices.keys() | self._notified_slices.keys()
+            if slices.get(key, _UNSET) != self._notified_slices.get(key, _UNSET)
+        }
+        self._notified_state = state
+        self._notified_data = self.data
+        self._notified_slices = slices
+        recorded, self._recorded = self._recorded, False
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is HISTORY_CONTEXT:
+                notify = recorded
+            elif context is None:
+                notify = data_changed
+            else:
+                notify = context in changed
+            if notify_all or notify:
+                update_callback()
+            else:
+                self.suppressed_updates += 1
+
+    async def _async_update_data(self) -> _DataT:
         """Fetch data from API."""
+        start = time.monotonic()
         try:
-            data: dict[str, Any] = {}
-
-            # Fetch stocks
-            try:
-                data["stocks"] = await self.api_client.async_get_stocks()
-            except FiftyOneApiError as err:
-                _LOGGER.warning("Failed to fetch stocks: %s", err)
-                data["stocks"] = []
-
-            # Fetch webcams
-            try:
-                data["webcams"] = await self.api_client.async_get_webcams()
-            except FiftyOneApiError as err:
-                _LOGGER.warning("Failed to fetch webcams: %s", err)
-                data["webcams"] = {}
-
-            # Fetch oil price
-            try:
-                data["oilprice"] = await self.api_client.async_get_oilprice()
-            except FiftyOneApiError as err:
-                _LOGGER.warning("Failed to fetch oil price: %s", err)
-                data["oilprice"] = {}
-
-            # Fetch aviation data for LSZI
-            try:
-                data["aviation"] = await self.api_client.async_get_aviation_lszi()
-                _LOGGER.debug("Fetched aviation data: %s", data["aviation"])
-            except FiftyOneApiError as err:
-                _LOGGER.warning("Failed to fetch aviation data: %s", err)
-                data["aviation"] = {}
-
-            _LOGGER.debug(
-                "Data update complete - stocks: %d, webcams: %d, aviation: %s",
-                len(data.get("stocks", [])),
-                len(data.get("webcams", {})),
-                "yes" if data.get("aviation") else "no",
+            async with asyncio.timeout(ENDPOINT_TIMEOUT):
+                payload = await self._async_fetch()
+            data = self._parse(payload)
+        except ValueError as err:
+            return self._stale_data(f"Invalid {self.label} payload: {err}", err)
+        except FiftyOneApiError as err:
+            return self._stale_data(f"Failed to fetch {self.label}: {err}", err)
+        except TimeoutError as err:
+            return self._stale_data(
+                f"Timed out fetching {self.label} after {ENDPOINT_TIMEOUT}s", err
+            )
+        finally:
+            self.last_duration = time.monotonic() - start
+
+        _LOGGER.debug("Fetched %s in %.3fs", self.label, self.last_duration)
+        self.last_success = time.time()
+        self.stale = False
+        if self._snapshot is not None:
+            self._snapshot.async_update(self.endpoint, payload)
+        self._record(data, self.last_success)
+        if self.schedule is not None:
+            self.update_interval = timedelta(
+                seconds=self.schedule.next_interval(data, self.last_success)
             )
+        return data
+
+    def _stale_data(self, reason: str, err: Exception) -> _DataT:
+        """Return the last good payload if it is still within its max age."""
+        self.update_interval = self.default_interval
+        age = self.data_age
+        if self.data is None or age is None or age > self.max_age.total_seconds():
+            raise UpdateFailed(reason) from err
+
+        if not isinstance(err, FiftyOneCircuitOpenError):
+            _LOGGER.warning("%s, serving data from %ds ago", reason, age)
+        self.stale = True
+        return self.data
+
+
+class FiftyOneStocksCoordinator(FiftyOneEndpointCoordinator[dict[str, StockQuote]]):
+    """Coordinator for the stock portfolio."""
+
+    endpoint = "stocks"
+    label = "stocks"
+    max_age = timedelta(seconds=STOCKS_MAX_AGE)
+    history_span = timedelta(seconds=STOCKS_HISTORY_SPAN)
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api_client: FiftyOneApiClient,
+        update_interval: timedelta,
+        snapshot: FiftyOneSnapshotStore | None = None,
+        schedule: FiftyOneSchedule | None = None,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(hass, api_client, update_interval, snapshot, schedule)
+        self._portfolio: PortfolioSummary | None = None
+        self._portfolio_data: dict[str, StockQuote] | None = None
+
+    @property
+    def portfolio(self) -> PortfolioSummary:
+        """Return the portfolio summary of the current quotes.
+
+        The summary is computed on first use after every refresh and shared
+        by all portfolio sensors.
+        """
+        if self._portfolio is None or self._portfolio_data is not self.data:
+            start_of_day = dt_util.start_of_local_day().timestamp()
+            self._portfolio = summarize_portfolio(
+                self.quotes,
+                {
+                    symbol: history.change(start_of_day)
+                    for symbol, history in self.history.items()
+                },
+            )
+            self._portfolio_data = self.data
+        return self._portfolio
+
+    @property
+    def quotes(self) -> dict[str, StockQuote]:
+        """Return the stock quotes keyed by symbol.
+
+        The index is built once per refresh when the payload is parsed, so
+        every stock sensor gets an O(1) lookup per update.
+        """
+        return self.data or {}
+
+    async def _async_fetch(self) -> list[dict[str, Any]]:
+        """Fetch the stock portfolio."""
+        return await self.api_client.async_get_stocks()
+
+    def _parse(self, payload: Any) -> dict[str, StockQuote]:
+        """Parse the stock portfolio."""
+        return parse_stocks(payload)
+
+    def _slices(self, data: dict[str, StockQuote]) -> dict[Hashable, Any]:
+        """Return the quotes, keyed by symbol."""
+        return data
+
+    def _metrics(self, data: dict[str, StockQuote]) -> dict[str, float | None]:
+        """Return the price of every symbol, keyed by symbol."""
+        return {symbol: quote.price for symbol, quote in data.items()}
+
+
+class FiftyOneWebcamsCoordinator(FiftyOneEndpointCoordinator[WebcamSet]):
+    """Coordinator for the webcam URLs."""
+
+    endpoint = "webcams"
+    label = "webcams"
+    max_age = timedelta(seconds=WEBCAMS_MAX_AGE)
+
+    async def _async_fetch(self) -> dict[str, str | None]:
+        """Fetch the webcam URLs."""
+        return await self.api_client.async_get_webcams()
+
+    def _parse(self, payload: Any) -> WebcamSet:
+        """Parse the webcam URLs."""
+        return parse_webcams(payload)
+
+    def _slices(self, data: WebcamSet) -> dict[Hashable, Any]:
+        """Return the webcam URLs, keyed by webcam ID."""
+        return data.urls
+
+
+class FiftyOneOilPriceCoordinator(FiftyOneEndpointCoordinator[OilPrice]):
+    """Coordinator for the oil price."""
+
+    endpoint = "oilprice"
+    label = "oil price"
+    max_age = timedelta(seconds=OILPRICE_MAX_AGE)
+    history_span = timedelta(seconds=OILPRICE_HISTORY_SPAN)
+
+    async def _async_fetch(self) -> dict[str, Any]:
+        """Fetch the oil price."""
+        return await self.api_client.async_get_oilprice()
+
+    def _parse(self, payload: Any) -> OilPrice:
+        """Parse the oil price."""
+        return parse_oilprice(payload)
+
+    def _metrics(self, data: OilPrice) -> dict[str, float | None]:
+        """Return the oil price."""
+        return {"price": data.price}
+
+
+class FiftyOneAviationCoordinator(FiftyOneEndpointCoordinator[AviationData]):
+    """Coordinator for the LSZI aviation data."""
+
+    endpoint = "aviation"
+    label = "aviation data"
+    max_age = timedelta(seconds=AVIATION_MAX_AGE)
+    history_span = timedelta(seconds=AVIATION_HISTORY_SPAN)
+
+    async def _async_fetch(self) -> dict[str, Any]:
+        """Fetch the LSZI aviation data."""
+        return await self.api_client.async_get_aviation_lszi()
+
+    def _parse(self, payload: Any) -> AviationData:
+        """Parse the LSZI aviation data."""
+        return parse_aviation(payload)
+
+    def _slices(self, data: AviationData) -> dict[Hashable, Any]:
+        """Return the weather and runway sections and each of their fields.
+
+        Fields are keyed ``<section>.<field>``, e.g. ``weather.oat``.
+        """
+        slices: dict[Hashable, Any] = {}
+        for section_name in ("weather", "runway"):
+            section = getattr(data, section_name)
+            slices[section_name] = section
+            for section_field in fields(section):
+                slices[f"{section_name}.{section_field.name}"] = getattr(
+                    section, section_field.name
+                )
+        return slices
+
+    def _metrics(self, data: AviationData) -> dict[str, float | None]:
+        """Return the measured weather values, keyed like their slices."""
+        return {
+            f"weather.{name}": getattr(data.weather, name) for name in AVIATION_METRICS
+        }
+
+
+@dataclass
+class FiftyOneData:
+    """Runtime data of a FiftyOne config entry."""
 
-            return data
+    api_client: FiftyOneApiClient
+    snapshot: FiftyOneSnapshotStore
+    stocks: FiftyOneStocksCoordinator
+    webcams: FiftyOneWebcamsCoordinator
+    oilprice: FiftyOneOilPriceCoordinator
+    aviation: FiftyOneAviationCoordinator
+    frames: FiftyOneFrameCache
+    # Connection counters of the dedicated session, if the entry uses one
+    connection_stats: FiftyOneConnectionStats | None = None
+    # Refetched images that were unchanged and not reloaded, by entity ID
+    unchanged_images: Counter[str] = field(default_factory=Counter)
 
-        except Exception as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
+    @property
+    def coordinators(self) -> tuple[FiftyOneEndpointCoordinator[Any], ...]:
+        """Return all endpoint coordinators."""
+        return (self.stocks, self.webcams, self.oilprice, self.aviation)
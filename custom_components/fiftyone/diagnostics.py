@@ -0,0 +1,47 @@
+"""Diagnostics support for FiftyOne."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import FiftyOneData
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: FiftyOneData = hass.data[DOMAIN][entry.entry_id]
+    api_client = data.api_client
+
+    return {
+        "coordinators": {
+            coordinator.endpoint: {
+                "update_interval": (
+                    coordinator.update_interval.total_seconds()
+                    if coordinator.update_interval
+                    else None
+                ),
+                "last_update_success": coordinator.last_update_success,
+                "last_duration": coordinator.last_duration,
+                "suppressed_updates": coordinator.suppressed_updates,
+                "schedule": (
+                    coordinator.schedule.stats if coordinator.schedule is not None else None
+                ),
+            }
+            for coordinator in data.coordinators
+        },
+        "validator_cache": api_client.validator_stats,
+        "coalesced_requests": api_client.coalesced_requests,
+        "retries": api_client.retries,
+        "open_circuits": api_client.open_circuits,
+        "downloads": api_client.download_stats,
+        "connections": (
+            data.connection_stats.as_dict if data.connection_stats is not None else None
+        ),
+        "frame_cache": data.frames.stats,
+        "unchanged_images": dict(data.unchanged_images),
+    }
@@ -0,0 +1,79 @@
+"""Base entity for FiftyOne integration."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import ATTRIBUTION
+from .coordinator import FiftyOneEndpointCoordinator
+
+_CoordinatorT = TypeVar("_CoordinatorT", bound=FiftyOneEndpointCoordinator[Any])
+
+
+class FiftyOneCoordinatorEntity(CoordinatorEntity[_CoordinatorT]):
+    """Base class for entities backed by a FiftyOne endpoint coordinator."""
+
+    _attr_attribution = ATTRIBUTION
+    _attr_has_entity_name = True
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return how fresh the data behind this entity is.
+
+        The fetch time is reported rather than the age, which would only be
+        current when the state happens to be written.
+        """
+        fetched_at = self.coordinator.last_success
+        return {
+            "data_fetched_at": (
+                dt_util.utc_from_timestamp(fetched_at) if fetched_at is not None else None
+            ),
+            "stale": self.coordinator.stale,
+        }
+
+
+@callback
+def async_sync_entities(
+    entry: ConfigEntry,
+    coordinator: FiftyOneEndpointCoordinator[Any],
+    keys: Callable[[], Iterable[str]],
+    create: Callable[[str], list[Entity]],
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add and remove the entities of keys in the coordinator data as they change.
+
+    ``keys`` returns the current keys, such as stock symbols, and ``create``
+    the entities of a key. Whenever the data changes, the entities of new keys
+    are added and those of keys that are gone removed, leaving the entities of
+    the other keys untouched. Removed entities keep their registry entries, so
+    they return with the same entity IDs and settings.
+    """
+    entities: dict[str, list[Entity]] = {}
+
+    @callback
+    def _async_sync() -> None:
+        if coordinator.data is None:
+            return
+        current = list(keys())
+        added: list[Entity] = []
+        for key in current:
+            if key not in entities:
+                entities[key] = create(key)
+                added.extend(entities[key])
+        for key in entities.keys() - set(current):
+            for entity in entities.pop(key):
+                entry.async_create_task(
+                    coordinator.hass, entity.async_remove(), f"remove {entity.entity_id}"
+                )
+        if added:
+            async_add_entities(added)
+
+    _async_sync()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync))
@@ -0,0 +1,91 @@
+"""Recent history of the numeric metrics of FiftyOne endpoints."""
+from __future__ import annotations
+
+from array import array
+import math
+
+
+class FiftyOneHistory:
+    """Ring buffer of the most recent samples of one metric.
+
+    Sample times (epoch) and values are kept in two arrays of doubles, which
+    grow up to ``size`` samples and are then overwritten oldest first.
+    Samples are expected in chronological order.
+    """
+
+    __slots__ = ("size", "_times", "_values", "_next")
+
+    def __init__(self, size: int) -> None:
+        """Initialize the history."""
+        self.size = size
+        self._times = array("d")
+        self._values = array("d")
+        self._next = 0
+
+    @classmethod
+    def covering(cls, span: float, interval: float) -> FiftyOneHistory:
+        """Return a history holding ``span`` seconds of samples ``interval`` apart.
+
+        Two more samples are kept than the span needs, so the last sample
+        before the start of the span is kept as a baseline.
+        """
+        return cls(math.ceil(span / interval) + 2)
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self._times)
+
+    def append(self, when: float, value: float) -> None:
+        """Record a sample, replacing the oldest one when full."""
+        if len(self._times) < self.size:
+            self._times.append(when)
+            self._values.append(value)
+            return
+        self._times[self._next] = when
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self.size
+
+    def latest(self) -> float | None:
+        """Return the most recent value."""
+        if not self._times:
+            return None
+        return self._values[self._next - 1]
+
+    def change(self, since: float) -> float | None:
+        """Return how much the value changed since a time.
+
+        The change is measured from the last sample at or before ``since``.
+        Returns None if the history does not reach back that far.
+        """
+        if (count := self._count_until(since, inclusive=True)) == 0:
+            return None
+        baseline = self._values[(self._next + count - 1) % len(self._values)]
+        return self._values[self._next - 1] - baseline
+
+    def maximum(self, since: float) -> float | None:
+        """Return the highest value sampled since a time."""
+        size = len(self._values)
+        return max(
+            (
+                self._values[(self._next + index) % size]
+                for index in range(self._count_until(since, inclusive=False), size)
+            ),
+            default=None,
+        )
+
+    def _count_until(self, since: float, inclusive: bool) -> int:
+        """Return the number of samples before ``since``, or at it if inclusive.
+
+        Samples are in chronological order from ``_next``, so the count is
+        found by binary search.
+        """
+        size = len(self._times)
+        low, high = 0, size
+        while low < high:
+            middle = (low + high) // 2
+            when = self._times[(self._next + middle) % size]
+            if when < since or (inclusive and when == since):
+                low = middle + 1
+            else:
+                high = middle
+        return low
@@ -11,10 +11,17 @@ from homeassistant.components.image import ImageEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import ATTRIBUTION, CONF_IMAGE_SOURCES, DOMAIN
-from .coordinator import FiftyOneDataUpdateCoordinator
+from .api import FiftyOneCircuitOpenError
+from .cache import FiftyOneImageBuffer, content_hash
+from .const import (
+    ATTRIBUTION,
+    CONF_IMAGE_SOURCES,
+    DOMAIN,
+    RANDOM_IMAGE_BUFFER_MAX_BYTES,
+    RANDOM_IMAGE_BUFFER_SIZE,
+)
+from .coordinator import FiftyOneData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,7 +32,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up FiftyOne image entities based on a config entry."""
-    coordinator: FiftyOneDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data: FiftyOneData = hass.data[DOMAIN][entry.entry_id]
 
     entities: list[ImageEntity] = []
 
@@ -35,33 +42,41 @@ async def async_setup_entry(
         code = source.get("code")
         name = source.get("name", code)
         if code:
-            entities.append(FiftyOneLatestImage(coordinator, entry, code, name))
-            entities.append(FiftyOneRandomImage(coordinator, entry, code, name))
+            entities.append(FiftyOneLatestImage(hass, data, entry, code, name))
+            entities.append(FiftyOneRandomImage(hass, data, entry, code, name))
 
     async_add_entities(entities)
 
 
-class FiftyOneLatestImage(CoordinatorEntity[FiftyOneDataUpdateCoordinator], ImageEntity):
-    """Image entity showing the latest image for a source code."""
+class FiftyOneImageEntity(ImageEntity):
+    """Base class for image entities of a FiftyOne image source.
+
+    A refetched image whose content did not change keeps its last updated
+    time and writes no state, so frontends do not reload it.
+    """
 
     _attr_attribution = ATTRIBUTION
     _attr_has_entity_name = True
+    _kind: str
 
     def __init__(
         self,
-        coordinator: FiftyOneDataUpdateCoordinator,
+        hass: HomeAssistant,
+        data: FiftyOneData,
         entry: ConfigEntry,
         code: str,
         name: str,
     ) -> None:
         """Initialize the image entity."""
-        CoordinatorEntity.__init__(self, coordinator)
-        ImageEntity.__init__(self, coordinator.hass)
+        super().__init__(hass)
 
+        self._data = data
         self._code = code
-        self._attr_unique_id = f"{entry.entry_id}_image_{code}_latest"
-        self._attr_name = f"{name} Latest"
+        self._attr_unique_id = f"{entry.entry_id}_image_{code}_{self._kind}"
+        self._attr_name = f"{name} {self._kind.title()}"
         self._cached_image: bytes | None = None
+        self._cached_digest: str | None = None
+        self._fetched_at: datetime | None = None
         self._image_last_updated: datetime | None = None
 
     @property
@@ -69,79 +84,102 @@ class FiftyOneLatestImage(CoordinatorEntity[FiftyOneDataUpdateCoordinator], Imag
         """Return when the image was last updated."""
         return self._image_last_updated
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel downloads still waiting for a slot."""
+        await super().async_will_remove_from_hass()
+        self._data.api_client.cancel_downloads(self)
+
+    async def _async_fetch_image(self) -> bytes:
+        """Fetch a new image."""
+        raise NotImplementedError
+
     async def async_image(self) -> bytes | None:
-        """Return the latest image, using cache if still valid."""
+        """Return the image, using cache if still valid."""
         now = datetime.now()
 
         # Return cached image if still valid
         if (
             self._cached_image is not None
-            and self._image_last_updated is not None
-            and (now - self._image_last_updated) < IMAGE_CACHE_DURATION
+            and self._fetched_at is not None
+            and (now - self._fetched_at) < IMAGE_CACHE_DURATION
         ):
             return self._cached_image
 
         # Fetch new image
         try:
-            self._cached_image = await self.coordinator.api_client.async_get_latest_image(
-                code=self._code
-            )
-            self._image_last_updated = now
-            self.async_write_ha_state()
+            image = await self._async_fetch_image()
+        except FiftyOneCircuitOpenError:
             return self._cached_image
         except Exception as err:
-            _LOGGER.error("Error getting latest image for %s: %s", self._code, err)
+            _LOGGER.error("Error getting %s image for %s: %s", self._kind, self._code, err)
+            return self._cached_image
+
+        self._fetched_at = now
+        digest = content_hash(image)
+        if digest == self._cached_digest:
+            self._data.unchanged_images[self.entity_id] += 1
             return self._cached_image
 
+        self._cached_image = image
+        self._cached_digest = digest
+        self._image_last_updated = now
+        self.async_write_ha_state()
+        return image
 
-class FiftyOneRandomImage(CoordinatorEntity[FiftyOneDataUpdateCoordinator], ImageEntity):
-    """Image entity showing a random image for a source code."""
 
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
+class FiftyOneLatestImage(FiftyOneImageEntity):
+    """Image entity showing the latest image for a source code."""
+
+    _kind = "latest"
+
+    async def _async_fetch_image(self) -> bytes:
+        """Fetch the latest image."""
+        return await self._data.api_client.async_get_latest_image(
+            code=self._code, owner=self
+        )
+
+
+class FiftyOneRandomImage(FiftyOneImageEntity):
+    """Image entity showing a random image for a source code.
+
+    The next random images are downloaded ahead of time, so rotating to a
+    new image does not wait on the API.
+    """
+
+    _kind = "random"
 
     def __init__(
         self,
-        coordinator: FiftyOneDataUpdateCoordinator,
+        hass: HomeAssistant,
+        data: FiftyOneData,
         entry: ConfigEntry,
         code: str,
         name: str,
     ) -> None:
         """Initialize the image entity."""
-        CoordinatorEntity.__init__(self, coordinator)
-        ImageEntity.__init__(self, coordinator.hass)
-
-        self._code = code
-        self._attr_unique_id = f"{entry.entry_id}_image_{code}_random"
-        self._attr_name = f"{name} Random"
-        self._cached_image: bytes | None = None
-        self._image_last_updated: datetime | None = None
-
-    @property
-    def image_last_updated(self) -> datetime | None:
-        """Return when the image was last updated."""
-        return self._image_last_updated
-
-    async def async_image(self) -> bytes | None:
-        """Return a random image, using cache if still valid."""
-        now = datetime.now()
-
-        # Return cached image if still valid
-        if (
-            self._cached_image is not None
-            and self._image_last_updated is not None
-            and (now - self._image_last_updated) < IMAGE_CACHE_DURATION
-        ):
-            return self._cached_image
-
-        # Fetch new image
-        try:
-            self._cached_image = await self.coordinator.api_client.async_get_random_image(
-                code=self._code
-            )
-            self._image_last_updated = now
-            self.async_write_ha_state()
-            return self._cached_image
-        except Exception as err:
-            _LOGGER.error("Error getting random image for %s: %s", self._code, err)
-            return self._cached_image
+        super().__init__(hass, data, entry, code, name)
+
+        self._buffer = FiftyOneImageBuffer(
+            hass,
+            f"{DOMAIN} {code} random images",
+            lambda priority: data.api_client.async_get_random_image(
+                code=code, priority=priority, owner=self
+            ),
+            RANDOM_IMAGE_BUFFER_SIZE,
+            RANDOM_IMAGE_BUFFER_MAX_BYTES,
+            lambda: data.api_client.promote_downloads(self),
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Start buffering random images."""
+        await super().async_added_to_hass()
+        self._buffer.async_fill()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop the buffered random images."""
+        await super().async_will_remove_from_hass()
+        self._buffer.async_stop()
+
+    async def _async_fetch_image(self) -> bytes:
+        """Rotate to the next buffered random image."""
+        return await self._buffer.async_next()
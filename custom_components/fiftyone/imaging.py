@@ -0,0 +1,51 @@
+"""Image helpers for FiftyOne.
+
+These are CPU bound and must be run in the executor.
+"""
+from __future__ import annotations
+
+import io
+import logging
+
+from PIL import Image, UnidentifiedImageError
+
+from .const import JPEG_QUALITY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def fit_size(
+    size: tuple[int, int], width: int | None, height: int | None
+) -> tuple[int, int] | None:
+    """Return the size to downscale to, keeping the aspect ratio.
+
+    Returns None if the image already fits within the requested size.
+    """
+    scale = min(
+        width / size[0] if width else 1.0,
+        height / size[1] if height else 1.0,
+    )
+    if scale >= 1.0:
+        return None
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def resize_image(image: bytes, width: int | None, height: int | None) -> bytes:
+    """Downscale an image to fit within the requested size, as a JPEG.
+
+    Images that already fit, or cannot be decoded, are returned unchanged.
+    """
+    try:
+        with Image.open(io.BytesIO(image)) as img:
+            if (target := fit_size(img.size, width, height)) is None:
+                return image
+            # Let the JPEG decoder skip detail that is dropped anyway
+            img.draft("RGB", target)
+            resized = img.convert("RGB").resize(target, Image.Resampling.BILINEAR)
+    except (UnidentifiedImageError, OSError) as err:
+        _LOGGER.debug("Cannot resize image: %s", err)
+        return image
+
+    buffer = io.BytesIO()
+    resized.save(buffer, format="JPEG", quality=JPEG_QUALITY)
+    return buffer.getvalue()
@@ -0,0 +1,271 @@
+"""Parsed data models for the FiftyOne API payloads.
+
+The coordinators parse every payload once per refresh into these compact
+models, so entities only read attributes. Fields with an unexpected type are
+parsed as ``None``; a payload with an unexpected shape raises ``ValueError``.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+
+def _number(value: Any) -> float | None:
+    """Return a numeric value, or None if it is not a number."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _text(value: Any) -> str | None:
+    """Return a string value, or None if it is not a string."""
+    return value if isinstance(value, str) else None
+
+
+def _datetime(timestamp: float) -> datetime | None:
+    """Return a UTC datetime for an epoch timestamp."""
+    try:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def _section(payload: dict[str, Any], key: str) -> dict[str, Any]:
+    """Return a nested object of a payload, or an empty one."""
+    section = payload.get(key)
+    return section if isinstance(section, dict) else {}
+
+
+def _expect(payload: Any, expected: type, name: str) -> None:
+    """Raise ValueError if a payload does not have the expected type."""
+    if not isinstance(payload, expected):
+        raise ValueError(
+            f"Expected {name} payload to be a {expected.__name__}, "
+            f"got {type(payload).__name__}"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class StockQuote:
+    """Quote of one stock of the portfolio."""
+
+    symbol: str
+    name: str | None
+    quantity: float | None
+    price: float | None
+    value: float | None
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> StockQuote:
+        """Parse a stock quote."""
+        return cls(
+            symbol=raw["symbol"],
+            name=_text(raw.get("name")),
+            quantity=_number(raw.get("quantity")),
+            price=_number(raw.get("price")),
+            value=_number(raw.get("value")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioSummary:
+    """Aggregates over all quotes of the stock portfolio."""
+
+    total_value: float
+    # Share of the total value of each position, in percent, by symbol
+    allocation: dict[str, float] = field(default_factory=dict)
+    largest: StockQuote | None = None
+    # Value change of the positions with a known change today, absolute and
+    # relative to their value before today
+    change: float | None = None
+    change_percent: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class OilPrice:
+    """Heating oil price."""
+
+    price: float | None
+    date: str | None
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> OilPrice:
+        """Parse the oil price."""
+        return cls(price=_number(raw.get("price")), date=_text(raw.get("date")))
+
+
+@dataclass(frozen=True, slots=True)
+class WebcamSet:
+    """Current image URLs of the webcams, keyed by webcam ID.
+
+    Webcams without an image are left out.
+    """
+
+    urls: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> WebcamSet:
+        """Parse the webcam URLs."""
+        return cls(
+            urls={
+                webcam_id: url
+                for webcam_id, url in raw.items()
+                if isinstance(webcam_id, str) and isinstance(url, str) and url
+            }
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AviationWeather:
+    """Weather observation at LSZI."""
+
+    oat: float | None = None
+    dew: float | None = None
+    spread: float | None = None
+    humidity: float | None = None
+    hpa: float | None = None
+    wind_kt: float | None = None
+    wind_kmh: float | None = None
+    gust_kt: float | None = None
+    gust_kmh: float | None = None
+    wind_dir: float | None = None
+    cloud_base: float | None = None
+    da: float | None = None
+    pa: float | None = None
+    alt: float | None = None
+    valid: bool | None = None
+    timestamp: datetime | None = None
+    age: float | None = None
+    rain_rate_mm: float | None = None
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> AviationWeather:
+        """Parse a weather observation."""
+        timestamp = _number(raw.get("timestamp"))
+        valid = raw.get("valid")
+        return cls(
+            oat=_number(raw.get("oat")),
+            dew=_number(raw.get("dew")),
+            spread=_number(raw.get("spread")),
+            humidity=_number(raw.get("humidity")),
+            hpa=_number(raw.get("hpa")),
+            wind_kt=_number(raw.get("wind_kt")),
+            wind_kmh=_number(raw.get("wind_kmh")),
+            gust_kt=_number(raw.get("gust_kt")),
+            gust_kmh=_number(raw.get("gust_kmh")),
+            wind_dir=_number(raw.get("wind_dir")),
+            cloud_base=_number(raw.get("cloud_base")),
+            da=_number(raw.get("da")),
+            pa=_number(raw.get("pa")),
+            alt=_number(raw.get("alt")),
+            valid=valid if isinstance(valid, bool) else None,
+            timestamp=_datetime(timestamp) if timestamp else None,
+            age=_number(raw.get("age")),
+            rain_rate_mm=_number(raw.get("rain_rate_mm")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Runway:
+    """Runway status at LSZI."""
+
+    status: int | None = None
+    text: str | None = None
+    additional: str | None = None
+    altitude: float | None = None
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> Runway:
+        """Parse the runway status."""
+        status = _number(raw.get("status"))
+        return cls(
+            status=int(status) if status is not None else None,
+            text=_text(raw.get("text")),
+            additional=_text(raw.get("additional")),
+            altitude=_number(raw.get("altitude")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AviationData:
+    """Weather and runway status at LSZI."""
+
+    weather: AviationWeather = field(default_factory=AviationWeather)
+    runway: Runway = field(default_factory=Runway)
+
+
+def parse_stocks(payload: Any) -> dict[str, StockQuote]:
+    """Parse the stock portfolio into quotes keyed by symbol.
+
+    Entries without a symbol are skipped.
+    """
+    _expect(payload, list, "stocks")
+    return {
+        stock["symbol"]: StockQuote.from_dict(stock)
+        for stock in payload
+        if isinstance(stock, dict) and isinstance(stock.get("symbol"), str)
+    }
+
+
+def summarize_portfolio(
+    quotes: dict[str, StockQuote], changes: dict[str, float | None]
+) -> PortfolioSummary:
+    """Summarize the portfolio in one pass over its quotes.
+
+    ``changes`` holds the price change today of each symbol, if known; the
+    portfolio change is weighted by the quantity held. Quotes without a value
+    are left out.
+    """
+    total = 0.0
+    change = 0.0
+    previous = 0.0
+    largest: StockQuote | None = None
+    values: dict[str, float] = {}
+    for symbol, quote in quotes.items():
+        if quote.value is None:
+            continue
+        values[symbol] = quote.value
+        total += quote.value
+        if largest is None or quote.value > largest.value:
+            largest = quote
+        quantity = quote.quantity
+        if quantity is None and quote.price:
+            quantity = quote.value / quote.price
+        if quantity is not None and (price_change := changes.get(symbol)) is not None:
+            change += quantity * price_change
+            previous += quote.value - quantity * price_change
+
+    if total:
+        allocation = {symbol: value / total * 100 for symbol, value in values.items()}
+    else:
+        allocation = {}
+
+    return PortfolioSummary(
+        total_value=total,
+        allocation=allocation,
+        largest=largest,
+        change=change if previous else None,
+        change_percent=change / previous * 100 if previous else None,
+    )
+
+
+def parse_webcams(payload: Any) -> WebcamSet:
+    """Parse the webcams payload."""
+    _expect(payload, dict, "webcams")
+    return WebcamSet.from_dict(payload)
+
+
+def parse_oilprice(payload: Any) -> OilPrice:
+    """Parse the oil price payload."""
+    _expect(payload, dict, "oil price")
+    return OilPrice.from_dict(payload)
+
+
+def parse_aviation(payload: Any) -> AviationData:
+    """Parse the LSZI aviation payload."""
+    _expect(payload, dict, "aviation")
+    return AviationData(
+        weather=AviationWeather.from_dict(_section(payload, "weather")),
+        runway=Runway.from_dict(_section(payload, "runway")),
+    )
@@ -0,0 +1,267 @@
+"""Refresh schedules adapting the polling of FiftyOne endpoints."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+import dataclasses
+from datetime import date, datetime, time, timedelta
+import statistics
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from .models import AviationData, AviationWeather, StockQuote
+
+# Observation intervals the aviation cadence is estimated from
+AVIATION_CADENCE_SAMPLES = 5
+# Poll this long after an observation is due, so it has been published
+AVIATION_POLL_MARGIN = 15.0  # seconds
+# Doublings of the back off after unchanged polls; any more would only be
+# clamped to the maximum interval, and unbounded would overflow a float
+AVIATION_MAX_BACKOFF_EXPONENT = 10
+
+# Poll this long after a trading session opens or closes, so the opening and
+# closing prices have been published
+SESSION_POLL_MARGIN = 60.0  # seconds
+# Days searched for the next trading session, which also bounds the delay
+# while markets are closed
+SESSION_LOOKAHEAD_DAYS = 10
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class TradingSession:
+    """Regular trading hours of an exchange, Monday to Friday."""
+
+    name: str
+    zone: ZoneInfo
+    opens: time
+    closes: time
+
+    def next_transition(self, now: float, holidays: frozenset[date]) -> tuple[bool, float]:
+        """Return whether the session is open and when it next opens or closes.
+
+        ``now`` and the returned time are epoch times. Holidays are dates in
+        the exchange's time zone.
+        """
+        today = datetime.fromtimestamp(now, self.zone).date()
+        for offset in range(SESSION_LOOKAHEAD_DAYS):
+            day = today + timedelta(days=offset)
+            if day.weekday() >= 5 or day in holidays:
+                continue
+            if now < (opens := datetime.combine(day, self.opens, self.zone).timestamp()):
+                return False, opens
+            if now < (closes := datetime.combine(day, self.closes, self.zone).timestamp()):
+                return True, closes
+        return False, now + timedelta(days=SESSION_LOOKAHEAD_DAYS).total_seconds()
+
+
+# Trading sessions by symbol suffix; symbols without a suffix, or with a
+# share class suffix, trade in the US
+US_SESSION = TradingSession("US", ZoneInfo("America/New_York"), time(9, 30), time(16))
+TRADING_SESSIONS = {
+    "SW": TradingSession("SIX", ZoneInfo("Europe/Zurich"), time(9), time(17, 30)),
+    "DE": TradingSession("Xetra", ZoneInfo("Europe/Berlin"), time(9), time(17, 30)),
+    "PA": TradingSession("Euronext Paris", ZoneInfo("Europe/Paris"), time(9), time(17, 30)),
+    "AS": TradingSession(
+        "Euronext Amsterdam", ZoneInfo("Europe/Amsterdam"), time(9), time(17, 30)
+    ),
+    "MI": TradingSession("Borsa Italiana", ZoneInfo("Europe/Rome"), time(9), time(17, 30)),
+    "L": TradingSession("LSE", ZoneInfo("Europe/London"), time(8), time(16, 30)),
+    "TO": TradingSession("TSX", ZoneInfo("America/Toronto"), time(9, 30), time(16)),
+    "T": TradingSession("TSE", ZoneInfo("Asia/Tokyo"), time(9), time(15, 30)),
+    "HK": TradingSession("HKEX", ZoneInfo("Asia/Hong_Kong"), time(9, 30), time(16)),
+}
+
+
+def trading_session(symbol: str) -> TradingSession | None:
+    """Return the trading session of a symbol.
+
+    Unknown single letter suffixes are US share classes (``BRK.B``). Returns
+    None for symbols trading around the clock, such as currency and crypto
+    pairs (``BTC-USD``, ``EURCHF=X``), or listed on an unknown exchange.
+    """
+    if "-" in symbol or "=" in symbol:
+        return None
+    if "." not in symbol:
+        return US_SESSION
+    suffix = symbol.rsplit(".", 1)[1].upper()
+    if (session := TRADING_SESSIONS.get(suffix)) is None and len(suffix) == 1:
+        return US_SESSION
+    return session
+
+
+def parse_holidays(value: str | Iterable[str]) -> list[date]:
+    """Parse ISO dates, given as a list or separated by commas or whitespace.
+
+    Raises ValueError for anything that is not a date.
+    """
+    if isinstance(value, str):
+        value = value.replace(",", " ").split()
+    return sorted({date.fromisoformat(item.strip()) for item in value})
+
+
+class FiftyOneSchedule:
+    """Base class for schedules picking the delay until the next refresh.
+
+    A coordinator with a schedule asks it for the next delay after every
+    successful refresh, and falls back to its configured interval while
+    refreshes fail.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float) -> None:
+        """Initialize the schedule."""
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return schedule statistics."""
+        return {"min_interval": self.min_interval, "max_interval": self.max_interval}
+
+    def next_interval(self, data: Any, now: float) -> float:
+        """Return the seconds until the next refresh, after fetching ``data``.
+
+        ``now`` is the current epoch time.
+        """
+        raise NotImplementedError
+
+    def _clamp(self, delay: float) -> float:
+        """Bound a delay by the minimum and maximum interval."""
+        return min(self.max_interval, max(self.min_interval, delay))
+
+
+class FiftyOneAviationSchedule(FiftyOneSchedule):
+    """Poll the aviation data just after its next observation is due.
+
+    The cadence of the weather station is estimated as the median interval
+    between the observation timestamps seen so far. The next observation is
+    expected one cadence after the current one, which happened ``age``
+    seconds ago. Polls that find the same observation again back off
+    exponentially from the minimum interval.
+
+    Until the cadence is known, polls are ``initial_interval`` apart, backing
+    off the same way.
+    """
+
+    def __init__(
+        self, min_interval: float, max_interval: float, initial_interval: float
+    ) -> None:
+        """Initialize the schedule."""
+        super().__init__(min_interval, max_interval)
+        self.initial_interval = initial_interval
+        self._intervals: deque[float] = deque(maxlen=AVIATION_CADENCE_SAMPLES)
+        self._last_key: Any = None
+        self._last_timestamp: float | None = None
+        # Consecutive polls that found the same observation
+        self.unchanged = 0
+
+    @property
+    def cadence(self) -> float | None:
+        """Return the estimated seconds between observations."""
+        if not self._intervals:
+            return None
+        return statistics.median(self._intervals)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return schedule statistics."""
+        return {
+            **super().stats,
+            "cadence": self.cadence,
+            "unchanged_polls": self.unchanged,
+        }
+
+    def next_interval(self, data: AviationData, now: float) -> float:
+        """Return the seconds until the next observation is expected."""
+        weather = data.weather
+        timestamp = weather.timestamp.timestamp() if weather.timestamp else None
+        self._observe(weather, timestamp)
+
+        if (cadence := self.cadence) is not None:
+            # The age is relative to the API's clock, so it is not affected
+            # by clock skew like the timestamp is
+            observed_at = now - weather.age if weather.age is not None else timestamp
+            if observed_at is not None and (
+                due := observed_at + cadence + AVIATION_POLL_MARGIN
+            ) > now:
+                return self._clamp(due - now)
+            return self._clamp(self.min_interval * self._backoff)
+
+        return self._clamp(self.initial_interval * self._backoff)
+
+    @property
+    def _backoff(self) -> int:
+        """Return the factor the delay grows by after unchanged polls."""
+        return 2 ** min(self.unchanged, AVIATION_MAX_BACKOFF_EXPONENT)
+
+    def _observe(self, weather: AviationWeather, timestamp: float | None) -> None:
+        """Record whether a poll found a new observation."""
+        # Without a timestamp, an observation is identified by its values; the
+        # age changes on every poll
+        key = timestamp if timestamp is not None else dataclasses.replace(weather, age=None)
+        if key == self._last_key:
+            self.unchanged += 1
+            return
+
+        if timestamp is not None and self._last_timestamp is not None:
+            if (interval := timestamp - self._last_timestamp) > 0:
+                self._intervals.append(interval)
+        self._last_key = key
+        self._last_timestamp = timestamp
+        self.unchanged = 0
+
+
+class FiftyOneStocksSchedule(FiftyOneSchedule):
+    """Poll the stock portfolio according to the trading hours of its exchanges.
+
+    While any exchange of the portfolio is open, polls are ``open_interval``
+    apart, with one more poll just after the session closes. While all are
+    closed, polls are ``closed_interval`` apart, or with no closed interval
+    only once more, just after the next session opens. Weekends and the
+    given holidays are closed.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        open_interval: float,
+        closed_interval: float | None = None,
+        holidays: Iterable[date] = (),
+    ) -> None:
+        """Initialize the schedule."""
+        super().__init__(
+            min_interval, timedelta(days=SESSION_LOOKAHEAD_DAYS).total_seconds()
+        )
+        self.open_interval = open_interval
+        self.closed_interval = closed_interval or None
+        self.holidays = frozenset(holidays)
+        self._sessions: set[TradingSession | None] = set()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return schedule statistics."""
+        return {
+            **super().stats,
+            "open_interval": self.open_interval,
+            "closed_interval": self.closed_interval,
+            "holidays": len(self.holidays),
+            "sessions": sorted(
+                session.name if session else "24/7" for session in self._sessions
+            ),
+        }
+
+    def next_interval(self, data: dict[str, StockQuote], now: float) -> float:
+        """Return the seconds until the next poll any exchange needs."""
+        self._sessions = {trading_session(symbol) for symbol in data} or {US_SESSION}
+        return self._clamp(min(self._delay(session, now) for session in self._sessions))
+
+    def _delay(self, session: TradingSession | None, now: float) -> float:
+        """Return the seconds until the next poll of one exchange."""
+        if session is None:
+            return self.open_interval
+        is_open, transition = session.next_transition(now, self.holidays)
+        until = transition - now + SESSION_POLL_MARGIN
+        if is_open:
+            return min(self.open_interval, until)
+        if self.closed_interval is not None:
+            return min(self.closed_interval, until)
+        return until
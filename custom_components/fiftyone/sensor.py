@@ -1,12 +1,16 @@
 """Sensor platform for FiftyOne integration."""
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import time
 from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -19,10 +23,407 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.typing import StateType
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import (
+    HISTORY_CONTEXT,
+    FiftyOneData,
+    FiftyOneEndpointCoordinator,
+    FiftyOneStocksCoordinator,
+)
+from .entity import FiftyOneCoordinatorEntity, async_sync_entities
+from .history import FiftyOneHistory
+from .models import AviationData, PortfolioSummary, StockQuote
+
+
+@dataclass(frozen=True, kw_only=True)
+class FiftyOneSensorEntityDescription(SensorEntityDescription):
+    """Describes a FiftyOne sensor.
+
+    ``value_fn`` and ``attr_fn`` receive the parsed model the sensor reads:
+    the coordinator data for endpoint sensors, the symbol's ``StockQuote`` for
+    stock sensors, the ``PortfolioSummary`` for portfolio sensors.
+    ``data_key`` names the coordinator data slice they read, so the sensor is
+    only updated when that slice changes; stock sensors always follow their
+    symbol's quote and portfolio sensors the price history.
+    """
+
+    value_fn: Callable[[Any], StateType | datetime]
+    attr_fn: Callable[[Any], dict[str, Any]] | None = None
+    data_key: str | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class FiftyOneTrendSensorEntityDescription(SensorEntityDescription):
+    """Describes a FiftyOne sensor derived from the recent history of a metric.
+
+    ``stat_fn`` receives the coordinator's ``FiftyOneHistory`` of ``metric``
+    and the current epoch time; stock trend sensors read the history of their
+    symbol instead. As the window moves on even while the values stay the
+    same, these sensors are updated after every fresh sample rather than when
+    the payload changes.
+    """
+
+    stat_fn: Callable[[FiftyOneHistory, float], float | None]
+    metric: str | None = None
+
+
+def _change_over(window: timedelta) -> Callable[[FiftyOneHistory, float], float | None]:
+    """Return a statistic function for the change over a trailing window."""
+    return lambda history, now: history.change(now - window.total_seconds())
+
+
+def _maximum_over(window: timedelta) -> Callable[[FiftyOneHistory, float], float | None]:
+    """Return a statistic function for the maximum over a trailing window."""
+    return lambda history, now: history.maximum(now - window.total_seconds())
+
+
+def _change_today(history: FiftyOneHistory, now: float) -> float | None:
+    """Return the change since the last sample before today."""
+    return history.change(dt_util.start_of_local_day().timestamp())
+
+
+def _largest_position_attributes(portfolio: PortfolioSummary) -> dict[str, Any]:
+    """Return the attributes of the largest portfolio position."""
+    if (largest := portfolio.largest) is None:
+        return {}
+    return {
+        "name": largest.name,
+        "value": largest.value,
+        "allocation": round(portfolio.allocation[largest.symbol], 2),
+    }
+
+
+def _weather(field: str) -> Callable[[AviationData], Any]:
+    """Return a value function reading a field of the LSZI weather."""
+    return lambda data: getattr(data.weather, field)
+
+
+def _runway(field: str) -> Callable[[AviationData], Any]:
+    """Return a value function reading a field of the LSZI runway status."""
+    return lambda data: getattr(data.runway, field)
+
+
+STOCK_SENSORS: tuple[FiftyOneSensorEntityDescription, ...] = (
+    FiftyOneSensorEntityDescription(
+        key="price",
+        name="Price",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="CHF",
+        icon="mdi:currency-usd",
+        value_fn=lambda quote: quote.price,
+        attr_fn=lambda quote: {
+            "name": quote.name,
+            "symbol": quote.symbol,
+        },
+    ),
+    FiftyOneSensorEntityDescription(
+        key="value",
+        name="Value",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="CHF",
+        icon="mdi:cash-multiple",
+        value_fn=lambda quote: quote.value,
+        attr_fn=lambda quote: {
+            "name": quote.name,
+            "symbol": quote.symbol,
+            "quantity": quote.quantity,
+            "price": quote.price,
+        },
+    ),
+    FiftyOneSensorEntityDescription(
+        key="quantity",
+        name="Quantity",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:counter",
+        value_fn=lambda quote: quote.quantity,
+    ),
+)
+
+STOCK_TREND_SENSORS: tuple[FiftyOneTrendSensorEntityDescription, ...] = (
+    FiftyOneTrendSensorEntityDescription(
+        key="change_today",
+        name="Change Today",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="CHF",
+        suggested_display_precision=2,
+        icon="mdi:swap-vertical",
+        stat_fn=_change_today,
+    ),
+)
+
+PORTFOLIO_SENSORS: tuple[FiftyOneSensorEntityDescription, ...] = (
+    FiftyOneSensorEntityDescription(
+        key="portfolio_value",
+        name="Portfolio Value",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="CHF",
+        suggested_display_precision=2,
+        icon="mdi:briefcase",
+        value_fn=lambda portfolio: portfolio.total_value,
+        attr_fn=lambda portfolio: {
+            "allocation": {
+                symbol: round(share, 2) for symbol, share in portfolio.allocation.items()
+            },
+        },
+    ),
+    FiftyOneSensorEntityDescription(
+        key="portfolio_largest_position",
+        name="Portfolio Largest Position",
+        icon="mdi:trophy",
+        value_fn=lambda portfolio: portfolio.largest.symbol if portfolio.largest else None,
+        attr_fn=_largest_position_attributes,
+    ),
+    FiftyOneSensorEntityDescription(
+        key="portfolio_change_today",
+        name="Portfolio Change Today",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        suggested_display_precision=2,
+        icon="mdi:swap-vertical",
+        value_fn=lambda portfolio: portfolio.change_percent,
+        attr_fn=lambda portfolio: {"change": portfolio.change},
+    ),
+)
+
+OIL_PRICE_SENSOR = FiftyOneSensorEntityDescription(
+    key="oilprice",
+    name="Oil Price",
+    state_class=SensorStateClass.MEASUREMENT,
+    native_unit_of_measurement="CHF/100L",
+    icon="mdi:oil",
+    value_fn=lambda data: data.price,
+    attr_fn=lambda data: {"date": data.date},
+)
+
+OIL_PRICE_TREND_SENSORS: tuple[FiftyOneTrendSensorEntityDescription, ...] = (
+    FiftyOneTrendSensorEntityDescription(
+        key="oilprice_change_24h",
+        name="Oil Price Change 24h",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="CHF/100L",
+        suggested_display_precision=2,
+        icon="mdi:swap-vertical",
+        metric="price",
+        stat_fn=_change_over(timedelta(hours=24)),
+    ),
+)
+
+AVIATION_SENSORS: tuple[FiftyOneSensorEntityDescription, ...] = (
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_oat",
+        name="LSZI Temperature",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="weather.oat",
+        value_fn=_weather("oat"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_dew",
+        name="LSZI Dewpoint",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="weather.dew",
+        value_fn=_weather("dew"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_spread",
+        name="LSZI Spread",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        data_key="weather.spread",
+        value_fn=_weather("spread"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_humidity",
+        name="LSZI Humidity",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=PERCENTAGE,
+        data_key="weather.humidity",
+        value_fn=_weather("humidity"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_pressure",
+        name="LSZI Pressure",
+        device_class=SensorDeviceClass.ATMOSPHERIC_PRESSURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPressure.HPA,
+        data_key="weather.hpa",
+        value_fn=_weather("hpa"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_wind_kt",
+        name="LSZI Wind Speed",
+        device_class=SensorDeviceClass.WIND_SPEED,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfSpeed.KNOTS,
+        icon="mdi:weather-windy",
+        data_key="weather.wind_kt",
+        value_fn=_weather("wind_kt"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_wind_kmh",
+        name="LSZI Wind Speed km/h",
+        device_class=SensorDeviceClass.WIND_SPEED,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        icon="mdi:weather-windy",
+        data_key="weather.wind_kmh",
+        value_fn=_weather("wind_kmh"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_gust_kt",
+        name="LSZI Gust Speed",
+        device_class=SensorDeviceClass.WIND_SPEED,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfSpeed.KNOTS,
+        icon="mdi:weather-windy",
+        data_key="weather.gust_kt",
+        value_fn=_weather("gust_kt"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_gust_kmh",
+        name="LSZI Gust Speed km/h",
+        device_class=SensorDeviceClass.WIND_SPEED,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        icon="mdi:weather-windy",
+        data_key="weather.gust_kmh",
+        value_fn=_weather("gust_kmh"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_wind_dir",
+        name="LSZI Wind Direction",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=DEGREE,
+        icon="mdi:compass",
+        data_key="weather.wind_dir",
+        value_fn=_weather("wind_dir"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_cloud_base",
+        name="LSZI Cloud Base",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="ft",
+        icon="mdi:cloud",
+        data_key="weather.cloud_base",
+        value_fn=_weather("cloud_base"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_da",
+        name="LSZI Density Altitude",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="ft",
+        icon="mdi:altimeter",
+        data_key="weather.da",
+        value_fn=_weather("da"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_pa",
+        name="LSZI Pressure Altitude",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="ft",
+        icon="mdi:altimeter",
+        data_key="weather.pa",
+        value_fn=_weather("pa"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_alt",
+        name="LSZI Field Elevation",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="ft",
+        icon="mdi:altimeter",
+        data_key="weather.alt",
+        value_fn=_weather("alt"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_valid",
+        name="LSZI Data Valid",
+        icon="mdi:check-circle",
+        data_key="weather.valid",
+        value_fn=_weather("valid"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_timestamp",
+        name="LSZI Data Timestamp",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:clock",
+        data_key="weather.timestamp",
+        value_fn=_weather("timestamp"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_age",
+        name="LSZI Data Age",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="s",
+        icon="mdi:timer",
+        data_key="weather.age",
+        value_fn=_weather("age"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_rain_rate",
+        name="LSZI Rain Rate",
+        device_class=SensorDeviceClass.PRECIPITATION_INTENSITY,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement="mm/h",
+        icon="mdi:weather-rainy",
+        data_key="weather.rain_rate_mm",
+        value_fn=_weather("rain_rate_mm"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_runway_status",
+        name="LSZI Runway Status",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:runway",
+        data_key="runway",
+        value_fn=_runway("status"),
+        attr_fn=lambda data: {"altitude": data.runway.altitude},
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_runway_text",
+        name="LSZI Runway Text",
+        icon="mdi:runway",
+        data_key="runway.text",
+        value_fn=_runway("text"),
+    ),
+    FiftyOneSensorEntityDescription(
+        key="aviation_lszi_runway_additional",
+        name="LSZI Runway Additional",
+        icon="mdi:runway",
+        data_key="runway.additional",
+        value_fn=_runway("additional"),
+    ),
+)
 
-from .const import ATTRIBUTION, DOMAIN
-from .coordinator import FiftyOneDataUpdateCoordinator
+
+AVIATION_TREND_SENSORS: tuple[FiftyOneTrendSensorEntityDescription, ...] = (
+    FiftyOneTrendSensorEntityDescription(
+        key="aviation_lszi_pressure_tendency",
+        name="LSZI Pressure Tendency 3h",
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPressure.HPA,
+        suggested_display_precision=1,
+        icon="mdi:gauge",
+        metric="weather.hpa",
+        stat_fn=_change_over(timedelta(hours=3)),
+    ),
+    FiftyOneTrendSensorEntityDescription(
+        key="aviation_lszi_gust_max_1h",
+        name="LSZI Gust Max 1h",
+        device_class=SensorDeviceClass.WIND_SPEED,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfSpeed.KNOTS,
+        icon="mdi:weather-windy",
+        metric="weather.gust_kt",
+        stat_fn=_maximum_over(timedelta(hours=1)),
+    ),
+)
 
 
 async def async_setup_entry(
@@ -31,766 +432,222 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up FiftyOne sensors based on a config entry."""
-    coordinator: FiftyOneDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    data: FiftyOneData = hass.data[DOMAIN][entry.entry_id]
+
+    # Add the sensors of each stock symbol, following symbols as they are
+    # bought and sold
+    def _stock_sensors(symbol: str) -> list[SensorEntity]:
+        return [
+            *(
+                FiftyOneStockSensor(data.stocks, entry, symbol, description)
+                for description in STOCK_SENSORS
+            ),
+            *(
+                FiftyOneStockTrendSensor(data.stocks, entry, symbol, description)
+                for description in STOCK_TREND_SENSORS
+            ),
+        ]
+
+    async_sync_entities(
+        entry, data.stocks, lambda: data.stocks.quotes, _stock_sensors, async_add_entities
+    )
 
     entities: list[SensorEntity] = []
 
-    # Add stock sensors
-    stocks_data = coordinator.data.get("stocks", [])
-    for stock in stocks_data:
-        if isinstance(stock, dict) and "symbol" in stock:
-            entities.append(FiftyOneStockPriceSensor(coordinator, entry, stock["symbol"]))
-            entities.append(FiftyOneStockValueSensor(coordinator, entry, stock["symbol"]))
-            entities.append(FiftyOneStockQuantitySensor(coordinator, entry, stock["symbol"]))
-
-    # Add oil price sensor
-    entities.append(FiftyOneOilPriceSensor(coordinator, entry))
-
-    # Add aviation weather sensors (always create them, they'll show unavailable if no data)
-    entities.append(FiftyOneAviationTemperatureSensor(coordinator, entry))
-    entities.append(FiftyOneAviationDewpointSensor(coordinator, entry))
-    entities.append(FiftyOneAviationSpreadSensor(coordinator, entry))
-    entities.append(FiftyOneAviationHumiditySensor(coordinator, entry))
-    entities.append(FiftyOneAviationPressureSensor(coordinator, entry))
-    entities.append(FiftyOneAviationWindSpeedSensor(coordinator, entry))
-    entities.append(FiftyOneAviationWindSpeedKmhSensor(coordinator, entry))
-    entities.append(FiftyOneAviationGustSpeedSensor(coordinator, entry))
-    entities.append(FiftyOneAviationGustSpeedKmhSensor(coordinator, entry))
-    entities.append(FiftyOneAviationWindDirectionSensor(coordinator, entry))
-    entities.append(FiftyOneAviationCloudBaseSensor(coordinator, entry))
-    entities.append(FiftyOneAviationDensityAltitudeSensor(coordinator, entry))
-    entities.append(FiftyOneAviationPressureAltitudeSensor(coordinator, entry))
-    entities.append(FiftyOneAviationFieldElevationSensor(coordinator, entry))
-    entities.append(FiftyOneAviationValidSensor(coordinator, entry))
-    entities.append(FiftyOneAviationTimestampSensor(coordinator, entry))
-    entities.append(FiftyOneAviationAgeSensor(coordinator, entry))
-    entities.append(FiftyOneAviationRainRateSensor(coordinator, entry))
-    # Runway sensors
-    entities.append(FiftyOneRunwayStatusSensor(coordinator, entry))
-    entities.append(FiftyOneRunwayTextSensor(coordinator, entry))
-    entities.append(FiftyOneRunwayAdditionalSensor(coordinator, entry))
+    # Add portfolio sensors
+    entities.extend(
+        FiftyOnePortfolioSensor(data.stocks, entry, description)
+        for description in PORTFOLIO_SENSORS
+    )
+
+    # Add oil price sensors
+    entities.append(FiftyOneSensor(data.oilprice, entry, OIL_PRICE_SENSOR))
+    entities.extend(
+        FiftyOneTrendSensor(data.oilprice, entry, description)
+        for description in OIL_PRICE_TREND_SENSORS
+    )
+
+    # Add aviation weather and runway sensors (always create them, they'll show
+    # unavailable if no data)
+    entities.extend(
+        FiftyOneSensor(data.aviation, entry, description) for description in AVIATION_SENSORS
+    )
+    entities.extend(
+        FiftyOneTrendSensor(data.aviation, entry, description)
+        for description in AVIATION_TREND_SENSORS
+    )
 
     async_add_entities(entities)
 
 
-class FiftyOneOilPriceSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Oil price sensor."""
+class FiftyOneSensor(FiftyOneCoordinatorEntity[FiftyOneEndpointCoordinator[Any]], SensorEntity):
+    """Sensor reading a value from an endpoint coordinator's payload."""
 
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "CHF/100L"
-    _attr_name = "Oil Price"
-    _attr_icon = "mdi:oil"
+    entity_description: FiftyOneSensorEntityDescription
 
     def __init__(
         self,
-        coordinator: FiftyOneDataUpdateCoordinator,
+        coordinator: FiftyOneEndpointCoordinator[Any],
         entry: ConfigEntry,
+        description: FiftyOneSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_oilprice"
+        super().__init__(coordinator, description.data_key)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
 
     @property
-    def native_value(self) -> float | None:
-        """Return the oil price."""
-        return self.coordinator.data.get("oilprice", {}).get("price")
+    def native_value(self) -> StateType | datetime:
+        """Return the state of the sensor."""
+        if self.coordinator.data is None:
+            return None
+        return self.entity_description.value_fn(self.coordinator.data)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        return {
-            "date": self.coordinator.data.get("oilprice", {}).get("date"),
-        }
+        attributes = super().extra_state_attributes
+        attr_fn = self.entity_description.attr_fn
+        if attr_fn is not None and self.coordinator.data is not None:
+            attributes.update(attr_fn(self.coordinator.data))
+        return attributes
 
 
-class FiftyOneStockPriceSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Representation of a FiftyOne stock price sensor."""
+class FiftyOneStockSensor(FiftyOneCoordinatorEntity[FiftyOneStocksCoordinator], SensorEntity):
+    """Sensor reading a value from the quote of one stock symbol."""
 
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "CHF"
-    _attr_icon = "mdi:currency-usd"
+    entity_description: FiftyOneSensorEntityDescription
 
     def __init__(
         self,
-        coordinator: FiftyOneDataUpdateCoordinator,
+        coordinator: FiftyOneStocksCoordinator,
         entry: ConfigEntry,
         symbol: str,
+        description: FiftyOneSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, symbol)
+        self.entity_description = description
         self._symbol = symbol
-        self._attr_unique_id = f"{entry.entry_id}_stock_{symbol}_price"
-        self._attr_name = f"{symbol} Price"
-
-    def _get_stock_data(self) -> dict[str, Any]:
-        """Get stock data for this symbol."""
-        stocks = self.coordinator.data.get("stocks", [])
-        return next((s for s in stocks if s.get("symbol") == self._symbol), {})
+        self._attr_unique_id = f"{entry.entry_id}_stock_{symbol}_{description.key}"
+        self._attr_name = f"{symbol} {description.name}"
 
     @property
-    def native_value(self) -> float | None:
-        """Return the stock price."""
-        return self._get_stock_data().get("price")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        stock = self._get_stock_data()
-        return {
-            "name": stock.get("name"),
-            "symbol": stock.get("symbol"),
-        }
-
-
-class FiftyOneStockValueSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Representation of a FiftyOne stock total value sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "CHF"
-    _attr_icon = "mdi:cash-multiple"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-        symbol: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._symbol = symbol
-        self._attr_unique_id = f"{entry.entry_id}_stock_{symbol}_value"
-        self._attr_name = f"{symbol} Value"
-
-    def _get_stock_data(self) -> dict[str, Any]:
-        """Get stock data for this symbol."""
-        stocks = self.coordinator.data.get("stocks", [])
-        return next((s for s in stocks if s.get("symbol") == self._symbol), {})
+    def _quote(self) -> StockQuote | None:
+        """Return the quote of this symbol."""
+        return self.coordinator.quotes.get(self._symbol)
 
     @property
-    def native_value(self) -> float | None:
-        """Return the total stock value."""
-        return self._get_stock_data().get("value")
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if (quote := self._quote) is None:
+            return None
+        return self.entity_description.value_fn(quote)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        stock = self._get_stock_data()
-        return {
-            "name": stock.get("name"),
-            "symbol": stock.get("symbol"),
-            "quantity": stock.get("quantity"),
-            "price": stock.get("price"),
-        }
-
-
-class FiftyOneStockQuantitySensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Representation of a FiftyOne stock quantity sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:counter"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-        symbol: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._symbol = symbol
-        self._attr_unique_id = f"{entry.entry_id}_stock_{symbol}_quantity"
-        self._attr_name = f"{symbol} Quantity"
-
-    def _get_stock_data(self) -> dict[str, Any]:
-        """Get stock data for this symbol."""
-        stocks = self.coordinator.data.get("stocks", [])
-        return next((s for s in stocks if s.get("symbol") == self._symbol), {})
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the stock quantity."""
-        return self._get_stock_data().get("quantity")
-
-
-class FiftyOneAviationTemperatureSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation OAT (Outside Air Temperature) sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_name = "LSZI Temperature"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_oat"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the temperature."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("oat")
-
-
-class FiftyOneAviationDewpointSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation dewpoint temperature sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_name = "LSZI Dewpoint"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_dew"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the dewpoint temperature."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("dew")
-
-
-class FiftyOneAviationSpreadSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation temperature/dewpoint spread sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_name = "LSZI Spread"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_spread"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the temperature/dewpoint spread."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("spread")
-
-
-class FiftyOneAviationHumiditySensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation humidity sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.HUMIDITY
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_name = "LSZI Humidity"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_humidity"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the humidity."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("humidity")
-
-
-class FiftyOneAviationPressureSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation pressure (QNH) sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.ATMOSPHERIC_PRESSURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfPressure.HPA
-    _attr_name = "LSZI Pressure"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_pressure"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the pressure."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("hpa")
-
-
-class FiftyOneAviationWindSpeedSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation wind speed sensor (knots)."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.WIND_SPEED
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfSpeed.KNOTS
-    _attr_name = "LSZI Wind Speed"
-    _attr_icon = "mdi:weather-windy"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_wind_kt"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the wind speed in knots."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("wind_kt")
-
-
-class FiftyOneAviationWindSpeedKmhSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation wind speed sensor (km/h)."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.WIND_SPEED
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfSpeed.KILOMETERS_PER_HOUR
-    _attr_name = "LSZI Wind Speed km/h"
-    _attr_icon = "mdi:weather-windy"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_wind_kmh"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the wind speed in km/h."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("wind_kmh")
-
-
-class FiftyOneAviationGustSpeedSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation gust speed sensor (knots)."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.WIND_SPEED
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfSpeed.KNOTS
-    _attr_name = "LSZI Gust Speed"
-    _attr_icon = "mdi:weather-windy"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_gust_kt"
+        attributes = super().extra_state_attributes
+        attr_fn = self.entity_description.attr_fn
+        if attr_fn is not None and (quote := self._quote) is not None:
+            attributes.update(attr_fn(quote))
+        return attributes
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the gust speed in knots."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("gust_kt")
 
+class FiftyOnePortfolioSensor(
+    FiftyOneCoordinatorEntity[FiftyOneStocksCoordinator], SensorEntity
+):
+    """Sensor reading an aggregate over the whole stock portfolio.
 
-class FiftyOneAviationGustSpeedKmhSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation gust speed sensor (km/h)."""
+    The change today is measured against the price history, so portfolio
+    sensors are updated after every fresh sample, like trend sensors.
+    """
 
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.WIND_SPEED
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfSpeed.KILOMETERS_PER_HOUR
-    _attr_name = "LSZI Gust Speed km/h"
-    _attr_icon = "mdi:weather-windy"
+    entity_description: FiftyOneSensorEntityDescription
 
     def __init__(
         self,
-        coordinator: FiftyOneDataUpdateCoordinator,
+        coordinator: FiftyOneStocksCoordinator,
         entry: ConfigEntry,
+        description: FiftyOneSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_gust_kmh"
+        super().__init__(coordinator, HISTORY_CONTEXT)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
 
     @property
-    def native_value(self) -> float | None:
-        """Return the gust speed in km/h."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("gust_kmh")
-
-
-class FiftyOneAviationWindDirectionSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation wind direction sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = DEGREE
-    _attr_name = "LSZI Wind Direction"
-    _attr_icon = "mdi:compass"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_wind_dir"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the wind direction in degrees."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("wind_dir")
-
-
-class FiftyOneAviationCloudBaseSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation cloud base sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "ft"
-    _attr_name = "LSZI Cloud Base"
-    _attr_icon = "mdi:cloud"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_cloud_base"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the cloud base in feet."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("cloud_base")
-
-
-class FiftyOneAviationDensityAltitudeSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation density altitude sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "ft"
-    _attr_name = "LSZI Density Altitude"
-    _attr_icon = "mdi:altimeter"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_da"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the density altitude."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("da")
-
-
-class FiftyOneAviationPressureAltitudeSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation pressure altitude sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "ft"
-    _attr_name = "LSZI Pressure Altitude"
-    _attr_icon = "mdi:altimeter"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_pa"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the pressure altitude."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("pa")
-
-
-class FiftyOneAviationFieldElevationSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation field elevation sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "ft"
-    _attr_name = "LSZI Field Elevation"
-    _attr_icon = "mdi:altimeter"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_alt"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the field elevation."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("alt")
-
-
-class FiftyOneAviationValidSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation data valid sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_name = "LSZI Data Valid"
-    _attr_icon = "mdi:check-circle"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_valid"
-
-    @property
-    def native_value(self) -> bool | None:
-        """Return whether the data is valid."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("valid")
-
-
-class FiftyOneAviationTimestampSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation data timestamp sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.TIMESTAMP
-    _attr_name = "LSZI Data Timestamp"
-    _attr_icon = "mdi:clock"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_timestamp"
-
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the data timestamp."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        timestamp = weather.get("timestamp")
-        if timestamp:
-            return datetime.fromtimestamp(timestamp, tz=timezone.utc)
-        return None
-
-
-class FiftyOneAviationAgeSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation data age sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "s"
-    _attr_name = "LSZI Data Age"
-    _attr_icon = "mdi:timer"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_age"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the data age in seconds."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("age")
-
-
-class FiftyOneAviationRainRateSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation rain rate sensor."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.PRECIPITATION_INTENSITY
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = "mm/h"
-    _attr_name = "LSZI Rain Rate"
-    _attr_icon = "mdi:weather-rainy"
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_rain_rate"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the rain rate in mm/h."""
-        aviation = self.coordinator.data.get("aviation", {})
-        weather = aviation.get("weather", {})
-        return weather.get("rain_rate_mm")
-
-
-class FiftyOneRunwayStatusSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation runway status sensor (numeric 0-3)."""
-
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_name = "LSZI Runway Status"
-    _attr_icon = "mdi:runway"
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(
-        self,
-        coordinator: FiftyOneDataUpdateCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_runway_status"
-
-    @property
-    def native_value(self) -> int | None:
-        """Return the runway status as number (0-3)."""
-        aviation = self.coordinator.data.get("aviation", {})
-        runway = aviation.get("runway", {})
-        return runway.get("status")
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if self.coordinator.data is None:
+            return None
+        return self.entity_description.value_fn(self.coordinator.portfolio)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        aviation = self.coordinator.data.get("aviation", {})
-        runway = aviation.get("runway", {})
-        return {
-            "altitude": runway.get("altitude"),
-        }
+        attributes = super().extra_state_attributes
+        attr_fn = self.entity_description.attr_fn
+        if attr_fn is not None and self.coordinator.data is not None:
+            attributes.update(attr_fn(self.coordinator.portfolio))
+        return attributes
 
 
-class FiftyOneRunwayTextSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation runway text sensor."""
+class FiftyOneTrendSensor(
+    FiftyOneCoordinatorEntity[FiftyOneEndpointCoordinator[Any]], SensorEntity
+):
+    """Sensor deriving a statistic from the recent history of a metric.
 
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_name = "LSZI Runway Text"
-    _attr_icon = "mdi:runway"
+    The statistic is computed from the coordinator's in-memory history, so
+    it is unknown until the history covers its window after a restart.
+    """
+
+    entity_description: FiftyOneTrendSensorEntityDescription
 
     def __init__(
         self,
-        coordinator: FiftyOneDataUpdateCoordinator,
+        coordinator: FiftyOneEndpointCoordinator[Any],
         entry: ConfigEntry,
+        description: FiftyOneTrendSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_runway_text"
+        super().__init__(coordinator, HISTORY_CONTEXT)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
 
     @property
-    def native_value(self) -> str | None:
-        """Return the runway text."""
-        aviation = self.coordinator.data.get("aviation", {})
-        runway = aviation.get("runway", {})
-        return runway.get("text")
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        history = self.coordinator.history.get(self.entity_description.metric)
+        if history is None:
+            return None
+        return self.entity_description.stat_fn(history, time.time())
 
 
-class FiftyOneRunwayAdditionalSensor(CoordinatorEntity[FiftyOneDataUpdateCoordinator], SensorEntity):
-    """Aviation runway additional info sensor."""
+class FiftyOneStockTrendSensor(
+    FiftyOneCoordinatorEntity[FiftyOneStocksCoordinator], SensorEntity
+):
+    """Sensor deriving a statistic from the recent prices of one stock symbol."""
 
-    _attr_attribution = ATTRIBUTION
-    _attr_has_entity_name = True
-    _attr_name = "LSZI Runway Additional"
-    _attr_icon = "mdi:runway"
+    entity_description: FiftyOneTrendSensorEntityDescription
 
     def __init__(
         self,
-        coordinator: FiftyOneDataUpdateCoordinator,
+        coordinator: FiftyOneStocksCoordinator,
         entry: ConfigEntry,
+        symbol: str,
+        description: FiftyOneTrendSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{entry.entry_id}_aviation_lszi_runway_additional"
+        super().__init__(coordinator, HISTORY_CONTEXT)
+        self.entity_description = description
+        self._symbol = symbol
+        self._attr_unique_id = f"{entry.entry_id}_stock_{symbol}_{description.key}"
+        self._attr_name = f"{symbol} {description.name}"
 
     @property
-    def native_value(self) -> str | None:
-        """Return the runway additional info."""
-        aviation = self.coordinator.data.get("aviation", {})
-        runway = aviation.get("runway", {})
-        return runway.get("additional")
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        if (history := self.coordinator.history.get(self._symbol)) is None:
+            return None
+        return self.entity_description.stat_fn(history, time.time())
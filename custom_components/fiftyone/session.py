@@ -0,0 +1,91 @@
+"""Dedicated HTTP session for FiftyOne."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from aiohttp import hdrs
+
+from homeassistant.util.ssl import get_default_context
+
+from .const import (
+    SESSION_DNS_CACHE_TTL,
+    SESSION_KEEPALIVE_TIMEOUT,
+    SESSION_LIMIT,
+    SESSION_LIMIT_PER_HOST,
+)
+
+try:
+    from aiohttp.compression_utils import HAS_BROTLI
+except ImportError:  # pragma: no cover
+    # aiohttp before 3.9; only advertise the encodings it always decodes
+    HAS_BROTLI = False
+
+ACCEPT_ENCODING = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+
+
+class FiftyOneConnectionStats:
+    """Count how the connections of a session are opened and reused."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.created = 0
+        self.reused = 0
+        self.queued = 0
+
+    @property
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters and the share of requests on a reused connection."""
+        total = self.created + self.reused
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "queued": self.queued,
+            "reuse_ratio": round(self.reused / total, 3) if total else None,
+        }
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Return a trace config feeding these counters."""
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_created)
+        trace_config.on_connection_reuseconn.append(self._on_reused)
+        trace_config.on_connection_queued_start.append(self._on_queued)
+        return trace_config
+
+    async def _on_created(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """Count a new connection."""
+        self.created += 1
+
+    async def _on_reused(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """Count a request sent on a pooled connection."""
+        self.reused += 1
+
+    async def _on_queued(
+        self, session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+    ) -> None:
+        """Count a request waiting for a free connection."""
+        self.queued += 1
+
+
+def async_create_session(stats: FiftyOneConnectionStats) -> aiohttp.ClientSession:
+    """Create a session with its own connection pool for the FiftyOne API.
+
+    The caller owns the session and must close it.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=SESSION_LIMIT,
+        limit_per_host=SESSION_LIMIT_PER_HOST,
+        ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+        keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+        ssl=get_default_context(),
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={hdrs.ACCEPT_ENCODING: ACCEPT_ENCODING},
+        trace_configs=[stats.trace_config()],
+    )
@@ -0,0 +1,62 @@
+"""Persisted snapshot of the last good FiftyOne payloads."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, STORAGE_VERSION
+
+
+class FiftyOneSnapshotStore:
+    """Store the last good payload of every endpoint of a config entry.
+
+    The snapshot lets the coordinators start from known data instead of
+    blocking setup on the first network refresh.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot store."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._snapshot: dict[str, dict[str, Any]] = {}
+        self._save_pending = False
+
+    async def async_load(self) -> dict[str, dict[str, Any]]:
+        """Load the snapshot, keyed by endpoint.
+
+        Each endpoint maps to its ``payload`` and the ``fetched_at`` epoch time.
+        """
+        self._snapshot = await self._store.async_load() or {}
+        return self._snapshot
+
+    @callback
+    def async_update(self, endpoint: str, payload: Any) -> None:
+        """Record a fresh payload and schedule a save if it changed.
+
+        The fetch time of an unchanged payload is only updated in memory and
+        written with the next save. While payloads keep changing, at most one
+        save is pending, so the snapshot is written at most once per delay.
+        """
+        previous = self._snapshot.get(endpoint)
+        self._snapshot[endpoint] = {"payload": payload, "fetched_at": time.time()}
+        if previous is not None and (
+            previous["payload"] is payload or previous["payload"] == payload
+        ):
+            return
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the snapshot to write."""
+        self._save_pending = False
+        return self._snapshot
+
+    async def async_remove(self) -> None:
+        """Remove the snapshot from disk."""
+        await self._store.async_remove()
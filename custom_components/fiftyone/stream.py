@@ -0,0 +1,130 @@
+"""MJPEG streaming of webcam frames for FiftyOne."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+
+from aiohttp import web
+
+from homeassistant.core import HomeAssistant
+
+from .const import STREAM_INTERVAL, STREAM_QUEUE_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+MJPEG_BOUNDARY = "frameboundary"
+
+
+class FiftyOneFrameBroadcaster:
+    """Poll one frame source and fan its frames out to every viewer.
+
+    A single poller runs while at least one viewer is subscribed, so the
+    upstream load does not grow with the number of viewers. Each viewer gets
+    a bounded queue; a viewer that falls behind loses its oldest frames
+    instead of holding up the others. Stopping the broadcaster puts None on
+    every queue to end the viewers' streams.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        fetch: Callable[[], Awaitable[bytes | None]],
+        interval: float = STREAM_INTERVAL,
+    ) -> None:
+        """Initialize the broadcaster."""
+        self._hass = hass
+        self._name = name
+        self._fetch = fetch
+        self._interval = interval
+        self._viewers: set[asyncio.Queue[bytes | None]] = set()
+        self._poller: asyncio.Task[None] | None = None
+        self._last_frame: bytes | None = None
+        self.dropped_frames = 0
+
+    @property
+    def viewers(self) -> int:
+        """Return the number of subscribed viewers."""
+        return len(self._viewers)
+
+    def subscribe(self) -> asyncio.Queue[bytes | None]:
+        """Subscribe a viewer and return the queue its frames are put on."""
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        if self._last_frame is not None:
+            queue.put_nowait(self._last_frame)
+        self._viewers.add(queue)
+        if self._poller is None:
+            self._poller = self._hass.async_create_background_task(
+                self._async_poll(), f"{self._name} stream poller"
+            )
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[bytes | None]) -> None:
+        """Unsubscribe a viewer, stopping the poller after the last one."""
+        self._viewers.discard(queue)
+        if not self._viewers:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop polling, end the streams of all viewers and forget the last frame."""
+        if self._poller is not None:
+            self._poller.cancel()
+            self._poller = None
+        self._last_frame = None
+        viewers, self._viewers = self._viewers, set()
+        for queue in viewers:
+            self._put(queue, None)
+
+    def _publish(self, frame: bytes) -> None:
+        """Put a frame on every viewer's queue."""
+        self._last_frame = frame
+        for queue in self._viewers:
+            self._put(queue, frame)
+
+    def _put(self, queue: asyncio.Queue[bytes | None], item: bytes | None) -> None:
+        """Put an item on a viewer's queue, dropping the oldest frame if full."""
+        if queue.full():
+            queue.get_nowait()
+            self.dropped_frames += 1
+        queue.put_nowait(item)
+
+    async def _async_poll(self) -> None:
+        """Fetch frames and publish the ones that changed."""
+        while True:
+            try:
+                frame = await self._fetch()
+            except Exception:
+                _LOGGER.exception("Error fetching frame for %s", self._name)
+                frame = None
+            if frame is not None and frame is not self._last_frame:
+                self._publish(frame)
+            await asyncio.sleep(self._interval)
+
+
+async def async_stream_mjpeg(
+    request: web.Request, broadcaster: FiftyOneFrameBroadcaster
+) -> web.StreamResponse:
+    """Stream the frames of a broadcaster as MJPEG.
+
+    The stream ends when the viewer leaves or the broadcaster is stopped.
+    """
+    response = web.StreamResponse()
+    response.content_type = f"multipart/x-mixed-replace;boundary={MJPEG_BOUNDARY}"
+    await response.prepare(request)
+
+    queue = broadcaster.subscribe()
+    try:
+        while (frame := await queue.get()) is not None:
+            await response.write(
+                b"--" + MJPEG_BOUNDARY.encode() + b"\r\n"
+                b"Content-Type: image/jpeg\r\n"
+                b"Content-Length: " + str(len(frame)).encode() + b"\r\n\r\n"
+                + frame
+                + b"\r\n"
+            )
+    except ConnectionResetError:
+        pass
+    finally:
+        broadcaster.unsubscribe(queue)
+    return response
@@ -1,6 +1,7 @@
 """Fixtures for FiftyOne tests."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Generator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -106,3 +107,18 @@ def mock_config_entry() -> MagicMock:
         ],
     }
     return entry
+
+
+@pytest.fixture
+def hass() -> MagicMock:
+    """Return a mock hass running background tasks on the event loop."""
+    hass = MagicMock()
+    hass.tasks = []
+
+    def _create_task(coro, name):
+        task = asyncio.get_running_loop().create_task(coro)
+        hass.tasks.append(task)
+        return task
+
+    hass.async_create_background_task.side_effect = _create_task
+    return hass
@@ -1,12 +1,66 @@
 """Tests for the FiftyOne API client."""
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+import asyncio
+from collections.abc import AsyncIterator
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
+from multidict import CIMultiDict
 import pytest
 
-from custom_components.fiftyone.api import FiftyOneApiClient, FiftyOneApiError
+from custom_components.fiftyone.api import (
+    MAX_JSON_BYTES,
+    PRIORITY_BACKGROUND,
+    FiftyOneApiClient,
+    FiftyOneApiError,
+    FiftyOneCircuitOpenError,
+    FiftyOnePayloadError,
+)
+
+
+def _content(body: bytes, chunk_size: int = 1024) -> MagicMock:
+    """Return a mock response stream yielding a body in chunks."""
+
+    async def _iter_any() -> AsyncIterator[bytes]:
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+
+    content = MagicMock()
+    content.iter_any = MagicMock(side_effect=_iter_any)
+    return content
+
+
+def _json_response(status: int, payload: object = None, headers: dict | None = None) -> AsyncMock:
+    """Return a mock JSON response usable as an async context manager."""
+    response = AsyncMock()
+    response.status = status
+    response.headers = headers or {}
+    response.content_length = None
+    response.content = _content(json.dumps(payload).encode())
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+    return response
+
+
+def _gated_session(mock_session: AsyncMock, gate: asyncio.Event, started: list[str]) -> None:
+    """Make downloads record their URL and block until the gate opens."""
+
+    def _get(url: str, **kwargs: object) -> AsyncMock:
+        async def _read() -> bytes:
+            started.append(url)
+            await gate.wait()
+            return url.encode()
+
+        response = AsyncMock()
+        response.status = 200
+        response.read = _read
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+        return response
+
+    mock_session.get.side_effect = _get
 
 
 @pytest.fixture
@@ -37,8 +91,10 @@ class TestFiftyOneApiClient:
         """Test successful connection test."""
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(
-            return_value={"text": "quote", "character": "char", "movie": "movie"}
+        mock_response.headers = {}
+        mock_response.content_length = None
+        mock_response.content = _content(
+            json.dumps({"text": "quote", "character": "char", "movie": "movie"}).encode()
         )
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
@@ -58,6 +114,7 @@ class TestFiftyOneApiClient:
         """Test failed connection test."""
         mock_response = AsyncMock()
         mock_response.status = 500
+        mock_response.headers = {}
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -77,7 +134,9 @@ class TestFiftyOneApiClient:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=expected_stocks)
+        mock_response.headers = {}
+        mock_response.content_length = None
+        mock_response.content = _content(json.dumps(expected_stocks).encode())
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -101,7 +160,9 @@ class TestFiftyOneApiClient:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=expected_webcams)
+        mock_response.headers = {}
+        mock_response.content_length = None
+        mock_response.content = _content(json.dumps(expected_webcams).encode())
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -122,7 +183,9 @@ class TestFiftyOneApiClient:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value=expected_data)
+        mock_response.headers = {}
+        mock_response.content_length = None
+        mock_response.content = _content(json.dumps(expected_data).encode())
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -140,6 +203,7 @@ class TestFiftyOneApiClient:
 
         mock_response = AsyncMock()
         mock_response.status = 200
+        mock_response.headers = {}
         mock_response.read = AsyncMock(return_value=image_bytes)
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
@@ -162,6 +226,7 @@ class TestFiftyOneApiClient:
 
         mock_response = AsyncMock()
         mock_response.status = 200
+        mock_response.headers = {}
         mock_response.read = AsyncMock(return_value=image_bytes)
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
@@ -181,6 +246,7 @@ class TestFiftyOneApiClient:
 
         mock_response = AsyncMock()
         mock_response.status = 200
+        mock_response.headers = {}
         mock_response.read = AsyncMock(return_value=image_bytes)
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
@@ -198,6 +264,7 @@ class TestFiftyOneApiClient:
         """Test error handling for failed requests."""
         mock_response = AsyncMock()
         mock_response.status = 500
+        mock_response.headers = {}
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -221,3 +288,365 @@ class TestFiftyOneApiClient:
             await client.async_get_stocks()
 
         assert "Connection failed" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_conditional_request_not_modified(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """Test that a 304 answer returns the cached payload."""
+        expected_stocks = [{"symbol": "AAPL", "quantity": 10, "price": 150.0}]
+
+        first_response = AsyncMock()
+        first_response.status = 200
+        first_response.headers = CIMultiDict(
+            {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        )
+        first_response.content_length = None
+        first_response.content = _content(json.dumps(expected_stocks).encode())
+        first_response.__aenter__ = AsyncMock(return_value=first_response)
+        first_response.__aexit__ = AsyncMock(return_value=None)
+
+        second_response = AsyncMock()
+        second_response.status = 304
+        second_response.headers = {}
+        second_response.__aenter__ = AsyncMock(return_value=second_response)
+        second_response.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session.request.side_effect = [first_response, second_response]
+
+        client = FiftyOneApiClient(session=mock_session)
+        assert await client.async_get_stocks() == expected_stocks
+        assert await client.async_get_stocks() == expected_stocks
+
+        second_call = mock_session.request.call_args_list[1]
+        assert second_call[1]["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        second_response.content.iter_any.assert_not_called()
+        assert client.validator_stats == {"entries": 1, "hits": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_request_without_validators_is_unconditional(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """Test that responses without validators are not cached."""
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.headers = {}
+        mock_response.content_length = None
+        mock_response.content = _content(json.dumps({"price": 110.5}).encode())
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session.request.return_value = mock_response
+
+        client = FiftyOneApiClient(session=mock_session)
+        await client.async_get_oilprice()
+        await client.async_get_oilprice()
+
+        mock_session.request.assert_called_with("GET", "https://api.fiftyone.dev/oilprice")
+        assert client.validator_stats["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_are_coalesced(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """Test that concurrent callers share a single upstream request."""
+        image_bytes = b"\x89PNG\r\n\x1a\n"
+        release = asyncio.Event()
+
+        async def _read() -> bytes:
+            await release.wait()
+            return image_bytes
+
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.read = _read
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+
+        mock_session.get.return_value = mock_response
+
+        client = FiftyOneApiClient(session=mock_session)
+        webcam_url = "https://example.com/webcam.jpg"
+        callers = [
+            asyncio.create_task(client.async_get_webcam_image(webcam_url))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*callers) == [image_bytes] * 5
+        mock_session.get.assert_called_once_with(webcam_url)
+        assert client.coalesced_requests == 4
+
+        # Once settled, the next call goes upstream again
+        await client.async_get_webcam_image(webcam_url)
+        assert mock_session.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_honours_retry_after(self, mock_session: AsyncMock) -> None:
+        """Test that a 503 is retried after the delay the server asked for."""
+        mock_session.request.side_effect = [
+            _json_response(503, headers={"Retry-After": "2"}),
+            _json_response(200, {"price": 110.5}),
+        ]
+
+        client = FiftyOneApiClient(session=mock_session)
+        with patch("custom_components.fiftyone.api.asyncio.sleep") as mock_sleep:
+            result = await client.async_get_oilprice()
+
+        assert result == {"price": 110.5}
+        mock_sleep.assert_awaited_once_with(2.0)
+        assert client.retries == 1
+
+    @pytest.mark.asyncio
+    async def test_download_timeout_not_retried_past_budget(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """Test that a download timing out after its budget is not retried."""
+        clock = [0.0]
+
+        def _get(url: str, **kwargs: object) -> AsyncMock:
+            clock[0] += 60.0
+            raise TimeoutError
+
+        mock_session.get.side_effect = _get
+
+        client = FiftyOneApiClient(session=mock_session)
+        with patch(
+            "custom_components.fiftyone.api.time.monotonic", side_effect=lambda: clock[0]
+        ):
+            with pytest.raises(FiftyOneApiError):
+                await client.async_get_latest_image()
+
+        assert mock_session.get.call_count == 1
+        assert client.retries == 0
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, mock_session: AsyncMock) -> None:
+        """Test that a 404 fails straight away."""
+        mock_session.request.return_value = _json_response(404)
+
+        client = FiftyOneApiClient(session=mock_session)
+        with pytest.raises(FiftyOneApiError):
+            await client.async_get_oilprice()
+
+        assert mock_session.request.call_count == 1
+        assert client.open_circuits == []
+
+    @pytest.mark.asyncio
+    async def test_oversized_response_is_not_read(self, mock_session: AsyncMock) -> None:
+        """Test that a response announcing a body over the limit is rejected."""
+        response = _json_response(200, {"price": 110.5})
+        response.content_length = MAX_JSON_BYTES + 1
+        mock_session.request.return_value = response
+
+        client = FiftyOneApiClient(session=mock_session)
+        with pytest.raises(FiftyOnePayloadError):
+            await client.async_get_oilprice()
+
+        response.content.iter_any.assert_not_called()
+        assert mock_session.request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_oversized_chunked_response_stops_reading(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """Test that a body without Content-Length is only read up to the limit."""
+        chunks_read = 0
+
+        async def _iter_any() -> AsyncIterator[bytes]:
+            nonlocal chunks_read
+            while True:
+                chunks_read += 1
+                yield b" " * (1024 * 1024)
+
+        response = _json_response(200)
+        response.content = MagicMock()
+        response.content.iter_any = _iter_any
+        mock_session.request.return_value = response
+
+        client = FiftyOneApiClient(session=mock_session)
+        with pytest.raises(FiftyOnePayloadError):
+            await client.async_get_oilprice()
+
+        assert chunks_read == MAX_JSON_BYTES // (1024 * 1024) + 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_is_not_retried(self, mock_session: AsyncMock) -> None:
+        """Test that a body that is not JSON fails straight away."""
+        response = _json_response(200)
+        response.content = _content(b"<html>Bad gateway</html>")
+        mock_session.request.return_value = response
+
+        client = FiftyOneApiClient(session=mock_session)
+        with pytest.raises(FiftyOnePayloadError):
+            await client.async_get_oilprice()
+
+        assert mock_session.request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_fails_fast(self, mock_session: AsyncMock) -> None:
+        """Test that an endpoint stops being called once its breaker opens."""
+        mock_session.request.return_value = _json_response(500)
+
+        client = FiftyOneApiClient(session=mock_session)
+        with patch("custom_components.fiftyone.api.asyncio.sleep"):
+            for _ in range(3):
+                with pytest.raises(FiftyOneApiError):
+                    await client.async_get_stocks()
+
+        calls = mock_session.request.call_count
+        assert client.open_circuits == ["https://api.fiftyone.dev/stocks"]
+
+        with pytest.raises(FiftyOneCircuitOpenError):
+            await client.async_get_stocks()
+        assert mock_session.request.call_count == calls
+
+        # Other endpoints are unaffected
+        mock_session.request.return_value = _json_response(200, {"price": 110.5})
+        assert await client.async_get_oilprice() == {"price": 110.5}
+
+    @pytest.mark.asyncio
+    async def test_downloads_limited_and_prioritised(self, mock_session: AsyncMock) -> None:
+        """Test that downloads beyond the limit wait and interactive ones go first."""
+        gate = asyncio.Event()
+        started: list[str] = []
+        _gated_session(mock_session, gate, started)
+
+        client = FiftyOneApiClient(session=mock_session, max_downloads=1)
+        first = asyncio.create_task(client.async_get_webcam_image("https://example.com/1"))
+        await asyncio.sleep(0.01)
+        background = asyncio.create_task(
+            client.async_get_webcam_image("https://example.com/bg", PRIORITY_BACKGROUND)
+        )
+        interactive = asyncio.create_task(client.async_get_webcam_image("https://example.com/ui"))
+        await asyncio.sleep(0.01)
+
+        assert client.download_stats["active"] == 1
+        assert client.download_stats["queued"] == 2
+
+        gate.set()
+        await asyncio.gather(first, background, interactive)
+
+        assert started == [
+            "https://example.com/1",
+            "https://example.com/ui",
+            "https://example.com/bg",
+        ]
+        assert client.download_stats["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_joined_download_takes_most_urgent_priority(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """Test that joining a queued prefetch moves it ahead of other downloads."""
+        gate = asyncio.Event()
+        started: list[str] = []
+        _gated_session(mock_session, gate, started)
+
+        client = FiftyOneApiClient(session=mock_session, max_downloads=1)
+        first = asyncio.create_task(client.async_get_webcam_image("https://example.com/1"))
+        await asyncio.sleep(0.01)
+        prefetch = asyncio.create_task(
+            client.async_get_webcam_image("https://example.com/a", PRIORITY_BACKGROUND)
+        )
+        other = asyncio.create_task(client.async_get_webcam_image("https://example.com/b"))
+        await asyncio.sleep(0.01)
+        viewer = asyncio.create_task(client.async_get_webcam_image("https://example.com/a"))
+        await asyncio.sleep(0.01)
+
+        assert client.download_stats["queued"] == 2
+
+        gate.set()
+        await asyncio.gather(first, prefetch, other, viewer)
+
+        assert started == [
+            "https://example.com/1",
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancel_keeps_downloads_joined_by_others(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """Test that cancelling an owner leaves downloads other callers wait for."""
+        gate = asyncio.Event()
+        started: list[str] = []
+        _gated_session(mock_session, gate, started)
+        owner = object()
+
+        client = FiftyOneApiClient(session=mock_session, max_downloads=1)
+        first = asyncio.create_task(client.async_get_webcam_image("https://example.com/1"))
+        await asyncio.sleep(0.01)
+        owned = asyncio.create_task(
+            client.async_get_webcam_image("https://example.com/2", owner=owner)
+        )
+        joined = asyncio.create_task(client.async_get_webcam_image("https://example.com/2"))
+        await asyncio.sleep(0.01)
+
+        assert client.cancel_downloads(owner) == 0
+        gate.set()
+
+        assert await joined == b"https://example.com/2"
+        assert await owned == b"https://example.com/2"
+        await first
+
+    @pytest.mark.asyncio
+    async def test_promote_queued_downloads_of_owner(self, mock_session: AsyncMock) -> None:
+        """Test that an owner's queued downloads can be moved ahead of others."""
+        gate = asyncio.Event()
+        started: list[str] = []
+        _gated_session(mock_session, gate, started)
+        owner = object()
+
+        client = FiftyOneApiClient(session=mock_session, max_downloads=1)
+        first = asyncio.create_task(client.async_get_webcam_image("https://example.com/1"))
+        await asyncio.sleep(0.01)
+        other = asyncio.create_task(
+            client.async_get_webcam_image("https://example.com/b", PRIORITY_BACKGROUND)
+        )
+        owned = asyncio.create_task(
+            client.async_get_webcam_image(
+                "https://example.com/a", PRIORITY_BACKGROUND, owner=owner
+            )
+        )
+        await asyncio.sleep(0.01)
+
+        client.promote_downloads(owner)
+        gate.set()
+        await asyncio.gather(first, other, owned)
+
+        assert started == [
+            "https://example.com/1",
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued_downloads_of_owner(self, mock_session: AsyncMock) -> None:
+        """Test that an owner's queued downloads can be cancelled."""
+        gate = asyncio.Event()
+        started: list[str] = []
+        _gated_session(mock_session, gate, started)
+        owner = object()
+
+        client = FiftyOneApiClient(session=mock_session, max_downloads=1)
+        first = asyncio.create_task(client.async_get_webcam_image("https://example.com/1"))
+        await asyncio.sleep(0.01)
+        queued = asyncio.create_task(
+            client.async_get_webcam_image("https://example.com/2", owner=owner)
+        )
+        await asyncio.sleep(0.01)
+
+        assert client.cancel_downloads(owner) == 1
+        gate.set()
+
+        assert await first == b"https://example.com/1"
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert started == ["https://example.com/1"]
+        assert client.download_stats == {"limit": 1, "active": 0, "queued": 0, "cancelled": 1}
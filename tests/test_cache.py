@@ -0,0 +1,229 @@
+"""Tests for the FiftyOne webcam frame cache."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.fiftyone.api import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+from custom_components.fiftyone.cache import FiftyOneFrameCache, FiftyOneImageBuffer
+
+
+class TestFiftyOneFrameCache:
+    """Tests for the frame cache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_within_max_age(self) -> None:
+        """Test that a frame is reused within its max age."""
+        cache = FiftyOneFrameCache(max_bytes=1024, max_age=60)
+        fetch = AsyncMock(return_value=b"frame")
+
+        assert await cache.async_get("https://example.com/a.jpg", fetch) == b"frame"
+        assert await cache.async_get("https://example.com/a.jpg", fetch) == b"frame"
+
+        fetch.assert_called_once()
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_refill_after_max_age(self) -> None:
+        """Test that an expired frame is fetched again."""
+        cache = FiftyOneFrameCache(max_bytes=1024, max_age=60)
+        fetch = AsyncMock(side_effect=[b"old", b"new"])
+
+        with patch("custom_components.fiftyone.cache.time.monotonic", return_value=0):
+            await cache.async_get("url", fetch)
+        with patch("custom_components.fiftyone.cache.time.monotonic", return_value=61):
+            assert await cache.async_get("url", fetch) == b"new"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_single_refill(self) -> None:
+        """Test that concurrent misses for a URL share one download."""
+        cache = FiftyOneFrameCache(max_bytes=1024, max_age=60)
+        calls = 0
+
+        async def _fetch() -> bytes:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return b"frame"
+
+        results = await asyncio.gather(*(cache.async_get("url", _fetch) for _ in range(5)))
+
+        assert results == [b"frame"] * 5
+        assert calls == 1
+
+    def test_lru_eviction_within_budget(self) -> None:
+        """Test that the least recently used frames are evicted first."""
+        cache = FiftyOneFrameCache(max_bytes=10, max_age=60)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        assert cache.get("a") == b"aaaa"
+
+        cache.put("c", b"cccc")
+
+        assert cache.peek("b") is None
+        assert cache.peek("a") == b"aaaa"
+        assert cache.size == 8
+        assert cache.evictions == 1
+
+    def test_oversized_frame_not_cached(self) -> None:
+        """Test that a frame larger than the budget is not cached."""
+        cache = FiftyOneFrameCache(max_bytes=4, max_age=60)
+        cache.put("a", b"aaaaa")
+
+        assert cache.peek("a") is None
+        assert cache.size == 0
+
+    def test_peek_ignores_max_age(self) -> None:
+        """Test that an expired frame is still available as a fallback."""
+        cache = FiftyOneFrameCache(max_bytes=1024, max_age=0)
+        cache.put("a", b"aaaa")
+
+        assert cache.get("a") is None
+        assert cache.peek("a") == b"aaaa"
+
+    def test_digest_follows_cached_frame(self) -> None:
+        """Test that the content hash is only given for the cached frame."""
+        cache = FiftyOneFrameCache(max_bytes=1024, max_age=60)
+        image = b"aaaa"
+        cache.put("a", image)
+
+        digest = cache.digest("a", image)
+
+        assert digest is not None
+        assert cache.digest("a", image) == digest
+        assert cache.digest("a", b"bbbb") is None
+        assert cache.digest("b", image) is None
+
+    @pytest.mark.asyncio
+    async def test_prefetch_bounded_concurrency(self) -> None:
+        """Test that prefetching downloads at most ``limit`` frames at a time."""
+        cache = FiftyOneFrameCache(max_bytes=1024, max_age=60)
+        cache.put("fresh", b"frame")
+        running = peak = 0
+
+        async def _fetch(url: str) -> bytes:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if url == "broken":
+                raise OSError("boom")
+            return url.encode()
+
+        await cache.async_prefetch(["a", "b", "c", "broken", "fresh"], _fetch, limit=2)
+
+        assert peak == 2
+        assert cache.prefetched == 3
+        assert cache.peek("c") == b"c"
+        assert cache.peek("fresh") == b"frame"
+
+    @pytest.mark.asyncio
+    async def test_prefetched_frames_kept_for_their_max_age(self) -> None:
+        """Test that prefetched frames outlive the max age of the cache."""
+        cache = FiftyOneFrameCache(max_bytes=1024, max_age=60)
+        fetch = AsyncMock(side_effect=lambda url: url.encode())
+
+        with patch("custom_components.fiftyone.cache.time.monotonic", return_value=0):
+            await cache.async_prefetch(["a"], fetch, limit=1, max_age=600)
+        with patch("custom_components.fiftyone.cache.time.monotonic", return_value=599):
+            assert await cache.async_get("a", fetch) == b"a"
+        with patch("custom_components.fiftyone.cache.time.monotonic", return_value=600):
+            assert cache.get("a") is None
+
+        fetch.assert_called_once_with("a")
+
+
+class TestFiftyOneImageBuffer:
+    """Tests for the image buffer."""
+
+    @staticmethod
+    def _counter(size: int = 4) -> AsyncMock:
+        """Return a fetch function producing numbered images of the given size."""
+        counter = iter(range(1000))
+        return AsyncMock(
+            side_effect=lambda priority: str(next(counter)).encode().ljust(size, b".")
+        )
+
+    @pytest.mark.asyncio
+    async def test_fills_in_background(self, hass: MagicMock) -> None:
+        """Test that the buffer fills up to its size and serves images in order."""
+        fetch = self._counter()
+        buffer = FiftyOneImageBuffer(hass, "test", fetch, size=3, max_bytes=1024)
+
+        buffer.async_fill()
+        await hass.tasks[-1]
+
+        assert len(buffer) == 3
+        assert await buffer.async_next() == b"0..."
+        assert buffer.hits == 1
+        await hass.tasks[-1]
+        assert len(buffer) == 3
+        assert fetch.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_empty_buffer_waits_for_filler(self, hass: MagicMock) -> None:
+        """Test that a caller finding the buffer empty gets the next download."""
+        fetch = self._counter()
+        buffer = FiftyOneImageBuffer(hass, "test", fetch, size=2, max_bytes=1024)
+
+        first, second = await asyncio.gather(buffer.async_next(), buffer.async_next())
+
+        assert {first, second} == {b"0...", b"1..."}
+        assert buffer.misses == 2
+        assert len(hass.tasks) == 1
+        await hass.tasks[0]
+        assert len(buffer) == 2
+
+    @pytest.mark.asyncio
+    async def test_waiting_caller_raises_priority(self, hass: MagicMock) -> None:
+        """Test that downloads a caller waits for are fetched interactively."""
+        fetch = self._counter()
+        promote = MagicMock()
+        buffer = FiftyOneImageBuffer(hass, "test", fetch, size=1, max_bytes=1024, promote=promote)
+
+        assert await buffer.async_next() == b"0..."
+        await hass.tasks[0]
+
+        promote.assert_called_once_with()
+        assert [call.args for call in fetch.call_args_list] == [
+            (PRIORITY_INTERACTIVE,),
+            (PRIORITY_BACKGROUND,),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_memory_cap(self, hass: MagicMock) -> None:
+        """Test that filling stops once the buffer holds max_bytes."""
+        buffer = FiftyOneImageBuffer(
+            hass, "test", self._counter(size=100), size=10, max_bytes=250
+        )
+
+        buffer.async_fill()
+        await hass.tasks[-1]
+
+        assert len(buffer) == 3
+        assert buffer.size == 300
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_waiter(self, hass: MagicMock) -> None:
+        """Test that a failed download fails a waiting caller."""
+        fetch = AsyncMock(side_effect=OSError("boom"))
+        buffer = FiftyOneImageBuffer(hass, "test", fetch, size=2, max_bytes=1024)
+
+        with pytest.raises(OSError):
+            await buffer.async_next()
+
+    @pytest.mark.asyncio
+    async def test_stop(self, hass: MagicMock) -> None:
+        """Test that stopping drops the buffered images."""
+        buffer = FiftyOneImageBuffer(hass, "test", self._counter(), size=2, max_bytes=1024)
+        buffer.async_fill()
+        await hass.tasks[-1]
+
+        buffer.async_stop()
+
+        assert len(buffer) == 0
+        assert buffer.size == 0
@@ -0,0 +1,400 @@
+"""Tests for the FiftyOne data update coordinators."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.helpers.update_coordinator import UpdateFailed
+import pytest
+
+from custom_components.fiftyone.api import FiftyOneApiError, FiftyOneCircuitOpenError
+from custom_components.fiftyone.coordinator import (
+    HISTORY_CONTEXT,
+    FiftyOneAviationCoordinator,
+    FiftyOneStocksCoordinator,
+)
+from custom_components.fiftyone.models import parse_aviation, parse_stocks
+
+
+@pytest.fixture
+def stocks_coordinator(mock_api_client: AsyncMock) -> FiftyOneStocksCoordinator:
+    """Return a stocks coordinator backed by the mock API client."""
+    return FiftyOneStocksCoordinator(MagicMock(), mock_api_client, timedelta(minutes=5))
+
+
+class TestFiftyOneEndpointCoordinator:
+    """Tests for the per-endpoint coordinators."""
+
+    @pytest.mark.asyncio
+    async def test_update_fetches_own_endpoint(
+        self,
+        mock_api_client: AsyncMock,
+        mock_aviation_response: dict,
+    ) -> None:
+        """Test that a coordinator only calls its own endpoint."""
+        coordinator = FiftyOneAviationCoordinator(
+            MagicMock(), mock_api_client, timedelta(minutes=1)
+        )
+
+        data = await coordinator._async_update_data()
+
+        assert data == parse_aviation(mock_aviation_response)
+        assert coordinator.update_interval == timedelta(minutes=1)
+        assert coordinator.last_duration is not None
+        mock_api_client.async_get_stocks.assert_not_called()
+        mock_api_client.async_get_webcams.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_failure_raises(
+        self, stocks_coordinator: FiftyOneStocksCoordinator, mock_api_client: AsyncMock
+    ) -> None:
+        """Test that a failing endpoint fails its coordinator."""
+        mock_api_client.async_get_stocks.side_effect = FiftyOneApiError("boom")
+
+        with pytest.raises(UpdateFailed):
+            await stocks_coordinator._async_update_data()
+
+    @pytest.mark.asyncio
+    async def test_update_times_out(
+        self, stocks_coordinator: FiftyOneStocksCoordinator, mock_api_client: AsyncMock
+    ) -> None:
+        """Test that a slow endpoint is bounded by the endpoint timeout."""
+
+        async def _slow() -> list[dict]:
+            await asyncio.sleep(10)
+            return []
+
+        mock_api_client.async_get_stocks.side_effect = _slow
+
+        with patch("custom_components.fiftyone.coordinator.ENDPOINT_TIMEOUT", 0.05):
+            with pytest.raises(UpdateFailed):
+                await stocks_coordinator._async_update_data()
+
+        assert stocks_coordinator.last_duration < 1
+
+    @pytest.mark.asyncio
+    async def test_update_serves_cached_data_while_circuit_open(
+        self,
+        stocks_coordinator: FiftyOneStocksCoordinator,
+        mock_api_client: AsyncMock,
+        mock_stocks_response: list[dict],
+    ) -> None:
+        """Test that an open circuit keeps the previous data."""
+        stocks_coordinator.data = await stocks_coordinator._async_update_data()
+        mock_api_client.async_get_stocks.side_effect = FiftyOneCircuitOpenError("open")
+
+        data = await stocks_coordinator._async_update_data()
+
+        assert data == parse_stocks(mock_stocks_response)
+
+    @pytest.mark.asyncio
+    async def test_update_persists_snapshot(
+        self, mock_api_client: AsyncMock, mock_stocks_response: list[dict]
+    ) -> None:
+        """Test that a successful update is recorded in the snapshot."""
+        snapshot = MagicMock()
+        coordinator = FiftyOneStocksCoordinator(
+            MagicMock(), mock_api_client, timedelta(minutes=5), snapshot
+        )
+
+        await coordinator._async_update_data()
+
+        snapshot.async_update.assert_called_once_with("stocks", mock_stocks_response)
+
+    @pytest.mark.asyncio
+    async def test_failed_update_keeps_snapshot(
+        self, mock_api_client: AsyncMock
+    ) -> None:
+        """Test that a failed update does not overwrite the snapshot."""
+        snapshot = MagicMock()
+        coordinator = FiftyOneStocksCoordinator(
+            MagicMock(), mock_api_client, timedelta(minutes=5), snapshot
+        )
+        mock_api_client.async_get_stocks.side_effect = FiftyOneApiError("boom")
+
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+        snapshot.async_update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_update_serves_stale_data(
+        self,
+        stocks_coordinator: FiftyOneStocksCoordinator,
+        mock_api_client: AsyncMock,
+        mock_stocks_response: list[dict],
+    ) -> None:
+        """Test that the last good payload is kept, flagged stale, on failure."""
+        stocks_coordinator.data = await stocks_coordinator._async_update_data()
+        assert stocks_coordinator.stale is False
+        mock_api_client.async_get_stocks.side_effect = FiftyOneApiError("boom")
+
+        data = await stocks_coordinator._async_update_data()
+
+        assert data == parse_stocks(mock_stocks_response)
+        assert stocks_coordinator.stale is True
+        assert stocks_coordinator.data_age < 1
+
+    @pytest.mark.asyncio
+    async def test_failed_update_past_max_age_raises(
+        self,
+        stocks_coordinator: FiftyOneStocksCoordinator,
+        mock_api_client: AsyncMock,
+        mock_stocks_response: list[dict],
+    ) -> None:
+        """Test that a payload older than the max age is no longer served."""
+        stocks_coordinator.async_seed(
+            mock_stocks_response,
+            time.time() - stocks_coordinator.max_age.total_seconds() - 1,
+        )
+        mock_api_client.async_get_stocks.side_effect = FiftyOneApiError("boom")
+
+        with pytest.raises(UpdateFailed):
+            await stocks_coordinator._async_update_data()
+
+    @pytest.mark.asyncio
+    async def test_schedule_picks_update_interval(
+        self, mock_api_client: AsyncMock
+    ) -> None:
+        """Test that a schedule sets the interval until a refresh fails."""
+        schedule = MagicMock()
+        schedule.min_interval = 30
+        schedule.next_interval.return_value = 420
+        coordinator = FiftyOneAviationCoordinator(
+            MagicMock(), mock_api_client, timedelta(minutes=1), schedule=schedule
+        )
+
+        coordinator.data = await coordinator._async_update_data()
+
+        assert coordinator.update_interval == timedelta(seconds=420)
+        schedule.next_interval.assert_called_once_with(
+            coordinator.data, coordinator.last_success
+        )
+
+        mock_api_client.async_get_aviation_lszi.side_effect = FiftyOneApiError("boom")
+        await coordinator._async_update_data()
+
+        assert coordinator.stale is True
+        assert coordinator.update_interval == timedelta(minutes=1)
+
+    @pytest.mark.asyncio
+    async def test_update_records_history(
+        self,
+        stocks_coordinator: FiftyOneStocksCoordinator,
+        mock_api_client: AsyncMock,
+    ) -> None:
+        """Test that fresh payloads are recorded and removed symbols dropped."""
+        await stocks_coordinator._async_update_data()
+        mock_api_client.async_get_stocks.return_value = [
+            {"symbol": "AAPL", "quantity": 10, "price": 151.0}
+        ]
+        await stocks_coordinator._async_update_data()
+
+        assert set(stocks_coordinator.history) == {"AAPL"}
+        assert len(stocks_coordinator.history["AAPL"]) == 2
+        assert stocks_coordinator.history["AAPL"].latest() == 151.0
+
+        mock_api_client.async_get_stocks.side_effect = FiftyOneApiError("boom")
+        stocks_coordinator.data = parse_stocks([{"symbol": "AAPL", "price": 151.0}])
+        await stocks_coordinator._async_update_data()
+
+        assert len(stocks_coordinator.history["AAPL"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_history_covers_span_at_minimum_interval(
+        self, mock_api_client: AsyncMock
+    ) -> None:
+        """Test that histories are sized from their span and the minimum interval."""
+        schedule = MagicMock()
+        schedule.min_interval = 30
+        schedule.next_interval.return_value = 30
+        coordinator = FiftyOneAviationCoordinator(
+            MagicMock(), mock_api_client, timedelta(minutes=1), schedule=schedule
+        )
+
+        await coordinator._async_update_data()
+
+        # 3 hours of samples 30 seconds apart, and the baseline before them
+        assert coordinator.history["weather.hpa"].size == 362
+
+    @pytest.mark.asyncio
+    async def test_portfolio_computed_once_per_refresh(
+        self,
+        stocks_coordinator: FiftyOneStocksCoordinator,
+        mock_api_client: AsyncMock,
+    ) -> None:
+        """Test that the portfolio summary is shared until the next refresh."""
+        stocks_coordinator.data = await stocks_coordinator._async_update_data()
+
+        first_refresh = stocks_coordinator.last_success
+        portfolio = stocks_coordinator.portfolio
+        assert portfolio.total_value == 2200.0
+        assert stocks_coordinator.portfolio is portfolio
+
+        mock_api_client.async_get_stocks.return_value = [
+            {"symbol": "AAPL", "quantity": 10, "price": 151.0, "value": 1510.0}
+        ]
+        stocks_coordinator.data = await stocks_coordinator._async_update_data()
+        # Today started between the two refreshes
+        start_of_day = MagicMock(return_value=MagicMock(timestamp=lambda: first_refresh))
+        with patch(
+            "custom_components.fiftyone.coordinator.dt_util.start_of_local_day", start_of_day
+        ):
+            assert stocks_coordinator.portfolio is not portfolio
+            assert stocks_coordinator.portfolio.total_value == 1510.0
+            assert stocks_coordinator.portfolio.change == 10.0
+
+    @pytest.mark.asyncio
+    async def test_quotes_index(
+        self,
+        stocks_coordinator: FiftyOneStocksCoordinator,
+        mock_stocks_response: list[dict],
+    ) -> None:
+        """Test that the symbol index follows the current payload."""
+        assert stocks_coordinator.quotes == {}
+
+        stocks_coordinator.data = await stocks_coordinator._async_update_data()
+        quotes = stocks_coordinator.quotes
+
+        assert quotes["AAPL"].price == 150.00
+        assert set(quotes) == {"AAPL", "GOOGL"}
+        assert stocks_coordinator.quotes is quotes
+
+    @pytest.mark.asyncio
+    async def test_invalid_payload_serves_stale_data(
+        self,
+        stocks_coordinator: FiftyOneStocksCoordinator,
+        mock_api_client: AsyncMock,
+        mock_stocks_response: list[dict],
+    ) -> None:
+        """Test that a payload with an unexpected shape is treated as a failure."""
+        stocks_coordinator.data = await stocks_coordinator._async_update_data()
+        mock_api_client.async_get_stocks.return_value = {"error": "maintenance"}
+
+        data = await stocks_coordinator._async_update_data()
+
+        assert data == parse_stocks(mock_stocks_response)
+        assert stocks_coordinator.stale is True
+
+    def test_seed_parses_persisted_payload(
+        self,
+        stocks_coordinator: FiftyOneStocksCoordinator,
+        mock_stocks_response: list[dict],
+    ) -> None:
+        """Test that a persisted raw payload is parsed when seeding."""
+        assert stocks_coordinator.async_seed(mock_stocks_response, time.time())
+        assert stocks_coordinator.quotes["GOOGL"].quantity == 5
+
+        assert not stocks_coordinator.async_seed({"error": "maintenance"}, time.time())
+
+    def test_seed_past_max_age_rejected(
+        self,
+        stocks_coordinator: FiftyOneStocksCoordinator,
+        mock_stocks_response: list[dict],
+    ) -> None:
+        """Test that a persisted payload past its max age is not served."""
+        fetched_at = time.time() - stocks_coordinator.max_age.total_seconds() - 1
+
+        assert not stocks_coordinator.async_seed(mock_stocks_response, fetched_at)
+        assert stocks_coordinator.data is None
+
+
+class TestListenerNotifications:
+    """Tests for change-aware listener notifications."""
+
+    @pytest.mark.asyncio
+    async def test_only_changed_quotes_notified(
+        self,
+        stocks_coordinator: FiftyOneStocksCoordinator,
+        mock_api_client: AsyncMock,
+        mock_stocks_response: list[dict],
+    ) -> None:
+        """Test that only listeners of a changed symbol are notified."""
+        aapl, googl, whole = MagicMock(), MagicMock(), MagicMock()
+        stocks_coordinator.async_add_listener(aapl, "AAPL")
+        stocks_coordinator.async_add_listener(googl, "GOOGL")
+        stocks_coordinator.async_add_listener(whole)
+        await stocks_coordinator.async_refresh()
+        assert aapl.call_count == googl.call_count == whole.call_count == 1
+
+        mock_api_client.async_get_stocks.return_value = [
+            {**mock_stocks_response[0], "price": 151.00},
+            mock_stocks_response[1],
+        ]
+        await stocks_coordinator.async_refresh()
+
+        assert aapl.call_count == 2
+        assert googl.call_count == 1
+        assert whole.call_count == 2
+
+        await stocks_coordinator.async_refresh()
+
+        assert aapl.call_count == 2
+        assert whole.call_count == 2
+        assert stocks_coordinator.suppressed_updates == 4
+
+    @pytest.mark.asyncio
+    async def test_staleness_change_notifies_all(
+        self,
+        stocks_coordinator: FiftyOneStocksCoordinator,
+        mock_api_client: AsyncMock,
+    ) -> None:
+        """Test that every listener is notified when the data turns stale."""
+        aapl = MagicMock()
+        stocks_coordinator.async_add_listener(aapl, "AAPL")
+        await stocks_coordinator.async_refresh()
+
+        mock_api_client.async_get_stocks.side_effect = FiftyOneApiError("boom")
+        await stocks_coordinator.async_refresh()
+
+        assert stocks_coordinator.stale is True
+        assert aapl.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_history_listeners_notified_on_every_sample(
+        self,
+        stocks_coordinator: FiftyOneStocksCoordinator,
+        mock_api_client: AsyncMock,
+    ) -> None:
+        """Test that history listeners follow fresh samples, not payload changes."""
+        history, whole = MagicMock(), MagicMock()
+        stocks_coordinator.async_add_listener(history, HISTORY_CONTEXT)
+        stocks_coordinator.async_add_listener(whole)
+        await stocks_coordinator.async_refresh()
+        await stocks_coordinator.async_refresh()
+
+        assert history.call_count == 2
+        assert whole.call_count == 1
+
+        mock_api_client.async_get_stocks.side_effect = FiftyOneApiError("boom")
+        await stocks_coordinator.async_refresh()
+        await stocks_coordinator.async_refresh()
+
+        # Only the switch to stale data notifies, no sample was recorded
+        assert history.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_aviation_field_slices(
+        self, mock_api_client: AsyncMock, mock_aviation_response: dict
+    ) -> None:
+        """Test that aviation listeners follow a single field or section."""
+        coordinator = FiftyOneAviationCoordinator(
+            MagicMock(), mock_api_client, timedelta(minutes=1)
+        )
+        oat, age, runway = MagicMock(), MagicMock(), MagicMock()
+        coordinator.async_add_listener(oat, "weather.oat")
+        coordinator.async_add_listener(age, "weather.age")
+        coordinator.async_add_listener(runway, "runway")
+        await coordinator.async_refresh()
+
+        mock_api_client.async_get_aviation_lszi.return_value = {
+            **mock_aviation_response,
+            "weather": {**mock_aviation_response["weather"], "age": 180},
+        }
+        await coordinator.async_refresh()
+
+        assert oat.call_count == 1
+        assert age.call_count == 2
+        assert runway.call_count == 1
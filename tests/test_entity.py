@@ -0,0 +1,109 @@
+"""Tests for the FiftyOne entity helpers."""
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.fiftyone.coordinator import FiftyOneStocksCoordinator
+from custom_components.fiftyone.entity import (
+    FiftyOneCoordinatorEntity,
+    async_sync_entities,
+)
+from custom_components.fiftyone.models import parse_stocks
+
+
+def _entity(symbol: str) -> MagicMock:
+    """Return a mock entity of a symbol."""
+    entity = MagicMock()
+    entity.entity_id = f"sensor.{symbol.lower()}_price"
+    entity.async_remove = AsyncMock()
+    return entity
+
+
+class TestCoordinatorEntity:
+    """Tests for FiftyOneCoordinatorEntity."""
+
+    def test_freshness_attributes(self, mock_api_client: AsyncMock) -> None:
+        """Test that the fetch time of the data is reported, not its age."""
+        coordinator = FiftyOneStocksCoordinator(
+            MagicMock(), mock_api_client, timedelta(minutes=5)
+        )
+        entity = FiftyOneCoordinatorEntity(coordinator)
+
+        assert entity.extra_state_attributes == {"data_fetched_at": None, "stale": False}
+
+        coordinator.last_success = 1_704_067_200.0
+        coordinator.stale = True
+
+        assert entity.extra_state_attributes == {
+            "data_fetched_at": datetime(2024, 1, 1, tzinfo=UTC),
+            "stale": True,
+        }
+
+
+class TestSyncEntities:
+    """Tests for async_sync_entities."""
+
+    def test_entities_follow_keys(
+        self, mock_api_client: AsyncMock, mock_config_entry: MagicMock
+    ) -> None:
+        """Test that only the entities of new and removed keys change."""
+        coordinator = FiftyOneStocksCoordinator(
+            MagicMock(), mock_api_client, timedelta(minutes=5)
+        )
+        coordinator.data = parse_stocks([{"symbol": "AAPL"}, {"symbol": "GOOGL"}])
+        created: dict[str, MagicMock] = {}
+
+        def _create(symbol: str) -> list[MagicMock]:
+            created[symbol] = _entity(symbol)
+            return [created[symbol]]
+
+        add_entities = MagicMock()
+        async_sync_entities(
+            mock_config_entry, coordinator, lambda: coordinator.quotes, _create, add_entities
+        )
+
+        add_entities.assert_called_once_with([created["AAPL"], created["GOOGL"]])
+        mock_config_entry.async_on_unload.assert_called_once()
+
+        # GOOGL is sold and MSFT bought
+        add_entities.reset_mock()
+        coordinator.data = parse_stocks([{"symbol": "AAPL"}, {"symbol": "MSFT"}])
+        coordinator.async_update_listeners()
+
+        add_entities.assert_called_once_with([created["MSFT"]])
+        created["GOOGL"].async_remove.assert_called_once_with()
+        created["AAPL"].async_remove.assert_not_called()
+        assert mock_config_entry.async_create_task.call_count == 1
+        mock_config_entry.async_create_task.call_args[0][1].close()
+
+        # Unchanged symbols add and remove nothing
+        add_entities.reset_mock()
+        coordinator.data = parse_stocks([{"symbol": "AAPL", "price": 1.0}, {"symbol": "MSFT"}])
+        coordinator.async_update_listeners()
+
+        add_entities.assert_not_called()
+        assert mock_config_entry.async_create_task.call_count == 1
+
+    def test_waits_for_data(
+        self, mock_api_client: AsyncMock, mock_config_entry: MagicMock
+    ) -> None:
+        """Test that entities are added once the first refresh brings data."""
+        coordinator = FiftyOneStocksCoordinator(
+            MagicMock(), mock_api_client, timedelta(minutes=5)
+        )
+        add_entities = MagicMock()
+
+        async_sync_entities(
+            mock_config_entry,
+            coordinator,
+            lambda: coordinator.quotes,
+            lambda symbol: [_entity(symbol)],
+            add_entities,
+        )
+        add_entities.assert_not_called()
+
+        coordinator.data = parse_stocks([{"symbol": "AAPL"}])
+        coordinator.async_update_listeners()
+
+        assert len(add_entities.call_args[0][0]) == 1
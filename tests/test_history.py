@@ -0,0 +1,61 @@
+"""Tests for the FiftyOne metric history."""
+from __future__ import annotations
+
+from custom_components.fiftyone.history import FiftyOneHistory
+
+
+def _history(size: int, *samples: tuple[float, float]) -> FiftyOneHistory:
+    """Return a history holding some samples."""
+    history = FiftyOneHistory(size)
+    for when, value in samples:
+        history.append(when, value)
+    return history
+
+
+class TestFiftyOneHistory:
+    """Tests for FiftyOneHistory."""
+
+    def test_empty(self) -> None:
+        """Test that an empty history has no statistics."""
+        history = FiftyOneHistory(4)
+
+        assert len(history) == 0
+        assert history.latest() is None
+        assert history.change(0) is None
+        assert history.maximum(0) is None
+
+    def test_ring_overwrites_oldest(self) -> None:
+        """Test that a full history replaces its oldest samples."""
+        history = _history(3, *((when, when * 10) for when in range(1, 6)))
+
+        assert len(history) == 3
+        assert history.latest() == 50
+        assert history.maximum(0) == 50
+        # Samples 1 and 2 were overwritten, so the history starts at 3
+        assert history.change(2) is None
+        assert history.change(3) == 20
+
+    def test_change_from_last_sample_before(self) -> None:
+        """Test that the change is measured from the last sample before a time."""
+        history = _history(8, (0, 1010.0), (100, 1011.0), (200, 1013.5))
+
+        assert history.change(150) == 2.5
+        assert history.change(100) == 2.5
+        assert history.change(-1) is None
+
+    def test_maximum_within_window(self) -> None:
+        """Test that the maximum only covers samples since a time."""
+        history = _history(8, (0, 30.0), (100, 12.0), (200, 18.0))
+
+        assert history.maximum(50) == 18.0
+        assert history.maximum(300) is None
+
+    def test_covering_keeps_baseline(self) -> None:
+        """Test that a history covering a span keeps the sample before it."""
+        history = FiftyOneHistory.covering(span=3 * 3600, interval=30)
+        for when in range(0, 4 * 3600, 30):
+            history.append(when, when / 30)
+
+        now = 4 * 3600 - 30
+
+        assert history.change(now - 3 * 3600) == 360
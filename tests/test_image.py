@@ -0,0 +1,69 @@
+"""Tests for the FiftyOne image platform."""
+from __future__ import annotations
+
+from collections import Counter
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.fiftyone.image import FiftyOneLatestImage
+
+
+@pytest.fixture
+def latest_image(mock_api_client: AsyncMock, mock_config_entry: MagicMock) -> FiftyOneLatestImage:
+    """Return a latest image entity backed by the mock API client."""
+    data = MagicMock()
+    data.api_client = mock_api_client
+    data.unchanged_images = Counter()
+    entity = FiftyOneLatestImage(MagicMock(), data, mock_config_entry, "family", "Family")
+    entity.entity_id = "image.family_latest"
+    return entity
+
+
+class TestFiftyOneLatestImage:
+    """Tests for the latest image entity."""
+
+    def test_names(self, latest_image: FiftyOneLatestImage) -> None:
+        """Test the entity name and unique ID."""
+        assert latest_image._attr_name == "Family Latest"
+        assert latest_image._attr_unique_id == "test_entry_id_image_family_latest"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_image_not_reloaded(
+        self, latest_image: FiftyOneLatestImage, mock_api_client: AsyncMock
+    ) -> None:
+        """Test that refetching identical content writes no state."""
+        with patch.object(latest_image, "async_write_ha_state") as write_state:
+            assert await latest_image.async_image() == b"\x89PNG\r\n\x1a\n"
+            last_updated = latest_image.image_last_updated
+            latest_image._fetched_at = None
+            await latest_image.async_image()
+
+        assert mock_api_client.async_get_latest_image.call_count == 2
+        write_state.assert_called_once()
+        assert latest_image.image_last_updated == last_updated
+        assert latest_image._data.unchanged_images == {"image.family_latest": 1}
+
+    @pytest.mark.asyncio
+    async def test_changed_image_reloaded(
+        self, latest_image: FiftyOneLatestImage, mock_api_client: AsyncMock
+    ) -> None:
+        """Test that new content updates the image."""
+        with patch.object(latest_image, "async_write_ha_state") as write_state:
+            await latest_image.async_image()
+            latest_image._fetched_at = None
+            mock_api_client.async_get_latest_image.return_value = b"new image"
+            assert await latest_image.async_image() == b"new image"
+
+        assert write_state.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_within_duration(
+        self, latest_image: FiftyOneLatestImage, mock_api_client: AsyncMock
+    ) -> None:
+        """Test that the image is not refetched within the cache duration."""
+        with patch.object(latest_image, "async_write_ha_state"):
+            await latest_image.async_image()
+            await latest_image.async_image()
+
+        mock_api_client.async_get_latest_image.assert_called_once()
@@ -0,0 +1,52 @@
+"""Tests for the FiftyOne image helpers."""
+from __future__ import annotations
+
+import io
+
+from PIL import Image
+import pytest
+
+from custom_components.fiftyone.imaging import fit_size, resize_image
+
+
+def _jpeg(width: int, height: int) -> bytes:
+    """Return a JPEG image of the given size."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "navy").save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    ("width", "height", "expected"),
+    [
+        (320, None, (320, 180)),
+        (None, 90, (160, 90)),
+        (320, 90, (160, 90)),
+        (1920, None, None),
+        (None, None, None),
+    ],
+)
+def test_fit_size(width: int | None, height: int | None, expected: tuple | None) -> None:
+    """Test that the aspect ratio is kept and images are never upscaled."""
+    assert fit_size((1280, 720), width, height) == expected
+
+
+def test_resize_image() -> None:
+    """Test downscaling a frame."""
+    resized = resize_image(_jpeg(1280, 720), 320, None)
+
+    with Image.open(io.BytesIO(resized)) as img:
+        assert img.size == (320, 180)
+        assert img.format == "JPEG"
+
+
+def test_resize_image_already_fits() -> None:
+    """Test that a frame within the requested size is returned unchanged."""
+    image = _jpeg(160, 90)
+
+    assert resize_image(image, 320, 180) is image
+
+
+def test_resize_invalid_image() -> None:
+    """Test that data that is not an image is returned unchanged."""
+    assert resize_image(b"not an image", 320, 180) == b"not an image"
@@ -0,0 +1,121 @@
+"""Tests for the FiftyOne data models."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from custom_components.fiftyone.models import (
+    parse_aviation,
+    parse_oilprice,
+    parse_stocks,
+    parse_webcams,
+    summarize_portfolio,
+)
+
+
+class TestParsing:
+    """Tests for the payload parsers."""
+
+    def test_parse_stocks(self, mock_stocks_response: list[dict]) -> None:
+        """Test that quotes are keyed by symbol and entries without one skipped."""
+        quotes = parse_stocks([*mock_stocks_response, {"name": "no symbol"}, "junk"])
+
+        assert list(quotes) == ["AAPL", "GOOGL"]
+        assert quotes["AAPL"].name == "Apple Inc."
+        assert quotes["AAPL"].value == 1500.00
+
+    def test_parse_stocks_invalid_field(self) -> None:
+        """Test that a field with an unexpected type is parsed as None."""
+        quotes = parse_stocks([{"symbol": "AAPL", "price": "n/a", "quantity": True}])
+
+        assert quotes["AAPL"].price is None
+        assert quotes["AAPL"].quantity is None
+
+    def test_parse_aviation(self, mock_aviation_response: dict) -> None:
+        """Test that the timestamp is converted once at parse time."""
+        data = parse_aviation(mock_aviation_response)
+
+        assert data.weather.oat == 15.5
+        assert data.weather.timestamp == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert data.runway.status == 1
+        assert data.runway.text == "Runway open"
+
+    def test_parse_aviation_missing_sections(self) -> None:
+        """Test that missing sections parse as empty models."""
+        data = parse_aviation({"weather": None})
+
+        assert data.weather.oat is None
+        assert data.weather.timestamp is None
+        assert data.runway.status is None
+
+    def test_parse_webcams(self, mock_webcams_response: dict) -> None:
+        """Test that webcams without an image are left out."""
+        webcams = parse_webcams(mock_webcams_response)
+
+        assert set(webcams.urls) == {"basel", "bern", "lucern"}
+
+    def test_parse_oilprice(self) -> None:
+        """Test parsing the oil price."""
+        oilprice = parse_oilprice({"price": 112.5, "date": "2024-01-01"})
+
+        assert oilprice.price == 112.5
+        assert oilprice.date == "2024-01-01"
+
+    @pytest.mark.parametrize(
+        ("parser", "payload"),
+        [
+            (parse_stocks, {"error": "maintenance"}),
+            (parse_webcams, []),
+            (parse_oilprice, None),
+            (parse_aviation, "maintenance"),
+        ],
+    )
+    def test_unexpected_shape_raises(self, parser, payload) -> None:
+        """Test that a payload with an unexpected shape raises ValueError."""
+        with pytest.raises(ValueError):
+            parser(payload)
+
+    def test_models_use_slots(self, mock_stocks_response: list[dict]) -> None:
+        """Test that the models do not carry a per-instance dict."""
+        quote = parse_stocks(mock_stocks_response)["AAPL"]
+
+        assert not hasattr(quote, "__dict__")
+
+
+class TestPortfolioSummary:
+    """Tests for summarize_portfolio."""
+
+    def test_summary(self, mock_stocks_response: list[dict]) -> None:
+        """Test the total, allocation, largest position and weighted change."""
+        quotes = parse_stocks(mock_stocks_response)
+
+        # AAPL: 10 x 150 (+5 today), GOOGL: 5 x 140 (-4 today)
+        summary = summarize_portfolio(quotes, {"AAPL": 5.0, "GOOGL": -4.0})
+
+        assert summary.total_value == 2200.0
+        assert summary.allocation == pytest.approx({"AAPL": 1500 / 22, "GOOGL": 700 / 22})
+        assert summary.largest is quotes["AAPL"]
+        assert summary.change == 30.0
+        assert summary.change_percent == pytest.approx(30 / 2170 * 100)
+
+    def test_unknown_changes(self, mock_stocks_response: list[dict]) -> None:
+        """Test that only positions with a known change are weighted."""
+        summary = summarize_portfolio(
+            parse_stocks(mock_stocks_response), {"AAPL": None, "GOOGL": -4.0}
+        )
+
+        assert summary.change == -20.0
+        assert summary.change_percent == pytest.approx(-20 / 720 * 100)
+
+        summary = summarize_portfolio(parse_stocks(mock_stocks_response), {})
+        assert summary.change is None
+        assert summary.change_percent is None
+
+    def test_empty(self) -> None:
+        """Test the summary of an empty portfolio."""
+        summary = summarize_portfolio({}, {})
+
+        assert summary.total_value == 0
+        assert summary.allocation == {}
+        assert summary.largest is None
@@ -0,0 +1,234 @@
+"""Tests for the FiftyOne refresh schedules."""
+from __future__ import annotations
+
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.fiftyone.models import AviationData, parse_aviation, parse_stocks
+from custom_components.fiftyone.scheduler import (
+    AVIATION_POLL_MARGIN,
+    SESSION_POLL_MARGIN,
+    US_SESSION,
+    FiftyOneAviationSchedule,
+    FiftyOneStocksSchedule,
+    parse_holidays,
+    trading_session,
+)
+
+NOW = 1_704_067_200.0
+NEW_YORK = ZoneInfo("America/New_York")
+ZURICH = ZoneInfo("Europe/Zurich")
+
+
+def _observation(timestamp: float, age: float | None = None, oat: float = 15.5) -> AviationData:
+    """Return aviation data with a weather observation."""
+    return parse_aviation(
+        {"weather": {"timestamp": timestamp, "age": age, "oat": oat}, "runway": {}}
+    )
+
+
+class TestFiftyOneAviationSchedule:
+    """Tests for FiftyOneAviationSchedule."""
+
+    def test_initial_interval_until_cadence_known(self) -> None:
+        """Test that polls use the initial interval until the cadence is known."""
+        schedule = FiftyOneAviationSchedule(30, 900, 60)
+
+        assert schedule.next_interval(_observation(NOW - 10, age=10), NOW) == 60
+        assert schedule.cadence is None
+
+    def test_poll_after_next_observation_due(self) -> None:
+        """Test that the next poll follows the observed cadence."""
+        schedule = FiftyOneAviationSchedule(30, 900, 60)
+        schedule.next_interval(_observation(NOW - 600), NOW - 590)
+
+        # The observation is 20 seconds old; the next one is due in 280
+        delay = schedule.next_interval(_observation(NOW, age=20), NOW + 20)
+
+        assert schedule.cadence == 600
+        assert delay == 600 - 20 + AVIATION_POLL_MARGIN
+
+    def test_age_used_over_timestamp(self) -> None:
+        """Test that the age decides when the observation was made."""
+        schedule = FiftyOneAviationSchedule(30, 900, 60)
+        schedule.next_interval(_observation(NOW - 600), NOW)
+
+        # The local clock is an hour ahead of the API's
+        delay = schedule.next_interval(_observation(NOW, age=100), NOW + 3600)
+
+        assert delay == 600 - 100 + AVIATION_POLL_MARGIN
+
+    def test_unchanged_observation_backs_off(self) -> None:
+        """Test that polls finding the same overdue observation back off."""
+        schedule = FiftyOneAviationSchedule(30, 900, 60)
+        schedule.next_interval(_observation(NOW - 600), NOW - 600)
+        schedule.next_interval(_observation(NOW), NOW)
+
+        delays = [
+            schedule.next_interval(_observation(NOW, age=age), NOW + age)
+            for age in (700, 730, 790, 910, 1150, 1630)
+        ]
+
+        assert delays == [60, 120, 240, 480, 900, 900]
+        assert schedule.unchanged == 6
+
+    def test_long_run_of_unchanged_polls(self) -> None:
+        """Test that the back off stays at the maximum however long it lasts."""
+        schedule = FiftyOneAviationSchedule(30, 900, 60.0)
+        data = parse_aviation({"weather": {}, "runway": {}})
+
+        delays = [schedule.next_interval(data, NOW + poll * 900) for poll in range(2000)]
+
+        assert schedule.unchanged == 1999
+        assert delays[-1] == 900
+
+    def test_new_observation_resets_backoff(self) -> None:
+        """Test that a new observation ends the back off."""
+        schedule = FiftyOneAviationSchedule(30, 900, 60)
+        schedule.next_interval(_observation(NOW - 600), NOW - 600)
+        schedule.next_interval(_observation(NOW), NOW)
+        schedule.next_interval(_observation(NOW, age=700), NOW + 700)
+
+        delay = schedule.next_interval(_observation(NOW + 720, age=5), NOW + 725)
+
+        assert schedule.unchanged == 0
+        assert schedule.cadence == 660
+        assert delay == 660 - 5 + AVIATION_POLL_MARGIN
+
+    def test_bounds(self) -> None:
+        """Test that delays stay within the minimum and maximum interval."""
+        schedule = FiftyOneAviationSchedule(120, 300, 60)
+
+        assert schedule.next_interval(_observation(NOW), NOW) == 120
+
+        schedule.next_interval(_observation(NOW + 3600), NOW + 3600)
+        assert schedule.next_interval(_observation(NOW + 7200, age=0), NOW + 7200) == 300
+
+    def test_observation_without_timestamp(self) -> None:
+        """Test that observations without a timestamp are told apart by value."""
+        schedule = FiftyOneAviationSchedule(30, 900, 60)
+        data = parse_aviation({"weather": {"oat": 15.5, "age": 10}, "runway": {}})
+        changed = parse_aviation({"weather": {"oat": 16.0, "age": 10}, "runway": {}})
+
+        schedule.next_interval(data, NOW)
+        schedule.next_interval(
+            parse_aviation({"weather": {"oat": 15.5, "age": 70}, "runway": {}}), NOW + 60
+        )
+        assert schedule.unchanged == 1
+
+        schedule.next_interval(changed, NOW + 120)
+        assert schedule.unchanged == 0
+        assert schedule.cadence is None
+
+
+def _portfolio(*symbols: str) -> dict:
+    """Return parsed stock quotes for some symbols."""
+    return parse_stocks([{"symbol": symbol, "price": 1.0} for symbol in symbols])
+
+
+def _at(zone: ZoneInfo, *args: int) -> float:
+    """Return the epoch time of a local time in a time zone."""
+    return datetime(*args, tzinfo=zone).timestamp()
+
+
+class TestTradingSessions:
+    """Tests for the trading session helpers."""
+
+    @pytest.mark.parametrize(
+        ("symbol", "name"),
+        [
+            ("AAPL", "US"),
+            ("BRK.B", "US"),
+            ("NESN.SW", "SIX"),
+            ("SAP.de", "Xetra"),
+            ("7203.T", "TSE"),
+        ],
+    )
+    def test_trading_session(self, symbol: str, name: str) -> None:
+        """Test that symbols map to the session of their exchange."""
+        assert trading_session(symbol).name == name
+
+    @pytest.mark.parametrize("symbol", ["BTC-USD", "EURCHF=X", "ABC.XX"])
+    def test_around_the_clock(self, symbol: str) -> None:
+        """Test that pairs and unknown exchanges have no session."""
+        assert trading_session(symbol) is None
+
+    def test_next_transition_over_weekend(self) -> None:
+        """Test that a session closed on Friday next opens on Monday."""
+        friday_evening = _at(NEW_YORK, 2026, 10, 16, 18, 0)
+
+        assert US_SESSION.next_transition(friday_evening, frozenset()) == (
+            False,
+            _at(NEW_YORK, 2026, 10, 19, 9, 30),
+        )
+
+    def test_parse_holidays(self) -> None:
+        """Test that holidays are parsed from text or a list."""
+        assert parse_holidays("2026-12-25, 2026-12-24 2026-12-25") == [
+            date(2026, 12, 24),
+            date(2026, 12, 25),
+        ]
+        assert parse_holidays(["2026-01-01"]) == [date(2026, 1, 1)]
+        with pytest.raises(ValueError):
+            parse_holidays("christmas")
+
+
+class TestFiftyOneStocksSchedule:
+    """Tests for FiftyOneStocksSchedule."""
+
+    def test_open_interval_while_open(self) -> None:
+        """Test that an open exchange is polled at the open interval."""
+        schedule = FiftyOneStocksSchedule(30, 300)
+
+        assert schedule.next_interval(_portfolio("AAPL"), _at(NEW_YORK, 2026, 10, 16, 11)) == 300
+
+    def test_poll_after_close(self) -> None:
+        """Test that the last poll of a session falls just after its close."""
+        schedule = FiftyOneStocksSchedule(30, 300)
+
+        delay = schedule.next_interval(_portfolio("AAPL"), _at(NEW_YORK, 2026, 10, 16, 15, 58))
+
+        assert delay == 120 + SESSION_POLL_MARGIN
+
+    def test_closed_polls_at_next_open(self) -> None:
+        """Test that a closed exchange is polled once, after the next open."""
+        schedule = FiftyOneStocksSchedule(30, 300)
+        now = _at(NEW_YORK, 2026, 10, 16, 16, 1)
+
+        delay = schedule.next_interval(_portfolio("AAPL"), now)
+
+        assert delay == _at(NEW_YORK, 2026, 10, 19, 9, 30) - now + SESSION_POLL_MARGIN
+
+    def test_closed_interval(self) -> None:
+        """Test that a closed interval keeps polling while closed."""
+        schedule = FiftyOneStocksSchedule(30, 300, closed_interval=3600)
+
+        assert schedule.next_interval(_portfolio("AAPL"), _at(NEW_YORK, 2026, 10, 17, 12)) == 3600
+
+    def test_holidays(self) -> None:
+        """Test that holidays are closed."""
+        schedule = FiftyOneStocksSchedule(30, 300, holidays=[date(2026, 12, 25)])
+        now = _at(NEW_YORK, 2026, 12, 24, 17)
+
+        delay = schedule.next_interval(_portfolio("AAPL"), now)
+
+        assert delay == _at(NEW_YORK, 2026, 12, 28, 9, 30) - now + SESSION_POLL_MARGIN
+
+    def test_earliest_exchange_wins(self) -> None:
+        """Test that the exchange needing the next poll decides."""
+        schedule = FiftyOneStocksSchedule(30, 300)
+        # SIX is open, New York opens in the afternoon
+        now = _at(ZURICH, 2026, 10, 16, 10)
+
+        assert schedule.next_interval(_portfolio("AAPL", "NESN.SW"), now) == 300
+        assert schedule.stats["sessions"] == ["SIX", "US"]
+
+    def test_around_the_clock_symbols(self) -> None:
+        """Test that a crypto pair keeps the portfolio polled on weekends."""
+        schedule = FiftyOneStocksSchedule(30, 300)
+
+        assert schedule.next_interval(
+            _portfolio("AAPL", "BTC-USD"), _at(NEW_YORK, 2026, 10, 17, 12)
+        ) == 300
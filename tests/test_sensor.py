@@ -1,39 +1,71 @@
 """Tests for the FiftyOne sensor platform."""
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from custom_components.fiftyone.history import FiftyOneHistory
+from custom_components.fiftyone.models import (
+    parse_aviation,
+    parse_stocks,
+    summarize_portfolio,
+)
 from custom_components.fiftyone.sensor import (
-    FiftyOneAviationCloudBaseSensor,
-    FiftyOneAviationDensityAltitudeSensor,
-    FiftyOneAviationHumiditySensor,
-    FiftyOneAviationPressureAltitudeSensor,
-    FiftyOneAviationPressureSensor,
-    FiftyOneAviationTemperatureSensor,
-    FiftyOneAviationWindDirectionSensor,
-    FiftyOneAviationWindSpeedSensor,
-    FiftyOneRunwayAdditionalSensor,
-    FiftyOneRunwayStatusSensor,
-    FiftyOneRunwayTextSensor,
-    FiftyOneStockPriceSensor,
-    FiftyOneStockQuantitySensor,
-    FiftyOneStockValueSensor,
+    AVIATION_SENSORS,
+    AVIATION_TREND_SENSORS,
+    OIL_PRICE_TREND_SENSORS,
+    PORTFOLIO_SENSORS,
+    STOCK_SENSORS,
+    STOCK_TREND_SENSORS,
+    FiftyOneSensor,
+    FiftyOnePortfolioSensor,
+    FiftyOneSensorEntityDescription,
+    FiftyOneStockSensor,
+    FiftyOneStockTrendSensor,
+    FiftyOneTrendSensor,
 )
 
 
+def _description(
+    descriptions: tuple[FiftyOneSensorEntityDescription, ...], key: str
+) -> FiftyOneSensorEntityDescription:
+    """Return the sensor description with the given key."""
+    return next(description for description in descriptions if description.key == key)
+
+
+def _aviation_sensor(
+    coordinator: MagicMock, entry: MagicMock, key: str
+) -> FiftyOneSensor:
+    """Return the LSZI sensor with the given key."""
+    return FiftyOneSensor(
+        coordinator, entry, _description(AVIATION_SENSORS, f"aviation_lszi_{key}")
+    )
+
+
+def _stock_sensor(
+    coordinator: MagicMock, entry: MagicMock, symbol: str, key: str
+) -> FiftyOneStockSensor:
+    """Return the stock sensor of a symbol with the given key."""
+    return FiftyOneStockSensor(
+        coordinator, entry, symbol, _description(STOCK_SENSORS, key)
+    )
+
+
 @pytest.fixture
-def mock_coordinator(
-    mock_stocks_response: list[dict],
-    mock_aviation_response: dict,
-) -> MagicMock:
-    """Return a mock coordinator with data."""
+def mock_stocks_coordinator(mock_stocks_response: list[dict]) -> MagicMock:
+    """Return a mock stocks coordinator with data."""
     coordinator = MagicMock()
-    coordinator.data = {
-        "stocks": mock_stocks_response,
-        "aviation": mock_aviation_response,
-    }
+    coordinator.quotes = parse_stocks(mock_stocks_response)
+    return coordinator
+
+
+@pytest.fixture
+def mock_coordinator(mock_aviation_response: dict) -> MagicMock:
+    """Return a mock aviation coordinator with data."""
+    coordinator = MagicMock()
+    coordinator.data = parse_aviation(mock_aviation_response)
     return coordinator
 
 
@@ -49,20 +81,20 @@ class TestStockSensors:
     """Tests for stock sensors."""
 
     def test_stock_price_sensor(
-        self, mock_coordinator: MagicMock, mock_entry: MagicMock
+        self, mock_stocks_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test stock price sensor."""
-        sensor = FiftyOneStockPriceSensor(mock_coordinator, mock_entry, "AAPL")
+        sensor = _stock_sensor(mock_stocks_coordinator, mock_entry, "AAPL", "price")
 
         assert sensor.native_value == 150.00
         assert sensor.name == "AAPL Price"
         assert sensor.unique_id == "test_entry_stock_AAPL_price"
 
     def test_stock_value_sensor(
-        self, mock_coordinator: MagicMock, mock_entry: MagicMock
+        self, mock_stocks_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test stock value sensor."""
-        sensor = FiftyOneStockValueSensor(mock_coordinator, mock_entry, "AAPL")
+        sensor = _stock_sensor(mock_stocks_coordinator, mock_entry, "AAPL", "value")
 
         assert sensor.native_value == 1500.00
         assert sensor.name == "AAPL Value"
@@ -74,19 +106,19 @@ class TestStockSensors:
         assert attrs["price"] == 150.00
 
     def test_stock_quantity_sensor(
-        self, mock_coordinator: MagicMock, mock_entry: MagicMock
+        self, mock_stocks_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test stock quantity sensor."""
-        sensor = FiftyOneStockQuantitySensor(mock_coordinator, mock_entry, "AAPL")
+        sensor = _stock_sensor(mock_stocks_coordinator, mock_entry, "AAPL", "quantity")
 
         assert sensor.native_value == 10
         assert sensor.name == "AAPL Quantity"
 
     def test_stock_sensor_unknown_symbol(
-        self, mock_coordinator: MagicMock, mock_entry: MagicMock
+        self, mock_stocks_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test stock sensor with unknown symbol."""
-        sensor = FiftyOneStockPriceSensor(mock_coordinator, mock_entry, "UNKNOWN")
+        sensor = _stock_sensor(mock_stocks_coordinator, mock_entry, "UNKNOWN", "price")
 
         assert sensor.native_value is None
 
@@ -98,7 +130,7 @@ class TestAviationSensors:
         self, mock_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test aviation temperature sensor."""
-        sensor = FiftyOneAviationTemperatureSensor(mock_coordinator, mock_entry)
+        sensor = _aviation_sensor(mock_coordinator, mock_entry, "oat")
 
         assert sensor.native_value == 15.5
         assert sensor.name == "LSZI Temperature"
@@ -107,7 +139,7 @@ class TestAviationSensors:
         self, mock_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test aviation humidity sensor."""
-        sensor = FiftyOneAviationHumiditySensor(mock_coordinator, mock_entry)
+        sensor = _aviation_sensor(mock_coordinator, mock_entry, "humidity")
 
         assert sensor.native_value == 65.0
         assert sensor.name == "LSZI Humidity"
@@ -116,7 +148,7 @@ class TestAviationSensors:
         self, mock_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test aviation pressure sensor."""
-        sensor = FiftyOneAviationPressureSensor(mock_coordinator, mock_entry)
+        sensor = _aviation_sensor(mock_coordinator, mock_entry, "pressure")
 
         assert sensor.native_value == 1013.25
         assert sensor.name == "LSZI Pressure"
@@ -125,7 +157,7 @@ class TestAviationSensors:
         self, mock_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test aviation wind speed sensor."""
-        sensor = FiftyOneAviationWindSpeedSensor(mock_coordinator, mock_entry)
+        sensor = _aviation_sensor(mock_coordinator, mock_entry, "wind_kt")
 
         assert sensor.native_value == 8.1
         assert sensor.name == "LSZI Wind Speed"
@@ -134,7 +166,7 @@ class TestAviationSensors:
         self, mock_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test aviation wind direction sensor."""
-        sensor = FiftyOneAviationWindDirectionSensor(mock_coordinator, mock_entry)
+        sensor = _aviation_sensor(mock_coordinator, mock_entry, "wind_dir")
 
         assert sensor.native_value == 270
         assert sensor.name == "LSZI Wind Direction"
@@ -143,7 +175,7 @@ class TestAviationSensors:
         self, mock_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test aviation cloud base sensor."""
-        sensor = FiftyOneAviationCloudBaseSensor(mock_coordinator, mock_entry)
+        sensor = _aviation_sensor(mock_coordinator, mock_entry, "cloud_base")
 
         assert sensor.native_value == 3500
         assert sensor.name == "LSZI Cloud Base"
@@ -152,7 +184,7 @@ class TestAviationSensors:
         self, mock_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test aviation density altitude sensor."""
-        sensor = FiftyOneAviationDensityAltitudeSensor(mock_coordinator, mock_entry)
+        sensor = _aviation_sensor(mock_coordinator, mock_entry, "da")
 
         assert sensor.native_value == 2100
         assert sensor.name == "LSZI Density Altitude"
@@ -161,7 +193,7 @@ class TestAviationSensors:
         self, mock_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test aviation pressure altitude sensor."""
-        sensor = FiftyOneAviationPressureAltitudeSensor(mock_coordinator, mock_entry)
+        sensor = _aviation_sensor(mock_coordinator, mock_entry, "pa")
 
         assert sensor.native_value == 1650
         assert sensor.name == "LSZI Pressure Altitude"
@@ -174,7 +206,7 @@ class TestRunwaySensors:
         self, mock_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test runway status sensor returns numeric value."""
-        sensor = FiftyOneRunwayStatusSensor(mock_coordinator, mock_entry)
+        sensor = _aviation_sensor(mock_coordinator, mock_entry, "runway_status")
 
         assert sensor.native_value == 1
         assert sensor.name == "LSZI Runway Status"
@@ -186,20 +218,18 @@ class TestRunwaySensors:
         """Test runway status sensor with different values."""
         for status in [0, 1, 2, 3]:
             coordinator = MagicMock()
-            coordinator.data = {
-                "aviation": {
-                    "runway": {"status": status, "altitude": 1575},
-                }
-            }
-            sensor = FiftyOneRunwayStatusSensor(coordinator, mock_entry)
+            coordinator.data = parse_aviation(
+                {"runway": {"status": status, "altitude": 1575}}
+            )
+            sensor = _aviation_sensor(coordinator, mock_entry, "runway_status")
             assert sensor.native_value == status
 
     def test_runway_status_empty_data(self, mock_entry: MagicMock) -> None:
         """Test runway status sensor with empty data."""
         coordinator = MagicMock()
-        coordinator.data = {"aviation": {}}
+        coordinator.data = parse_aviation({})
 
-        sensor = FiftyOneRunwayStatusSensor(coordinator, mock_entry)
+        sensor = _aviation_sensor(coordinator, mock_entry, "runway_status")
 
         assert sensor.native_value is None
 
@@ -207,7 +237,7 @@ class TestRunwaySensors:
         self, mock_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test runway text sensor."""
-        sensor = FiftyOneRunwayTextSensor(mock_coordinator, mock_entry)
+        sensor = _aviation_sensor(mock_coordinator, mock_entry, "runway_text")
 
         assert sensor.native_value == "Runway open"
         assert sensor.name == "LSZI Runway Text"
@@ -217,13 +247,11 @@ class TestRunwaySensors:
     ) -> None:
         """Test runway additional sensor."""
         coordinator = MagicMock()
-        coordinator.data = {
-            "aviation": {
-                "runway": {"status": 1, "additional": "PPR weekends"},
-            }
-        }
+        coordinator.data = parse_aviation(
+            {"runway": {"status": 1, "additional": "PPR weekends"}}
+        )
 
-        sensor = FiftyOneRunwayAdditionalSensor(coordinator, mock_entry)
+        sensor = _aviation_sensor(coordinator, mock_entry, "runway_additional")
 
         assert sensor.native_value == "PPR weekends"
         assert sensor.name == "LSZI Runway Additional"
@@ -232,6 +260,169 @@ class TestRunwaySensors:
         self, mock_coordinator: MagicMock, mock_entry: MagicMock
     ) -> None:
         """Test runway additional sensor with no data."""
-        sensor = FiftyOneRunwayAdditionalSensor(mock_coordinator, mock_entry)
+        sensor = _aviation_sensor(mock_coordinator, mock_entry, "runway_additional")
+
+        assert sensor.native_value is None
+
+    def test_runway_status_no_data(self, mock_entry: MagicMock) -> None:
+        """Test runway status sensor before the first refresh."""
+        coordinator = MagicMock()
+        coordinator.data = None
+
+        sensor = _aviation_sensor(coordinator, mock_entry, "runway_status")
+
+        assert sensor.native_value is None
+
+
+def _trend_coordinator(metric: str, *samples: tuple[float, float]) -> MagicMock:
+    """Return a mock coordinator with the history of one metric.
+
+    Sample times are seconds before now.
+    """
+    history = FiftyOneHistory(16)
+    now = time.time()
+    for ago, value in samples:
+        history.append(now - ago, value)
+    coordinator = MagicMock()
+    coordinator.history = {metric: history}
+    return coordinator
+
+
+class TestTrendSensors:
+    """Tests for sensors derived from the metric history."""
+
+    def test_pressure_tendency(self, mock_entry: MagicMock) -> None:
+        """Test the 3 hour pressure tendency."""
+        coordinator = _trend_coordinator(
+            "weather.hpa", (4 * 3600, 1009.0), (3 * 3600 + 60, 1010.0), (60, 1012.5)
+        )
+
+        sensor = FiftyOneTrendSensor(
+            coordinator,
+            mock_entry,
+            _description(AVIATION_TREND_SENSORS, "aviation_lszi_pressure_tendency"),
+        )
+
+        assert sensor.native_value == 2.5
+
+    def test_pressure_tendency_short_history(self, mock_entry: MagicMock) -> None:
+        """Test that the tendency is unknown until the history covers 3 hours."""
+        coordinator = _trend_coordinator("weather.hpa", (3600, 1010.0), (60, 1012.5))
+
+        sensor = FiftyOneTrendSensor(
+            coordinator,
+            mock_entry,
+            _description(AVIATION_TREND_SENSORS, "aviation_lszi_pressure_tendency"),
+        )
+
+        assert sensor.native_value is None
+
+    def test_gust_max(self, mock_entry: MagicMock) -> None:
+        """Test the maximum gust over the last hour."""
+        coordinator = _trend_coordinator(
+            "weather.gust_kt", (7200, 40.0), (1800, 22.0), (60, 15.0)
+        )
+
+        sensor = FiftyOneTrendSensor(
+            coordinator,
+            mock_entry,
+            _description(AVIATION_TREND_SENSORS, "aviation_lszi_gust_max_1h"),
+        )
+
+        assert sensor.native_value == 22.0
+
+    def test_oil_price_change(self, mock_entry: MagicMock) -> None:
+        """Test the oil price change over a day."""
+        coordinator = _trend_coordinator("price", (30 * 3600, 110.0), (60, 107.5))
+
+        sensor = FiftyOneTrendSensor(
+            coordinator, mock_entry, _description(OIL_PRICE_TREND_SENSORS, "oilprice_change_24h")
+        )
+
+        assert sensor.native_value == -2.5
+
+    def test_stock_change_today(self, mock_entry: MagicMock) -> None:
+        """Test the change of a stock since the last price before today."""
+        coordinator = _trend_coordinator("AAPL", (7200, 150.0), (3600, 152.0), (60, 153.0))
+
+        sensor = FiftyOneStockTrendSensor(
+            coordinator, mock_entry, "AAPL", _description(STOCK_TREND_SENSORS, "change_today")
+        )
+        start_of_day = MagicMock(return_value=MagicMock(timestamp=lambda: time.time() - 5000))
+        with patch(
+            "custom_components.fiftyone.sensor.dt_util.start_of_local_day", start_of_day
+        ):
+            assert sensor.native_value == 3.0
+        assert sensor.name == "AAPL Change Today"
+
+    def test_no_history(self, mock_entry: MagicMock) -> None:
+        """Test that a metric without history has no state."""
+        coordinator = MagicMock()
+        coordinator.history = {}
+
+        sensor = FiftyOneStockTrendSensor(
+            coordinator, mock_entry, "AAPL", _description(STOCK_TREND_SENSORS, "change_today")
+        )
+
+        assert sensor.native_value is None
+
+
+class TestPortfolioSensors:
+    """Tests for the portfolio sensors."""
+
+    @pytest.fixture
+    def portfolio_coordinator(self, mock_stocks_response: list[dict]) -> MagicMock:
+        """Return a mock stocks coordinator with a portfolio summary."""
+        coordinator = MagicMock()
+        coordinator.data = parse_stocks(mock_stocks_response)
+        coordinator.portfolio = summarize_portfolio(coordinator.data, {"AAPL": 5.0})
+        return coordinator
+
+    def test_total_value(
+        self, portfolio_coordinator: MagicMock, mock_entry: MagicMock
+    ) -> None:
+        """Test the total value with the allocation attribute."""
+        sensor = FiftyOnePortfolioSensor(
+            portfolio_coordinator, mock_entry, _description(PORTFOLIO_SENSORS, "portfolio_value")
+        )
+
+        assert sensor.native_value == 2200.0
+        assert sensor.extra_state_attributes["allocation"] == {"AAPL": 68.18, "GOOGL": 31.82}
+
+    def test_largest_position(
+        self, portfolio_coordinator: MagicMock, mock_entry: MagicMock
+    ) -> None:
+        """Test the largest position."""
+        sensor = FiftyOnePortfolioSensor(
+            portfolio_coordinator,
+            mock_entry,
+            _description(PORTFOLIO_SENSORS, "portfolio_largest_position"),
+        )
+
+        assert sensor.native_value == "AAPL"
+        assert sensor.extra_state_attributes["value"] == 1500.0
+        assert sensor.extra_state_attributes["allocation"] == 68.18
+
+    def test_change_today(
+        self, portfolio_coordinator: MagicMock, mock_entry: MagicMock
+    ) -> None:
+        """Test the weighted change of the portfolio."""
+        sensor = FiftyOnePortfolioSensor(
+            portfolio_coordinator,
+            mock_entry,
+            _description(PORTFOLIO_SENSORS, "portfolio_change_today"),
+        )
+
+        assert sensor.native_value == pytest.approx(50 / 1450 * 100)
+        assert sensor.extra_state_attributes["change"] == 50.0
+
+    def test_no_data(self, mock_entry: MagicMock) -> None:
+        """Test portfolio sensors before the first refresh."""
+        coordinator = MagicMock()
+        coordinator.data = None
+
+        sensor = FiftyOnePortfolioSensor(
+            coordinator, mock_entry, _description(PORTFOLIO_SENSORS, "portfolio_value")
+        )
 
         assert sensor.native_value is None
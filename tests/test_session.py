@@ -0,0 +1,54 @@
+"""Tests for the FiftyOne dedicated session."""
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+from aiohttp import hdrs, web
+import pytest
+
+from custom_components.fiftyone.session import (
+    FiftyOneConnectionStats,
+    async_create_session,
+)
+
+
+@pytest.fixture
+async def server_url() -> AsyncGenerator[str, None]:
+    """Serve a small JSON endpoint on localhost and return its URL."""
+
+    async def _handler(request: web.Request) -> web.Response:
+        return web.json_response({"encoding": request.headers.get(hdrs.ACCEPT_ENCODING)})
+
+    app = web.Application()
+    app.router.add_get("/oilprice", _handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    yield f"http://127.0.0.1:{port}/oilprice"
+    await runner.cleanup()
+
+
+class TestDedicatedSession:
+    """Tests for the dedicated session."""
+
+    @pytest.mark.asyncio
+    async def test_connections_reused(self, server_url: str) -> None:
+        """Test that sequential requests share one kept-alive connection."""
+        stats = FiftyOneConnectionStats()
+        session = async_create_session(stats)
+        try:
+            for _ in range(3):
+                async with session.get(server_url) as response:
+                    payload = await response.json()
+        finally:
+            await session.close()
+
+        assert payload["encoding"].startswith("gzip, deflate")
+        assert stats.as_dict == {
+            "created": 1,
+            "reused": 2,
+            "queued": 0,
+            "reuse_ratio": 0.667,
+        }
@@ -0,0 +1,44 @@
+"""Tests for the FiftyOne snapshot store."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from custom_components.fiftyone.const import SNAPSHOT_SAVE_DELAY
+from custom_components.fiftyone.snapshot import FiftyOneSnapshotStore
+
+
+class TestFiftyOneSnapshotStore:
+    """Tests for FiftyOneSnapshotStore."""
+
+    def test_save_only_changed_payloads(self) -> None:
+        """Test that unchanged payloads do not schedule a save."""
+        with patch("custom_components.fiftyone.snapshot.Store") as store_class:
+            snapshot = FiftyOneSnapshotStore(MagicMock(), "test_entry")
+        store = store_class.return_value
+        payload = {"price": 110.5}
+
+        snapshot.async_update("oilprice", payload)
+        snapshot.async_update("oilprice", payload)
+        snapshot.async_update("oilprice", {"price": 110.5})
+
+        store.async_delay_save.assert_called_once()
+        data_func, delay = store.async_delay_save.call_args[0]
+        assert delay == SNAPSHOT_SAVE_DELAY
+        assert data_func()["oilprice"]["payload"] == payload
+
+        snapshot.async_update("oilprice", {"price": 111.0})
+
+        assert store.async_delay_save.call_count == 2
+
+    def test_one_pending_save(self) -> None:
+        """Test that changes while a save is pending do not postpone it."""
+        with patch("custom_components.fiftyone.snapshot.Store") as store_class:
+            snapshot = FiftyOneSnapshotStore(MagicMock(), "test_entry")
+        store = store_class.return_value
+
+        snapshot.async_update("aviation", {"weather": {"age": 10}})
+        snapshot.async_update("aviation", {"weather": {"age": 70}})
+
+        store.async_delay_save.assert_called_once()
+        data_func = store.async_delay_save.call_args[0][0]
+        assert data_func()["aviation"]["payload"] == {"weather": {"age": 70}}
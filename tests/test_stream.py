@@ -0,0 +1,94 @@
+"""Tests for the FiftyOne MJPEG frame broadcaster."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.fiftyone.stream import FiftyOneFrameBroadcaster
+
+
+def _frames(*frames: bytes):
+    """Return a fetch function yielding the given frames, then the last one."""
+    remaining = list(frames)
+    calls = 0
+
+    async def _fetch() -> bytes:
+        nonlocal calls
+        calls += 1
+        return remaining.pop(0) if len(remaining) > 1 else remaining[0]
+
+    _fetch.calls = lambda: calls  # type: ignore[attr-defined]
+    return _fetch
+
+
+class TestFiftyOneFrameBroadcaster:
+    """Tests for the frame broadcaster."""
+
+    @pytest.mark.asyncio
+    async def test_one_poller_for_many_viewers(self, hass: MagicMock) -> None:
+        """Test that every viewer gets the frame from a single fetch."""
+        fetch = _frames(b"frame")
+        broadcaster = FiftyOneFrameBroadcaster(hass, "camera.test", fetch, interval=60)
+
+        viewers = [broadcaster.subscribe() for _ in range(3)]
+        frames = await asyncio.gather(*(viewer.get() for viewer in viewers))
+
+        assert frames == [b"frame"] * 3
+        assert fetch.calls() == 1
+        hass.async_create_background_task.assert_called_once()
+        broadcaster.stop()
+
+    @pytest.mark.asyncio
+    async def test_late_viewer_gets_last_frame(self, hass: MagicMock) -> None:
+        """Test that a new viewer starts with the last frame."""
+        broadcaster = FiftyOneFrameBroadcaster(hass, "camera.test", _frames(b"frame"), 60)
+        await broadcaster.subscribe().get()
+
+        late = broadcaster.subscribe()
+
+        assert late.get_nowait() == b"frame"
+        broadcaster.stop()
+
+    @pytest.mark.asyncio
+    async def test_slow_viewer_drops_oldest_frames(self, hass: MagicMock) -> None:
+        """Test that a viewer that falls behind loses its oldest frames."""
+        broadcaster = FiftyOneFrameBroadcaster(
+            hass, "camera.test", _frames(b"1", b"2", b"3", b"4"), interval=0
+        )
+        slow = broadcaster.subscribe()
+
+        while broadcaster.dropped_frames < 2:
+            await asyncio.sleep(0)
+
+        assert [slow.get_nowait(), slow.get_nowait()] == [b"3", b"4"]
+        broadcaster.stop()
+
+    @pytest.mark.asyncio
+    async def test_poller_stops_after_last_viewer(self, hass: MagicMock) -> None:
+        """Test that polling stops when no viewer is left."""
+        fetch = _frames(b"frame")
+        broadcaster = FiftyOneFrameBroadcaster(hass, "camera.test", fetch, interval=0)
+        viewer = broadcaster.subscribe()
+        await viewer.get()
+
+        broadcaster.unsubscribe(viewer)
+        await asyncio.sleep(0)
+
+        assert broadcaster.viewers == 0
+        assert hass.tasks[0].cancelled()
+
+    @pytest.mark.asyncio
+    async def test_stop_ends_viewer_streams(self, hass: MagicMock) -> None:
+        """Test that stopping the broadcaster wakes every viewer with None."""
+        broadcaster = FiftyOneFrameBroadcaster(hass, "camera.test", _frames(b"frame"), 60)
+        viewer = broadcaster.subscribe()
+        assert await viewer.get() == b"frame"
+        waiting = asyncio.ensure_future(viewer.get())
+        await asyncio.sleep(0)
+
+        broadcaster.stop()
+
+        assert await waiting is None
+        assert broadcaster.viewers == 0